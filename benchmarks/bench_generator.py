@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness for the NgRx generator
+Synthesizes OpenAPI specs of increasing size, times every generator phase,
+records peak memory and compares the results against a stored baseline
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ngrx_generator import NgRxGenerator  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# (operations, tags) per named case
+DEFAULT_CASES = {
+    '10': (10, 2),
+    '1k': (1000, 20),
+    '10k': (10000, 200),
+    '50k': (50000, 500),
+}
+
+
+def synthesize_spec(operations: int, tags: int, ref_depth: int) -> Dict[str, Any]:
+    """Build an OpenAPI 3 document with the given operation and tag counts
+
+    Every resource gets a chain of ref_depth schemas (Resource -> ResourceL1 -> ...)
+    so resolution cost grows with the depth.
+    """
+    schemas: Dict[str, Any] = {}
+    paths: Dict[str, Any] = {}
+    resources = max(1, operations // 4)
+
+    for r in range(resources):
+        name = f"Resource{r}"
+        for level in range(ref_depth, -1, -1):
+            schema_name = name if level == 0 else f"{name}L{level}"
+            properties = {
+                'id': {'type': 'string'},
+                'label': {'type': 'string'},
+                'count': {'type': 'integer'},
+                'tags': {'type': 'array', 'items': {'type': 'string'}},
+            }
+            if level < ref_depth:
+                properties['child'] = {'$ref': f"#/components/schemas/{name}L{level + 1}"}
+            schemas[schema_name] = {'type': 'object', 'properties': properties, 'required': ['id']}
+
+    emitted = 0
+    r = 0
+    while emitted < operations:
+        tag = f"tag{r % tags}"
+        name = f"Resource{r % resources}"
+        ref = {'$ref': f"#/components/schemas/{name}"}
+        collection = {
+            'get': {
+                'tags': [tag], 'operationId': f"list{name}_{r}",
+                'parameters': [{'name': 'page', 'in': 'query', 'schema': {'type': 'integer'}}],
+                'responses': {'200': {'description': 'ok', 'content': {'application/json': {
+                    'schema': {'type': 'array', 'items': ref}}}}},
+            },
+            'post': {
+                'tags': [tag], 'operationId': f"create{name}_{r}",
+                'requestBody': {'content': {'application/json': {'schema': ref}}},
+                'responses': {'201': {'description': 'ok', 'content': {'application/json': {'schema': ref}}}},
+            },
+        }
+        item = {
+            'get': {
+                'tags': [tag], 'operationId': f"get{name}ById_{r}",
+                'responses': {'200': {'description': 'ok', 'content': {'application/json': {'schema': ref}}}},
+            },
+            'delete': {
+                'tags': [tag], 'operationId': f"delete{name}_{r}",
+                'responses': {'204': {'description': 'deleted'}},
+            },
+        }
+        for path, path_item in ((f"/r{r}/items", collection), (f"/r{r}/items/{{itemId}}", item)):
+            methods = dict(list(path_item.items())[:operations - emitted])
+            paths[path] = methods
+            emitted += len(methods)
+            if emitted >= operations:
+                break
+        r += 1
+
+    return {
+        'openapi': '3.0.3',
+        'info': {'title': 'Synthetic benchmark API', 'version': '1.0.0'},
+        'servers': [{'url': 'https://api.example.com/v1'}],
+        'paths': paths,
+        'components': {'schemas': schemas},
+    }
+
+
+def write_spec(spec: Dict[str, Any], path: Path):
+    """Write a synthesized spec as YAML or JSON, depending on the extension"""
+    with open(path, 'w') as f:
+        if path.suffix == '.json':
+            json.dump(spec, f)
+        else:
+            yaml.dump(spec, f, Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper), sort_keys=False)
+
+
+def _timed(phases: Dict[str, float], name: str, func, *args, **kwargs):
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    phases[name] = time.perf_counter() - started
+    return result
+
+
+def run_case(spec_path: str, output_dir: str, jobs: int, streaming: bool = False) -> Dict[str, Any]:
+    """Run every generator phase once against spec_path and time each one"""
+    phases: Dict[str, float] = {}
+
+    generator = _timed(phases, 'load', NgRxGenerator, spec_path, output_dir, jobs=jobs, streaming=streaming)
+    if streaming:
+        # Streamed path items are indexed as they are decoded, like generate_all does
+        index = _timed(phases, 'extract_operations',
+                       lambda: generator._build_operation_index(generator._iter_operations()))
+    else:
+        operations = _timed(phases, 'extract_operations', generator._extract_operations)
+        index = _timed(phases, 'build_index', generator._build_operation_index, operations)
+    _timed(phases, 'resolve_schemas', generator.schema_dependencies)
+
+    with generator._worker_pools():
+        _timed(phases, 'generate_models', generator.generate_models)
+        for emitter in ('actions', 'effects', 'reducers', 'selectors', 'services'):
+            _timed(phases, f"generate_{emitter}", getattr(generator, f"generate_{emitter}"), index)
+        _timed(phases, 'generate_index_files', generator.generate_index_files)
+
+    peak_rss_kb = None
+    if resource is not None:
+        peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == 'darwin':
+            peak_rss_kb //= 1024
+
+    return {
+        'operations': len(index),
+        'tags': len(index.tags),
+        'files': len(generator.sink.written) + len(generator.sink.unchanged),
+        'bytes': generator.sink.bytes_written,
+        'phases': phases,
+        'total': sum(phases.values()),
+        'peak_rss_kb': peak_rss_kb,
+    }
+
+
+def run_isolated(spec_path: Path, output_dir: Path, jobs: int, streaming: bool = False) -> Dict[str, Any]:
+    """Run one case in a fresh interpreter so peak memory belongs to that case alone"""
+    command = [sys.executable, __file__, '--run-case', str(spec_path), str(output_dir), '--jobs', str(jobs)]
+    if streaming:
+        command.append('--stream')
+    completed = subprocess.run(command, check=True, capture_output=True, text=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def run_repeated(spec_path: Path, output_dir: Path, jobs: int, streaming: bool, repeat: int) -> Dict[str, Any]:
+    """Run one case repeat times, each into a fresh output directory, keeping the median of
+    every phase, of the total and of the peak RSS"""
+    runs = [
+        run_isolated(spec_path, output_dir.with_name(f"{output_dir.name}-{run}"), jobs, streaming)
+        for run in range(repeat)
+    ]
+    result = dict(runs[0])
+    result['phases'] = {phase: statistics.median(run['phases'][phase] for run in runs) for phase in runs[0]['phases']}
+    result['total'] = statistics.median(run['total'] for run in runs)
+    rss = [run['peak_rss_kb'] for run in runs if run['peak_rss_kb']]
+    result['peak_rss_kb'] = int(statistics.median(rss)) if rss else None
+    result['repeat'] = repeat
+    return result
+
+
+def compare_to_baseline(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float,
+                        min_seconds: float, min_delta: float = 0.0, min_rss_delta_kb: int = 0) -> List[str]:
+    """List phases slower than baseline * (1 + threshold) by at least min_delta seconds,
+    and peak RSS grown by that fraction and at least min_rss_delta_kb"""
+    regressions = []
+    for case, result in results['cases'].items():
+        base_case = baseline.get('cases', {}).get(case)
+        if not base_case:
+            continue
+        for phase, seconds in result['phases'].items():
+            base_seconds = base_case['phases'].get(phase)
+            if base_seconds is None or seconds < min_seconds:
+                continue
+            if seconds > base_seconds * (1 + threshold) and seconds - base_seconds >= min_delta:
+                regressions.append(
+                    f"{case}/{phase}: {seconds * 1000:.1f} ms vs baseline {base_seconds * 1000:.1f} ms "
+                    f"(+{(seconds / base_seconds - 1) * 100:.0f}%)"
+                )
+        base_rss, rss = base_case.get('peak_rss_kb'), result.get('peak_rss_kb')
+        if base_rss and rss and rss > base_rss * (1 + threshold) and rss - base_rss >= min_rss_delta_kb:
+            regressions.append(f"{case}/peak_rss: {rss} KB vs baseline {base_rss} KB")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the NgRx generator on synthetic OpenAPI specs')
+    parser.add_argument('--cases', default=','.join(DEFAULT_CASES),
+                        help=f"Comma-separated cases to run (default: {','.join(DEFAULT_CASES)})")
+    parser.add_argument('--tags', type=int, help='Override the tag count for every case')
+    parser.add_argument('--ref-depth', type=int, default=3, help='Depth of each schema $ref chain (default: 3)')
+    parser.add_argument('--format', choices=['yaml', 'json'], default='yaml', help='Spec format (default: yaml)')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='Worker processes passed to the generator')
+    parser.add_argument('--stream', action='store_true', help='Load specs in streaming mode')
+    parser.add_argument('--output', default='bench_results.json', help='Where to write the JSON results')
+    parser.add_argument('--baseline', help='Baseline JSON to compare against; exits 1 on regression')
+    parser.add_argument('--update-baseline', action='store_true', help='Write the results to --baseline instead')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Runs per case; phases, totals and peak RSS are the median of the runs (default: 5)')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Allowed slowdown per phase as a fraction (default: 0.25)')
+    parser.add_argument('--min-delta-ms', type=float, default=10,
+                        help='A slower phase only counts as a regression when it is also slower by this many '
+                             'milliseconds (default: 10)')
+    parser.add_argument('--min-rss-delta', type=int, default=16, metavar='MB',
+                        help='Peak RSS only regresses when it also grew by this many MB (default: 16)')
+    parser.add_argument('--min-seconds', type=float, default=0.005,
+                        help='Ignore phases faster than this when comparing (default: 0.005)')
+    parser.add_argument('--run-case', nargs=2, metavar=('SPEC', 'OUTPUT'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.update_baseline and not args.baseline:
+        parser.error('--update-baseline requires --baseline')
+    if args.repeat < 1:
+        parser.error('--repeat must be at least 1')
+
+    if args.run_case:
+        print(json.dumps(run_case(args.run_case[0], args.run_case[1], args.jobs, args.stream)))
+        return 0
+
+    results: Dict[str, Any] = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'ref_depth': args.ref_depth,
+        'jobs': args.jobs,
+        'streaming': args.stream,
+        'format': args.format,
+        'repeat': args.repeat,
+        'cases': {},
+    }
+
+    with tempfile.TemporaryDirectory(prefix='ngrx-bench-') as workdir:
+        for case in args.cases.split(','):
+            if case not in DEFAULT_CASES:
+                parser.error(f"unknown case '{case}'")
+            operations, tags = DEFAULT_CASES[case]
+            tags = args.tags or tags
+
+            spec_path = Path(workdir) / f"spec-{case}.{args.format}"
+            write_spec(synthesize_spec(operations, tags, args.ref_depth), spec_path)
+
+            result = run_repeated(spec_path, Path(workdir) / f"out-{case}", args.jobs, args.stream, args.repeat)
+            result['ref_depth'] = args.ref_depth
+            results['cases'][case] = result
+
+            phases = ', '.join(f"{name} {seconds * 1000:.0f}" for name, seconds in result['phases'].items())
+            rss = f", peak {result['peak_rss_kb'] // 1024} MB" if result['peak_rss_kb'] else ''
+            print(f"{case:>4}: {result['total'] * 1000:.0f} ms total{rss} ({phases} ms)")
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.baseline and args.update_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline updated: {args.baseline}")
+    elif args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        for setting in ('python', 'ref_depth', 'jobs', 'streaming', 'format'):
+            if setting in baseline and baseline[setting] != results[setting]:
+                print(f"⚠️  Baseline was recorded with {setting}={baseline[setting]!r}, "
+                      f"this run uses {results[setting]!r}")
+        regressions = compare_to_baseline(results, baseline, args.threshold, args.min_seconds,
+                                          args.min_delta_ms / 1000, args.min_rss_delta * 1024)
+        if regressions:
+            print("❌ Performance regressions:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print("✅ No regressions against baseline")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,25 @@
 import { createAction, props } from '@ngrx/store';
+import { GetordersParams } from '../services/orders.service';
 
 // Orders Actions
 
-export const getOrders = createAction('[Orders] Getorders');
+export const getOrders = createAction(
+  '[Orders] Getorders',
+  props<{ params?: GetordersParams }>()
+);
 export const getOrdersSuccess = createAction(
   '[Orders] Getorders Success',
-  props<{ data: any }>()
+  props<{ data: { orders?: Order[]; pagination?: Pagination } }>()
 );
 export const getOrdersFailure = createAction(
   '[Orders] Getorders Failure',
   props<{ error: any }>()
 );
+export const getOrdersNextPage = createAction('[Orders] Getorders Next Page');
+export const getOrdersPageSuccess = createAction(
+  '[Orders] Getorders Page Success',
+  props<{ data: { orders?: Order[]; pagination?: Pagination } }>()
+);
 
 export const createOrder = createAction(
   '[Orders] Createorder',
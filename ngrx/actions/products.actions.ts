@@ -1,16 +1,25 @@
 import { createAction, props } from '@ngrx/store';
+import { GetproductsParams } from '../services/products.service';
 
 // Products Actions
 
-export const getProducts = createAction('[Products] Getproducts');
+export const getProducts = createAction(
+  '[Products] Getproducts',
+  props<{ params?: GetproductsParams }>()
+);
 export const getProductsSuccess = createAction(
   '[Products] Getproducts Success',
-  props<{ data: any }>()
+  props<{ data: { products?: Product[]; pagination?: Pagination } }>()
 );
 export const getProductsFailure = createAction(
   '[Products] Getproducts Failure',
   props<{ error: any }>()
 );
+export const getProductsNextPage = createAction('[Products] Getproducts Next Page');
+export const getProductsPageSuccess = createAction(
+  '[Products] Getproducts Page Success',
+  props<{ data: { products?: Product[]; pagination?: Pagination } }>()
+);
 
 export const createProduct = createAction(
   '[Products] Createproduct',
@@ -1,16 +1,25 @@
 import { createAction, props } from '@ngrx/store';
+import { GetusersParams } from '../services/users.service';
 
 // Users Actions
 
-export const getUsers = createAction('[Users] Getusers');
+export const getUsers = createAction(
+  '[Users] Getusers',
+  props<{ params?: GetusersParams }>()
+);
 export const getUsersSuccess = createAction(
   '[Users] Getusers Success',
-  props<{ data: any }>()
+  props<{ data: { users?: User[]; pagination?: Pagination } }>()
 );
 export const getUsersFailure = createAction(
   '[Users] Getusers Failure',
   props<{ error: any }>()
 );
+export const getUsersNextPage = createAction('[Users] Getusers Next Page');
+export const getUsersPageSuccess = createAction(
+  '[Users] Getusers Page Success',
+  props<{ data: { users?: User[]; pagination?: Pagination } }>()
+);
 
 export const createUser = createAction(
   '[Users] Createuser',
@@ -1,7 +1,7 @@
 import { Injectable } from '@angular/core';
 import { Actions, createEffect, ofType } from '@ngrx/effects';
 import { of } from 'rxjs';
-import { catchError, map, switchMap } from 'rxjs/operators';
+import { catchError, exhaustMap, map } from 'rxjs/operators';
 import { AuthService } from '../services/auth.service';
 import * as AuthActions from '../actions/auth.actions';
 
@@ -16,7 +16,7 @@ export class AuthEffects {
   login$ = createEffect(() =>
     this.actions$.pipe(
       ofType(AuthActions.login),
-      switchMap((action) =>
+      exhaustMap((action) =>
         this.authService.login(
           action.payload
         ).pipe(
@@ -30,7 +30,7 @@ export class AuthEffects {
   register$ = createEffect(() =>
     this.actions$.pipe(
       ofType(AuthActions.register),
-      switchMap((action) =>
+      exhaustMap((action) =>
         this.authService.register(
           action.payload
         ).pipe(
@@ -44,7 +44,7 @@ export class AuthEffects {
   refreshToken$ = createEffect(() =>
     this.actions$.pipe(
       ofType(AuthActions.refreshToken),
-      switchMap((action) =>
+      exhaustMap((action) =>
         this.authService.refreshToken(
           action.payload
         ).pipe(
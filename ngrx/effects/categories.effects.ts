@@ -1,7 +1,7 @@
 import { Injectable } from '@angular/core';
 import { Actions, createEffect, ofType } from '@ngrx/effects';
 import { of } from 'rxjs';
-import { catchError, map, switchMap } from 'rxjs/operators';
+import { catchError, concatMap, map, switchMap } from 'rxjs/operators';
 import { CategoriesService } from '../services/categories.service';
 import * as CategoriesActions from '../actions/categories.actions';
 
@@ -29,7 +29,7 @@ export class CategoriesEffects {
   createCategory$ = createEffect(() =>
     this.actions$.pipe(
       ofType(CategoriesActions.createCategory),
-      switchMap((action) =>
+      concatMap((action) =>
         this.categoriesService.createCategory(
           action.payload
         ).pipe(
@@ -57,7 +57,7 @@ export class CategoriesEffects {
   updateCategory$ = createEffect(() =>
     this.actions$.pipe(
       ofType(CategoriesActions.updateCategory),
-      switchMap((action) =>
+      concatMap((action) =>
         this.categoriesService.updateCategory(
           action.categoryId, action.payload
         ).pipe(
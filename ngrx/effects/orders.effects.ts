@@ -1,16 +1,19 @@
 import { Injectable } from '@angular/core';
 import { Actions, createEffect, ofType } from '@ngrx/effects';
+import { Store } from '@ngrx/store';
 import { of } from 'rxjs';
-import { catchError, map, switchMap } from 'rxjs/operators';
+import { catchError, concatMap, exhaustMap, filter, map, switchMap, withLatestFrom } from 'rxjs/operators';
 import { OrdersService } from '../services/orders.service';
 import * as OrdersActions from '../actions/orders.actions';
+import { selectOrdersState } from '../selectors/orders.selectors';
 
 @Injectable()
 export class OrdersEffects {
 
   constructor(
     private actions$: Actions,
-    private ordersService: OrdersService
+    private ordersService: OrdersService,
+    private store: Store
   ) {}
 
   getOrders$ = createEffect(() =>
@@ -18,6 +21,7 @@ export class OrdersEffects {
       ofType(OrdersActions.getOrders),
       switchMap((action) =>
         this.ordersService.getOrders(
+          action.params
         ).pipe(
           map((data) => OrdersActions.getOrdersSuccess({ data })),
           catchError((error) => of(OrdersActions.getOrdersFailure({ error })))
@@ -26,10 +30,26 @@ export class OrdersEffects {
     )
   );
 
+  getOrdersNextPage$ = createEffect(() =>
+    this.actions$.pipe(
+      ofType(OrdersActions.getOrdersNextPage),
+      withLatestFrom(this.store.select(selectOrdersState)),
+      filter(([, state]) => state.getOrdersHasMore && state.getOrdersRequest !== null),
+      exhaustMap(([, state]) =>
+        this.ordersService.getOrders(
+          { ...state.getOrdersRequest!.params, page: (state.getOrdersPage ?? 0) + 1 }
+        ).pipe(
+          map((data) => OrdersActions.getOrdersPageSuccess({ data })),
+          catchError((error) => of(OrdersActions.getOrdersFailure({ error })))
+        )
+      )
+    )
+  );
+
   createOrder$ = createEffect(() =>
     this.actions$.pipe(
       ofType(OrdersActions.createOrder),
-      switchMap((action) =>
+      concatMap((action) =>
         this.ordersService.createOrder(
           action.payload
         ).pipe(
@@ -57,7 +77,7 @@ export class OrdersEffects {
   updateOrderStatus$ = createEffect(() =>
     this.actions$.pipe(
       ofType(OrdersActions.updateOrderStatus),
-      switchMap((action) =>
+      concatMap((action) =>
         this.ordersService.updateOrderStatus(
           action.orderId, action.payload
         ).pipe(
@@ -71,7 +91,7 @@ export class OrdersEffects {
   cancelOrder$ = createEffect(() =>
     this.actions$.pipe(
       ofType(OrdersActions.cancelOrder),
-      switchMap((action) =>
+      concatMap((action) =>
         this.ordersService.cancelOrder(
           action.orderId
         ).pipe(
@@ -1,16 +1,19 @@
 import { Injectable } from '@angular/core';
 import { Actions, createEffect, ofType } from '@ngrx/effects';
+import { Store } from '@ngrx/store';
 import { of } from 'rxjs';
-import { catchError, map, switchMap } from 'rxjs/operators';
+import { catchError, concatMap, exhaustMap, filter, map, switchMap, withLatestFrom } from 'rxjs/operators';
 import { ProductsService } from '../services/products.service';
 import * as ProductsActions from '../actions/products.actions';
+import { selectProductsState } from '../selectors/products.selectors';
 
 @Injectable()
 export class ProductsEffects {
 
   constructor(
     private actions$: Actions,
-    private productsService: ProductsService
+    private productsService: ProductsService,
+    private store: Store
   ) {}
 
   getProducts$ = createEffect(() =>
@@ -18,6 +21,7 @@ export class ProductsEffects {
       ofType(ProductsActions.getProducts),
       switchMap((action) =>
         this.productsService.getProducts(
+          action.params
         ).pipe(
           map((data) => ProductsActions.getProductsSuccess({ data })),
           catchError((error) => of(ProductsActions.getProductsFailure({ error })))
@@ -26,10 +30,26 @@ export class ProductsEffects {
     )
   );
 
+  getProductsNextPage$ = createEffect(() =>
+    this.actions$.pipe(
+      ofType(ProductsActions.getProductsNextPage),
+      withLatestFrom(this.store.select(selectProductsState)),
+      filter(([, state]) => state.getProductsHasMore && state.getProductsRequest !== null),
+      exhaustMap(([, state]) =>
+        this.productsService.getProducts(
+          { ...state.getProductsRequest!.params, page: (state.getProductsPage ?? 0) + 1 }
+        ).pipe(
+          map((data) => ProductsActions.getProductsPageSuccess({ data })),
+          catchError((error) => of(ProductsActions.getProductsFailure({ error })))
+        )
+      )
+    )
+  );
+
   createProduct$ = createEffect(() =>
     this.actions$.pipe(
       ofType(ProductsActions.createProduct),
-      switchMap((action) =>
+      concatMap((action) =>
         this.productsService.createProduct(
           action.payload
         ).pipe(
@@ -57,7 +77,7 @@ export class ProductsEffects {
   updateProduct$ = createEffect(() =>
     this.actions$.pipe(
       ofType(ProductsActions.updateProduct),
-      switchMap((action) =>
+      concatMap((action) =>
         this.productsService.updateProduct(
           action.productId, action.payload
         ).pipe(
@@ -71,7 +91,7 @@ export class ProductsEffects {
   deleteProduct$ = createEffect(() =>
     this.actions$.pipe(
       ofType(ProductsActions.deleteProduct),
-      switchMap((action) =>
+      concatMap((action) =>
         this.productsService.deleteProduct(
           action.productId
         ).pipe(
@@ -1,16 +1,19 @@
 import { Injectable } from '@angular/core';
 import { Actions, createEffect, ofType } from '@ngrx/effects';
+import { Store } from '@ngrx/store';
 import { of } from 'rxjs';
-import { catchError, map, switchMap } from 'rxjs/operators';
+import { catchError, concatMap, exhaustMap, filter, map, switchMap, withLatestFrom } from 'rxjs/operators';
 import { UsersService } from '../services/users.service';
 import * as UsersActions from '../actions/users.actions';
+import { selectUsersState } from '../selectors/users.selectors';
 
 @Injectable()
 export class UsersEffects {
 
   constructor(
     private actions$: Actions,
-    private usersService: UsersService
+    private usersService: UsersService,
+    private store: Store
   ) {}
 
   getUsers$ = createEffect(() =>
@@ -18,6 +21,7 @@ export class UsersEffects {
       ofType(UsersActions.getUsers),
       switchMap((action) =>
         this.usersService.getUsers(
+          action.params
         ).pipe(
           map((data) => UsersActions.getUsersSuccess({ data })),
           catchError((error) => of(UsersActions.getUsersFailure({ error })))
@@ -26,10 +30,26 @@ export class UsersEffects {
     )
   );
 
+  getUsersNextPage$ = createEffect(() =>
+    this.actions$.pipe(
+      ofType(UsersActions.getUsersNextPage),
+      withLatestFrom(this.store.select(selectUsersState)),
+      filter(([, state]) => state.getUsersHasMore && state.getUsersRequest !== null),
+      exhaustMap(([, state]) =>
+        this.usersService.getUsers(
+          { ...state.getUsersRequest!.params, page: (state.getUsersPage ?? 0) + 1 }
+        ).pipe(
+          map((data) => UsersActions.getUsersPageSuccess({ data })),
+          catchError((error) => of(UsersActions.getUsersFailure({ error })))
+        )
+      )
+    )
+  );
+
   createUser$ = createEffect(() =>
     this.actions$.pipe(
       ofType(UsersActions.createUser),
-      switchMap((action) =>
+      concatMap((action) =>
         this.usersService.createUser(
           action.payload
         ).pipe(
@@ -57,7 +77,7 @@ export class UsersEffects {
   updateUser$ = createEffect(() =>
     this.actions$.pipe(
       ofType(UsersActions.updateUser),
-      switchMap((action) =>
+      concatMap((action) =>
         this.usersService.updateUser(
           action.userId, action.payload
         ).pipe(
@@ -71,7 +91,7 @@ export class UsersEffects {
   deleteUser$ = createEffect(() =>
     this.actions$.pipe(
       ofType(UsersActions.deleteUser),
-      switchMap((action) =>
+      concatMap((action) =>
         this.usersService.deleteUser(
           action.userId
         ).pipe(
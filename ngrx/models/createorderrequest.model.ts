@@ -1,5 +1,5 @@
 export interface CreateOrderRequest {
-  items: any[];
+  items: { productId: string; quantity: number }[];
   shippingAddress: Address;
   billingAddress?: Address;
   paymentMethod: string;
@@ -6,6 +6,6 @@ export interface UserProfile {
   avatar?: string;
   phone?: string;
   address?: Address;
-  preferences?: any;
+  preferences?: { newsletter?: boolean; notifications?: boolean };
   orderHistory?: OrderSummary[];
 }
\ No newline at end of file
@@ -1,9 +1,15 @@
 import { createReducer, on } from '@ngrx/store';
+import { CallState, initialCallState, loadingCallState, loadedCallState, errorCallState } from './call-state';
 import * as AuthActions from '../actions/auth.actions';
 
 export interface AuthState {
   loading: boolean;
   error: any;
+  callState: {
+    login: CallState;
+    register: CallState;
+    refreshToken: CallState;
+  };
   loginData: AuthResponse | null;
   registerData: AuthResponse | null;
   refreshTokenData: AuthResponse | null;
@@ -12,6 +18,11 @@ export interface AuthState {
 export const initialAuthState: AuthState = {
   loading: false,
   error: null,
+  callState: {
+    login: initialCallState,
+    register: initialCallState,
+    refreshToken: initialCallState,
+  },
   loginData: null,
   registerData: null,
   refreshTokenData: null,
@@ -22,46 +33,55 @@ export const authReducer = createReducer(
   on(AuthActions.login, (state) => ({
     ...state,
     loading: true,
-    error: null
+    error: null,
+    callState: { ...state.callState, login: loadingCallState() }
   })),
   on(AuthActions.loginSuccess, (state, { data }) => ({
     ...state,
     loading: false,
+    callState: { ...state.callState, login: loadedCallState() },
     loginData: data
   })),
   on(AuthActions.loginFailure, (state, { error }) => ({
     ...state,
     loading: false,
-    error
+    error,
+    callState: { ...state.callState, login: errorCallState(error) }
   })),
   on(AuthActions.register, (state) => ({
     ...state,
     loading: true,
-    error: null
+    error: null,
+    callState: { ...state.callState, register: loadingCallState() }
   })),
   on(AuthActions.registerSuccess, (state, { data }) => ({
     ...state,
     loading: false,
+    callState: { ...state.callState, register: loadedCallState() },
     registerData: data
   })),
   on(AuthActions.registerFailure, (state, { error }) => ({
     ...state,
     loading: false,
-    error
+    error,
+    callState: { ...state.callState, register: errorCallState(error) }
   })),
   on(AuthActions.refreshToken, (state) => ({
     ...state,
     loading: true,
-    error: null
+    error: null,
+    callState: { ...state.callState, refreshToken: loadingCallState() }
   })),
   on(AuthActions.refreshTokenSuccess, (state, { data }) => ({
     ...state,
     loading: false,
+    callState: { ...state.callState, refreshToken: loadedCallState() },
     refreshTokenData: data
   })),
   on(AuthActions.refreshTokenFailure, (state, { error }) => ({
     ...state,
     loading: false,
-    error
+    error,
+    callState: { ...state.callState, refreshToken: errorCallState(error) }
   })),
 );
\ No newline at end of file
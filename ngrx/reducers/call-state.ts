@@ -0,0 +1,15 @@
+export type CallStatus = 'idle' | 'loading' | 'loaded' | 'error';
+
+export interface CallState {
+  status: CallStatus;
+  error: any;
+  updatedAt: number | null;
+}
+
+export const initialCallState: CallState = { status: 'idle', error: null, updatedAt: null };
+
+export const loadingCallState = (): CallState => ({ status: 'loading', error: null, updatedAt: Date.now() });
+
+export const loadedCallState = (): CallState => ({ status: 'loaded', error: null, updatedAt: Date.now() });
+
+export const errorCallState = (error: any): CallState => ({ status: 'error', error, updatedAt: Date.now() });
\ No newline at end of file
@@ -1,9 +1,16 @@
 import { createReducer, on } from '@ngrx/store';
+import { CallState, initialCallState, loadingCallState, loadedCallState, errorCallState } from './call-state';
 import * as CategoriesActions from '../actions/categories.actions';
 
 export interface CategoriesState {
   loading: boolean;
   error: any;
+  callState: {
+    getCategories: CallState;
+    createCategory: CallState;
+    getCategoryById: CallState;
+    updateCategory: CallState;
+  };
   getCategoriesData: Category[] | null;
   createCategoryData: Category | null;
   getCategoryByIdData: Category | null;
@@ -13,6 +20,12 @@ export interface CategoriesState {
 export const initialCategoriesState: CategoriesState = {
   loading: false,
   error: null,
+  callState: {
+    getCategories: initialCallState,
+    createCategory: initialCallState,
+    getCategoryById: initialCallState,
+    updateCategory: initialCallState,
+  },
   getCategoriesData: null,
   createCategoryData: null,
   getCategoryByIdData: null,
@@ -24,61 +37,73 @@ export const categoriesReducer = createReducer(
   on(CategoriesActions.getCategories, (state) => ({
     ...state,
     loading: true,
-    error: null
+    error: null,
+    callState: { ...state.callState, getCategories: loadingCallState() }
   })),
   on(CategoriesActions.getCategoriesSuccess, (state, { data }) => ({
     ...state,
     loading: false,
+    callState: { ...state.callState, getCategories: loadedCallState() },
     getCategoriesData: data
   })),
   on(CategoriesActions.getCategoriesFailure, (state, { error }) => ({
     ...state,
     loading: false,
-    error
+    error,
+    callState: { ...state.callState, getCategories: errorCallState(error) }
   })),
   on(CategoriesActions.createCategory, (state) => ({
     ...state,
     loading: true,
-    error: null
+    error: null,
+    callState: { ...state.callState, createCategory: loadingCallState() }
   })),
   on(CategoriesActions.createCategorySuccess, (state, { data }) => ({
     ...state,
     loading: false,
+    callState: { ...state.callState, createCategory: loadedCallState() },
     createCategoryData: data
   })),
   on(CategoriesActions.createCategoryFailure, (state, { error }) => ({
     ...state,
     loading: false,
-    error
+    error,
+    callState: { ...state.callState, createCategory: errorCallState(error) }
   })),
   on(CategoriesActions.getCategoryById, (state) => ({
     ...state,
     loading: true,
-    error: null
+    error: null,
+    callState: { ...state.callState, getCategoryById: loadingCallState() }
   })),
   on(CategoriesActions.getCategoryByIdSuccess, (state, { data }) => ({
     ...state,
     loading: false,
+    callState: { ...state.callState, getCategoryById: loadedCallState() },
     getCategoryByIdData: data
   })),
   on(CategoriesActions.getCategoryByIdFailure, (state, { error }) => ({
     ...state,
     loading: false,
-    error
+    error,
+    callState: { ...state.callState, getCategoryById: errorCallState(error) }
   })),
   on(CategoriesActions.updateCategory, (state) => ({
     ...state,
     loading: true,
-    error: null
+    error: null,
+    callState: { ...state.callState, updateCategory: loadingCallState() }
   })),
   on(CategoriesActions.updateCategorySuccess, (state, { data }) => ({
     ...state,
     loading: false,
+    callState: { ...state.callState, updateCategory: loadedCallState() },
     updateCategoryData: data
   })),
   on(CategoriesActions.updateCategoryFailure, (state, { error }) => ({
     ...state,
     loading: false,
-    error
+    error,
+    callState: { ...state.callState, updateCategory: errorCallState(error) }
   })),
 );
\ No newline at end of file
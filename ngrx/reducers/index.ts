@@ -1,4 +1,5 @@
 export * from './auth.reducer';
+export * from './call-state';
 export * from './categories.reducer';
 export * from './orders.reducer';
 export * from './products.reducer';
@@ -1,101 +1,158 @@
 import { createReducer, on } from '@ngrx/store';
+import { CallState, initialCallState, loadingCallState, loadedCallState, errorCallState } from './call-state';
 import * as OrdersActions from '../actions/orders.actions';
+import { GetordersParams } from '../services/orders.service';
 
 export interface OrdersState {
   loading: boolean;
   error: any;
-  getOrdersData: any | null;
+  callState: {
+    getOrders: CallState;
+    createOrder: CallState;
+    getOrderById: CallState;
+    updateOrderStatus: CallState;
+    cancelOrder: CallState;
+  };
+  getOrdersData: { orders?: Order[]; pagination?: Pagination } | null;
   createOrderData: Order | null;
   getOrderByIdData: Order | null;
   updateOrderStatusData: Order | null;
   cancelOrderData: Order | null;
+  getOrdersRequest: { params?: GetordersParams } | null;
+  getOrdersPage: number | null;
+  getOrdersHasMore: boolean;
 }
 
 export const initialOrdersState: OrdersState = {
   loading: false,
   error: null,
+  callState: {
+    getOrders: initialCallState,
+    createOrder: initialCallState,
+    getOrderById: initialCallState,
+    updateOrderStatus: initialCallState,
+    cancelOrder: initialCallState,
+  },
   getOrdersData: null,
   createOrderData: null,
   getOrderByIdData: null,
   updateOrderStatusData: null,
   cancelOrderData: null,
+  getOrdersRequest: null,
+  getOrdersPage: null,
+  getOrdersHasMore: false,
 };
 
 export const ordersReducer = createReducer(
   initialOrdersState,
-  on(OrdersActions.getOrders, (state) => ({
+  on(OrdersActions.getOrders, (state, { type, ...request }) => ({
     ...state,
     loading: true,
-    error: null
+    error: null,
+    callState: { ...state.callState, getOrders: loadingCallState() },
+    getOrdersRequest: request
   })),
   on(OrdersActions.getOrdersSuccess, (state, { data }) => ({
     ...state,
     loading: false,
-    getOrdersData: data
+    callState: { ...state.callState, getOrders: loadedCallState() },
+    getOrdersData: data,
+    getOrdersPage: data.pagination?.page ?? null,
+    getOrdersHasMore: (data.pagination?.page ?? 0) < (data.pagination?.totalPages ?? 0)
   })),
   on(OrdersActions.getOrdersFailure, (state, { error }) => ({
     ...state,
     loading: false,
-    error
+    error,
+    callState: { ...state.callState, getOrders: errorCallState(error) }
+  })),
+  on(OrdersActions.getOrdersNextPage, (state) => state.getOrdersHasMore ? ({
+    ...state,
+    loading: true,
+    error: null,
+    callState: { ...state.callState, getOrders: loadingCallState() }
+  }) : state),
+  on(OrdersActions.getOrdersPageSuccess, (state, { data }) => ({
+    ...state,
+    loading: false,
+    callState: { ...state.callState, getOrders: loadedCallState() },
+    getOrdersData: {
+      ...data,
+      orders: [...(state.getOrdersData?.orders ?? []), ...(data.orders ?? [])]
+    },
+    getOrdersPage: data.pagination?.page ?? null,
+    getOrdersHasMore: (data.pagination?.page ?? 0) < (data.pagination?.totalPages ?? 0)
   })),
   on(OrdersActions.createOrder, (state) => ({
     ...state,
     loading: true,
-    error: null
+    error: null,
+    callState: { ...state.callState, createOrder: loadingCallState() }
   })),
   on(OrdersActions.createOrderSuccess, (state, { data }) => ({
     ...state,
     loading: false,
+    callState: { ...state.callState, createOrder: loadedCallState() },
     createOrderData: data
   })),
   on(OrdersActions.createOrderFailure, (state, { error }) => ({
     ...state,
     loading: false,
-    error
+    error,
+    callState: { ...state.callState, createOrder: errorCallState(error) }
   })),
   on(OrdersActions.getOrderById, (state) => ({
     ...state,
     loading: true,
-    error: null
+    error: null,
+    callState: { ...state.callState, getOrderById: loadingCallState() }
   })),
   on(OrdersActions.getOrderByIdSuccess, (state, { data }) => ({
     ...state,
     loading: false,
+    callState: { ...state.callState, getOrderById: loadedCallState() },
     getOrderByIdData: data
   })),
   on(OrdersActions.getOrderByIdFailure, (state, { error }) => ({
     ...state,
     loading: false,
-    error
+    error,
+    callState: { ...state.callState, getOrderById: errorCallState(error) }
   })),
   on(OrdersActions.updateOrderStatus, (state) => ({
     ...state,
     loading: true,
-    error: null
+    error: null,
+    callState: { ...state.callState, updateOrderStatus: loadingCallState() }
   })),
   on(OrdersActions.updateOrderStatusSuccess, (state, { data }) => ({
     ...state,
     loading: false,
+    callState: { ...state.callState, updateOrderStatus: loadedCallState() },
     updateOrderStatusData: data
   })),
   on(OrdersActions.updateOrderStatusFailure, (state, { error }) => ({
     ...state,
     loading: false,
-    error
+    error,
+    callState: { ...state.callState, updateOrderStatus: errorCallState(error) }
   })),
   on(OrdersActions.cancelOrder, (state) => ({
     ...state,
     loading: true,
-    error: null
+    error: null,
+    callState: { ...state.callState, cancelOrder: loadingCallState() }
   })),
   on(OrdersActions.cancelOrderSuccess, (state, { data }) => ({
     ...state,
     loading: false,
+    callState: { ...state.callState, cancelOrder: loadedCallState() },
     cancelOrderData: data
   })),
   on(OrdersActions.cancelOrderFailure, (state, { error }) => ({
     ...state,
     loading: false,
-    error
+    error,
+    callState: { ...state.callState, cancelOrder: errorCallState(error) }
   })),
 );
\ No newline at end of file
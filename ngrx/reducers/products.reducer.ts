@@ -1,118 +1,180 @@
 import { createReducer, on } from '@ngrx/store';
+import { CallState, initialCallState, loadingCallState, loadedCallState, errorCallState } from './call-state';
 import * as ProductsActions from '../actions/products.actions';
+import { GetproductsParams } from '../services/products.service';
 
 export interface ProductsState {
   loading: boolean;
   error: any;
-  getProductsData: any | null;
+  callState: {
+    getProducts: CallState;
+    createProduct: CallState;
+    getProductById: CallState;
+    updateProduct: CallState;
+    deleteProduct: CallState;
+    getProductReviews: CallState;
+  };
+  getProductsData: { products?: Product[]; pagination?: Pagination } | null;
   createProductData: Product | null;
   getProductByIdData: Product | null;
   updateProductData: Product | null;
   deleteProductData: any | null;
   getProductReviewsData: Review[] | null;
+  getProductsRequest: { params?: GetproductsParams } | null;
+  getProductsPage: number | null;
+  getProductsHasMore: boolean;
 }
 
 export const initialProductsState: ProductsState = {
   loading: false,
   error: null,
+  callState: {
+    getProducts: initialCallState,
+    createProduct: initialCallState,
+    getProductById: initialCallState,
+    updateProduct: initialCallState,
+    deleteProduct: initialCallState,
+    getProductReviews: initialCallState,
+  },
   getProductsData: null,
   createProductData: null,
   getProductByIdData: null,
   updateProductData: null,
   deleteProductData: null,
   getProductReviewsData: null,
+  getProductsRequest: null,
+  getProductsPage: null,
+  getProductsHasMore: false,
 };
 
 export const productsReducer = createReducer(
   initialProductsState,
-  on(ProductsActions.getProducts, (state) => ({
+  on(ProductsActions.getProducts, (state, { type, ...request }) => ({
     ...state,
     loading: true,
-    error: null
+    error: null,
+    callState: { ...state.callState, getProducts: loadingCallState() },
+    getProductsRequest: request
   })),
   on(ProductsActions.getProductsSuccess, (state, { data }) => ({
     ...state,
     loading: false,
-    getProductsData: data
+    callState: { ...state.callState, getProducts: loadedCallState() },
+    getProductsData: data,
+    getProductsPage: data.pagination?.page ?? null,
+    getProductsHasMore: (data.pagination?.page ?? 0) < (data.pagination?.totalPages ?? 0)
   })),
   on(ProductsActions.getProductsFailure, (state, { error }) => ({
     ...state,
     loading: false,
-    error
+    error,
+    callState: { ...state.callState, getProducts: errorCallState(error) }
+  })),
+  on(ProductsActions.getProductsNextPage, (state) => state.getProductsHasMore ? ({
+    ...state,
+    loading: true,
+    error: null,
+    callState: { ...state.callState, getProducts: loadingCallState() }
+  }) : state),
+  on(ProductsActions.getProductsPageSuccess, (state, { data }) => ({
+    ...state,
+    loading: false,
+    callState: { ...state.callState, getProducts: loadedCallState() },
+    getProductsData: {
+      ...data,
+      products: [...(state.getProductsData?.products ?? []), ...(data.products ?? [])]
+    },
+    getProductsPage: data.pagination?.page ?? null,
+    getProductsHasMore: (data.pagination?.page ?? 0) < (data.pagination?.totalPages ?? 0)
   })),
   on(ProductsActions.createProduct, (state) => ({
     ...state,
     loading: true,
-    error: null
+    error: null,
+    callState: { ...state.callState, createProduct: loadingCallState() }
   })),
   on(ProductsActions.createProductSuccess, (state, { data }) => ({
     ...state,
     loading: false,
+    callState: { ...state.callState, createProduct: loadedCallState() },
     createProductData: data
   })),
   on(ProductsActions.createProductFailure, (state, { error }) => ({
     ...state,
     loading: false,
-    error
+    error,
+    callState: { ...state.callState, createProduct: errorCallState(error) }
   })),
   on(ProductsActions.getProductById, (state) => ({
     ...state,
     loading: true,
-    error: null
+    error: null,
+    callState: { ...state.callState, getProductById: loadingCallState() }
   })),
   on(ProductsActions.getProductByIdSuccess, (state, { data }) => ({
     ...state,
     loading: false,
+    callState: { ...state.callState, getProductById: loadedCallState() },
     getProductByIdData: data
   })),
   on(ProductsActions.getProductByIdFailure, (state, { error }) => ({
     ...state,
     loading: false,
-    error
+    error,
+    callState: { ...state.callState, getProductById: errorCallState(error) }
   })),
   on(ProductsActions.updateProduct, (state) => ({
     ...state,
     loading: true,
-    error: null
+    error: null,
+    callState: { ...state.callState, updateProduct: loadingCallState() }
   })),
   on(ProductsActions.updateProductSuccess, (state, { data }) => ({
     ...state,
     loading: false,
+    callState: { ...state.callState, updateProduct: loadedCallState() },
     updateProductData: data
   })),
   on(ProductsActions.updateProductFailure, (state, { error }) => ({
     ...state,
     loading: false,
-    error
+    error,
+    callState: { ...state.callState, updateProduct: errorCallState(error) }
   })),
   on(ProductsActions.deleteProduct, (state) => ({
     ...state,
     loading: true,
-    error: null
+    error: null,
+    callState: { ...state.callState, deleteProduct: loadingCallState() }
   })),
   on(ProductsActions.deleteProductSuccess, (state, { data }) => ({
     ...state,
     loading: false,
+    callState: { ...state.callState, deleteProduct: loadedCallState() },
     deleteProductData: data
   })),
   on(ProductsActions.deleteProductFailure, (state, { error }) => ({
     ...state,
     loading: false,
-    error
+    error,
+    callState: { ...state.callState, deleteProduct: errorCallState(error) }
   })),
   on(ProductsActions.getProductReviews, (state) => ({
     ...state,
     loading: true,
-    error: null
+    error: null,
+    callState: { ...state.callState, getProductReviews: loadingCallState() }
   })),
   on(ProductsActions.getProductReviewsSuccess, (state, { data }) => ({
     ...state,
     loading: false,
+    callState: { ...state.callState, getProductReviews: loadedCallState() },
     getProductReviewsData: data
   })),
   on(ProductsActions.getProductReviewsFailure, (state, { error }) => ({
     ...state,
     loading: false,
-    error
+    error,
+    callState: { ...state.callState, getProductReviews: errorCallState(error) }
   })),
 );
\ No newline at end of file
@@ -1,118 +1,180 @@
 import { createReducer, on } from '@ngrx/store';
+import { CallState, initialCallState, loadingCallState, loadedCallState, errorCallState } from './call-state';
 import * as UsersActions from '../actions/users.actions';
+import { GetusersParams } from '../services/users.service';
 
 export interface UsersState {
   loading: boolean;
   error: any;
-  getUsersData: any | null;
+  callState: {
+    getUsers: CallState;
+    createUser: CallState;
+    getUserById: CallState;
+    updateUser: CallState;
+    deleteUser: CallState;
+    getUserProfile: CallState;
+  };
+  getUsersData: { users?: User[]; pagination?: Pagination } | null;
   createUserData: User | null;
   getUserByIdData: User | null;
   updateUserData: User | null;
   deleteUserData: any | null;
   getUserProfileData: UserProfile | null;
+  getUsersRequest: { params?: GetusersParams } | null;
+  getUsersPage: number | null;
+  getUsersHasMore: boolean;
 }
 
 export const initialUsersState: UsersState = {
   loading: false,
   error: null,
+  callState: {
+    getUsers: initialCallState,
+    createUser: initialCallState,
+    getUserById: initialCallState,
+    updateUser: initialCallState,
+    deleteUser: initialCallState,
+    getUserProfile: initialCallState,
+  },
   getUsersData: null,
   createUserData: null,
   getUserByIdData: null,
   updateUserData: null,
   deleteUserData: null,
   getUserProfileData: null,
+  getUsersRequest: null,
+  getUsersPage: null,
+  getUsersHasMore: false,
 };
 
 export const usersReducer = createReducer(
   initialUsersState,
-  on(UsersActions.getUsers, (state) => ({
+  on(UsersActions.getUsers, (state, { type, ...request }) => ({
     ...state,
     loading: true,
-    error: null
+    error: null,
+    callState: { ...state.callState, getUsers: loadingCallState() },
+    getUsersRequest: request
   })),
   on(UsersActions.getUsersSuccess, (state, { data }) => ({
     ...state,
     loading: false,
-    getUsersData: data
+    callState: { ...state.callState, getUsers: loadedCallState() },
+    getUsersData: data,
+    getUsersPage: data.pagination?.page ?? null,
+    getUsersHasMore: (data.pagination?.page ?? 0) < (data.pagination?.totalPages ?? 0)
   })),
   on(UsersActions.getUsersFailure, (state, { error }) => ({
     ...state,
     loading: false,
-    error
+    error,
+    callState: { ...state.callState, getUsers: errorCallState(error) }
+  })),
+  on(UsersActions.getUsersNextPage, (state) => state.getUsersHasMore ? ({
+    ...state,
+    loading: true,
+    error: null,
+    callState: { ...state.callState, getUsers: loadingCallState() }
+  }) : state),
+  on(UsersActions.getUsersPageSuccess, (state, { data }) => ({
+    ...state,
+    loading: false,
+    callState: { ...state.callState, getUsers: loadedCallState() },
+    getUsersData: {
+      ...data,
+      users: [...(state.getUsersData?.users ?? []), ...(data.users ?? [])]
+    },
+    getUsersPage: data.pagination?.page ?? null,
+    getUsersHasMore: (data.pagination?.page ?? 0) < (data.pagination?.totalPages ?? 0)
   })),
   on(UsersActions.createUser, (state) => ({
     ...state,
     loading: true,
-    error: null
+    error: null,
+    callState: { ...state.callState, createUser: loadingCallState() }
   })),
   on(UsersActions.createUserSuccess, (state, { data }) => ({
     ...state,
     loading: false,
+    callState: { ...state.callState, createUser: loadedCallState() },
     createUserData: data
   })),
   on(UsersActions.createUserFailure, (state, { error }) => ({
     ...state,
     loading: false,
-    error
+    error,
+    callState: { ...state.callState, createUser: errorCallState(error) }
   })),
   on(UsersActions.getUserById, (state) => ({
     ...state,
     loading: true,
-    error: null
+    error: null,
+    callState: { ...state.callState, getUserById: loadingCallState() }
   })),
   on(UsersActions.getUserByIdSuccess, (state, { data }) => ({
     ...state,
     loading: false,
+    callState: { ...state.callState, getUserById: loadedCallState() },
     getUserByIdData: data
   })),
   on(UsersActions.getUserByIdFailure, (state, { error }) => ({
     ...state,
     loading: false,
-    error
+    error,
+    callState: { ...state.callState, getUserById: errorCallState(error) }
   })),
   on(UsersActions.updateUser, (state) => ({
     ...state,
     loading: true,
-    error: null
+    error: null,
+    callState: { ...state.callState, updateUser: loadingCallState() }
   })),
   on(UsersActions.updateUserSuccess, (state, { data }) => ({
     ...state,
     loading: false,
+    callState: { ...state.callState, updateUser: loadedCallState() },
     updateUserData: data
   })),
   on(UsersActions.updateUserFailure, (state, { error }) => ({
     ...state,
     loading: false,
-    error
+    error,
+    callState: { ...state.callState, updateUser: errorCallState(error) }
   })),
   on(UsersActions.deleteUser, (state) => ({
     ...state,
     loading: true,
-    error: null
+    error: null,
+    callState: { ...state.callState, deleteUser: loadingCallState() }
   })),
   on(UsersActions.deleteUserSuccess, (state, { data }) => ({
     ...state,
     loading: false,
+    callState: { ...state.callState, deleteUser: loadedCallState() },
     deleteUserData: data
   })),
   on(UsersActions.deleteUserFailure, (state, { error }) => ({
     ...state,
     loading: false,
-    error
+    error,
+    callState: { ...state.callState, deleteUser: errorCallState(error) }
   })),
   on(UsersActions.getUserProfile, (state) => ({
     ...state,
     loading: true,
-    error: null
+    error: null,
+    callState: { ...state.callState, getUserProfile: loadingCallState() }
   })),
   on(UsersActions.getUserProfileSuccess, (state, { data }) => ({
     ...state,
     loading: false,
+    callState: { ...state.callState, getUserProfile: loadedCallState() },
     getUserProfileData: data
   })),
   on(UsersActions.getUserProfileFailure, (state, { error }) => ({
     ...state,
     loading: false,
-    error
+    error,
+    callState: { ...state.callState, getUserProfile: errorCallState(error) }
   })),
 );
\ No newline at end of file
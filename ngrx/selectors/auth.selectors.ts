@@ -5,7 +5,7 @@ export const selectAuthState = createFeatureSelector<AuthState>('auth');
 
 export const selectAuthLoading = createSelector(
   selectAuthState,
-  (state: AuthState) => state.loading
+  (state: AuthState) => Object.values(state.callState).some((callState) => callState.status === 'loading')
 );
 
 export const selectAuthError = createSelector(
@@ -13,16 +13,61 @@ export const selectAuthError = createSelector(
   (state: AuthState) => state.error
 );
 
+export const selectLoginCallState = createSelector(
+  selectAuthState,
+  (state: AuthState) => state.callState.login
+);
+
+export const selectLoginLoading = createSelector(
+  selectLoginCallState,
+  (callState) => callState.status === 'loading'
+);
+
+export const selectLoginError = createSelector(
+  selectLoginCallState,
+  (callState) => callState.error
+);
+
 export const selectLoginData = createSelector(
   selectAuthState,
   (state: AuthState) => state.loginData
 );
 
+export const selectRegisterCallState = createSelector(
+  selectAuthState,
+  (state: AuthState) => state.callState.register
+);
+
+export const selectRegisterLoading = createSelector(
+  selectRegisterCallState,
+  (callState) => callState.status === 'loading'
+);
+
+export const selectRegisterError = createSelector(
+  selectRegisterCallState,
+  (callState) => callState.error
+);
+
 export const selectRegisterData = createSelector(
   selectAuthState,
   (state: AuthState) => state.registerData
 );
 
+export const selectRefreshtokenCallState = createSelector(
+  selectAuthState,
+  (state: AuthState) => state.callState.refreshToken
+);
+
+export const selectRefreshtokenLoading = createSelector(
+  selectRefreshtokenCallState,
+  (callState) => callState.status === 'loading'
+);
+
+export const selectRefreshtokenError = createSelector(
+  selectRefreshtokenCallState,
+  (callState) => callState.error
+);
+
 export const selectRefreshtokenData = createSelector(
   selectAuthState,
   (state: AuthState) => state.refreshTokenData
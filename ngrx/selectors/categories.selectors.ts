@@ -5,7 +5,7 @@ export const selectCategoriesState = createFeatureSelector<CategoriesState>('cat
 
 export const selectCategoriesLoading = createSelector(
   selectCategoriesState,
-  (state: CategoriesState) => state.loading
+  (state: CategoriesState) => Object.values(state.callState).some((callState) => callState.status === 'loading')
 );
 
 export const selectCategoriesError = createSelector(
@@ -13,21 +13,81 @@ export const selectCategoriesError = createSelector(
   (state: CategoriesState) => state.error
 );
 
+export const selectGetcategoriesCallState = createSelector(
+  selectCategoriesState,
+  (state: CategoriesState) => state.callState.getCategories
+);
+
+export const selectGetcategoriesLoading = createSelector(
+  selectGetcategoriesCallState,
+  (callState) => callState.status === 'loading'
+);
+
+export const selectGetcategoriesError = createSelector(
+  selectGetcategoriesCallState,
+  (callState) => callState.error
+);
+
 export const selectGetcategoriesData = createSelector(
   selectCategoriesState,
   (state: CategoriesState) => state.getCategoriesData
 );
 
+export const selectCreatecategoryCallState = createSelector(
+  selectCategoriesState,
+  (state: CategoriesState) => state.callState.createCategory
+);
+
+export const selectCreatecategoryLoading = createSelector(
+  selectCreatecategoryCallState,
+  (callState) => callState.status === 'loading'
+);
+
+export const selectCreatecategoryError = createSelector(
+  selectCreatecategoryCallState,
+  (callState) => callState.error
+);
+
 export const selectCreatecategoryData = createSelector(
   selectCategoriesState,
   (state: CategoriesState) => state.createCategoryData
 );
 
+export const selectGetcategorybyidCallState = createSelector(
+  selectCategoriesState,
+  (state: CategoriesState) => state.callState.getCategoryById
+);
+
+export const selectGetcategorybyidLoading = createSelector(
+  selectGetcategorybyidCallState,
+  (callState) => callState.status === 'loading'
+);
+
+export const selectGetcategorybyidError = createSelector(
+  selectGetcategorybyidCallState,
+  (callState) => callState.error
+);
+
 export const selectGetcategorybyidData = createSelector(
   selectCategoriesState,
   (state: CategoriesState) => state.getCategoryByIdData
 );
 
+export const selectUpdatecategoryCallState = createSelector(
+  selectCategoriesState,
+  (state: CategoriesState) => state.callState.updateCategory
+);
+
+export const selectUpdatecategoryLoading = createSelector(
+  selectUpdatecategoryCallState,
+  (callState) => callState.status === 'loading'
+);
+
+export const selectUpdatecategoryError = createSelector(
+  selectUpdatecategoryCallState,
+  (callState) => callState.error
+);
+
 export const selectUpdatecategoryData = createSelector(
   selectCategoriesState,
   (state: CategoriesState) => state.updateCategoryData
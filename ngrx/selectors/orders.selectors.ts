@@ -5,7 +5,7 @@ export const selectOrdersState = createFeatureSelector<OrdersState>('orders');
 
 export const selectOrdersLoading = createSelector(
   selectOrdersState,
-  (state: OrdersState) => state.loading
+  (state: OrdersState) => Object.values(state.callState).some((callState) => callState.status === 'loading')
 );
 
 export const selectOrdersError = createSelector(
@@ -13,26 +13,111 @@ export const selectOrdersError = createSelector(
   (state: OrdersState) => state.error
 );
 
+export const selectGetordersCallState = createSelector(
+  selectOrdersState,
+  (state: OrdersState) => state.callState.getOrders
+);
+
+export const selectGetordersLoading = createSelector(
+  selectGetordersCallState,
+  (callState) => callState.status === 'loading'
+);
+
+export const selectGetordersError = createSelector(
+  selectGetordersCallState,
+  (callState) => callState.error
+);
+
 export const selectGetordersData = createSelector(
   selectOrdersState,
   (state: OrdersState) => state.getOrdersData
 );
 
+export const selectGetordersPage = createSelector(
+  selectOrdersState,
+  (state: OrdersState) => state.getOrdersPage
+);
+
+export const selectGetordersHasMore = createSelector(
+  selectOrdersState,
+  (state: OrdersState) => state.getOrdersHasMore
+);
+
+export const selectCreateorderCallState = createSelector(
+  selectOrdersState,
+  (state: OrdersState) => state.callState.createOrder
+);
+
+export const selectCreateorderLoading = createSelector(
+  selectCreateorderCallState,
+  (callState) => callState.status === 'loading'
+);
+
+export const selectCreateorderError = createSelector(
+  selectCreateorderCallState,
+  (callState) => callState.error
+);
+
 export const selectCreateorderData = createSelector(
   selectOrdersState,
   (state: OrdersState) => state.createOrderData
 );
 
+export const selectGetorderbyidCallState = createSelector(
+  selectOrdersState,
+  (state: OrdersState) => state.callState.getOrderById
+);
+
+export const selectGetorderbyidLoading = createSelector(
+  selectGetorderbyidCallState,
+  (callState) => callState.status === 'loading'
+);
+
+export const selectGetorderbyidError = createSelector(
+  selectGetorderbyidCallState,
+  (callState) => callState.error
+);
+
 export const selectGetorderbyidData = createSelector(
   selectOrdersState,
   (state: OrdersState) => state.getOrderByIdData
 );
 
+export const selectUpdateorderstatusCallState = createSelector(
+  selectOrdersState,
+  (state: OrdersState) => state.callState.updateOrderStatus
+);
+
+export const selectUpdateorderstatusLoading = createSelector(
+  selectUpdateorderstatusCallState,
+  (callState) => callState.status === 'loading'
+);
+
+export const selectUpdateorderstatusError = createSelector(
+  selectUpdateorderstatusCallState,
+  (callState) => callState.error
+);
+
 export const selectUpdateorderstatusData = createSelector(
   selectOrdersState,
   (state: OrdersState) => state.updateOrderStatusData
 );
 
+export const selectCancelorderCallState = createSelector(
+  selectOrdersState,
+  (state: OrdersState) => state.callState.cancelOrder
+);
+
+export const selectCancelorderLoading = createSelector(
+  selectCancelorderCallState,
+  (callState) => callState.status === 'loading'
+);
+
+export const selectCancelorderError = createSelector(
+  selectCancelorderCallState,
+  (callState) => callState.error
+);
+
 export const selectCancelorderData = createSelector(
   selectOrdersState,
   (state: OrdersState) => state.cancelOrderData
@@ -5,7 +5,7 @@ export const selectProductsState = createFeatureSelector<ProductsState>('product
 
 export const selectProductsLoading = createSelector(
   selectProductsState,
-  (state: ProductsState) => state.loading
+  (state: ProductsState) => Object.values(state.callState).some((callState) => callState.status === 'loading')
 );
 
 export const selectProductsError = createSelector(
@@ -13,31 +13,131 @@ export const selectProductsError = createSelector(
   (state: ProductsState) => state.error
 );
 
+export const selectGetproductsCallState = createSelector(
+  selectProductsState,
+  (state: ProductsState) => state.callState.getProducts
+);
+
+export const selectGetproductsLoading = createSelector(
+  selectGetproductsCallState,
+  (callState) => callState.status === 'loading'
+);
+
+export const selectGetproductsError = createSelector(
+  selectGetproductsCallState,
+  (callState) => callState.error
+);
+
 export const selectGetproductsData = createSelector(
   selectProductsState,
   (state: ProductsState) => state.getProductsData
 );
 
+export const selectGetproductsPage = createSelector(
+  selectProductsState,
+  (state: ProductsState) => state.getProductsPage
+);
+
+export const selectGetproductsHasMore = createSelector(
+  selectProductsState,
+  (state: ProductsState) => state.getProductsHasMore
+);
+
+export const selectCreateproductCallState = createSelector(
+  selectProductsState,
+  (state: ProductsState) => state.callState.createProduct
+);
+
+export const selectCreateproductLoading = createSelector(
+  selectCreateproductCallState,
+  (callState) => callState.status === 'loading'
+);
+
+export const selectCreateproductError = createSelector(
+  selectCreateproductCallState,
+  (callState) => callState.error
+);
+
 export const selectCreateproductData = createSelector(
   selectProductsState,
   (state: ProductsState) => state.createProductData
 );
 
+export const selectGetproductbyidCallState = createSelector(
+  selectProductsState,
+  (state: ProductsState) => state.callState.getProductById
+);
+
+export const selectGetproductbyidLoading = createSelector(
+  selectGetproductbyidCallState,
+  (callState) => callState.status === 'loading'
+);
+
+export const selectGetproductbyidError = createSelector(
+  selectGetproductbyidCallState,
+  (callState) => callState.error
+);
+
 export const selectGetproductbyidData = createSelector(
   selectProductsState,
   (state: ProductsState) => state.getProductByIdData
 );
 
+export const selectUpdateproductCallState = createSelector(
+  selectProductsState,
+  (state: ProductsState) => state.callState.updateProduct
+);
+
+export const selectUpdateproductLoading = createSelector(
+  selectUpdateproductCallState,
+  (callState) => callState.status === 'loading'
+);
+
+export const selectUpdateproductError = createSelector(
+  selectUpdateproductCallState,
+  (callState) => callState.error
+);
+
 export const selectUpdateproductData = createSelector(
   selectProductsState,
   (state: ProductsState) => state.updateProductData
 );
 
+export const selectDeleteproductCallState = createSelector(
+  selectProductsState,
+  (state: ProductsState) => state.callState.deleteProduct
+);
+
+export const selectDeleteproductLoading = createSelector(
+  selectDeleteproductCallState,
+  (callState) => callState.status === 'loading'
+);
+
+export const selectDeleteproductError = createSelector(
+  selectDeleteproductCallState,
+  (callState) => callState.error
+);
+
 export const selectDeleteproductData = createSelector(
   selectProductsState,
   (state: ProductsState) => state.deleteProductData
 );
 
+export const selectGetproductreviewsCallState = createSelector(
+  selectProductsState,
+  (state: ProductsState) => state.callState.getProductReviews
+);
+
+export const selectGetproductreviewsLoading = createSelector(
+  selectGetproductreviewsCallState,
+  (callState) => callState.status === 'loading'
+);
+
+export const selectGetproductreviewsError = createSelector(
+  selectGetproductreviewsCallState,
+  (callState) => callState.error
+);
+
 export const selectGetproductreviewsData = createSelector(
   selectProductsState,
   (state: ProductsState) => state.getProductReviewsData
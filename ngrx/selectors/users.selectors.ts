@@ -5,7 +5,7 @@ export const selectUsersState = createFeatureSelector<UsersState>('users');
 
 export const selectUsersLoading = createSelector(
   selectUsersState,
-  (state: UsersState) => state.loading
+  (state: UsersState) => Object.values(state.callState).some((callState) => callState.status === 'loading')
 );
 
 export const selectUsersError = createSelector(
@@ -13,31 +13,131 @@ export const selectUsersError = createSelector(
   (state: UsersState) => state.error
 );
 
+export const selectGetusersCallState = createSelector(
+  selectUsersState,
+  (state: UsersState) => state.callState.getUsers
+);
+
+export const selectGetusersLoading = createSelector(
+  selectGetusersCallState,
+  (callState) => callState.status === 'loading'
+);
+
+export const selectGetusersError = createSelector(
+  selectGetusersCallState,
+  (callState) => callState.error
+);
+
 export const selectGetusersData = createSelector(
   selectUsersState,
   (state: UsersState) => state.getUsersData
 );
 
+export const selectGetusersPage = createSelector(
+  selectUsersState,
+  (state: UsersState) => state.getUsersPage
+);
+
+export const selectGetusersHasMore = createSelector(
+  selectUsersState,
+  (state: UsersState) => state.getUsersHasMore
+);
+
+export const selectCreateuserCallState = createSelector(
+  selectUsersState,
+  (state: UsersState) => state.callState.createUser
+);
+
+export const selectCreateuserLoading = createSelector(
+  selectCreateuserCallState,
+  (callState) => callState.status === 'loading'
+);
+
+export const selectCreateuserError = createSelector(
+  selectCreateuserCallState,
+  (callState) => callState.error
+);
+
 export const selectCreateuserData = createSelector(
   selectUsersState,
   (state: UsersState) => state.createUserData
 );
 
+export const selectGetuserbyidCallState = createSelector(
+  selectUsersState,
+  (state: UsersState) => state.callState.getUserById
+);
+
+export const selectGetuserbyidLoading = createSelector(
+  selectGetuserbyidCallState,
+  (callState) => callState.status === 'loading'
+);
+
+export const selectGetuserbyidError = createSelector(
+  selectGetuserbyidCallState,
+  (callState) => callState.error
+);
+
 export const selectGetuserbyidData = createSelector(
   selectUsersState,
   (state: UsersState) => state.getUserByIdData
 );
 
+export const selectUpdateuserCallState = createSelector(
+  selectUsersState,
+  (state: UsersState) => state.callState.updateUser
+);
+
+export const selectUpdateuserLoading = createSelector(
+  selectUpdateuserCallState,
+  (callState) => callState.status === 'loading'
+);
+
+export const selectUpdateuserError = createSelector(
+  selectUpdateuserCallState,
+  (callState) => callState.error
+);
+
 export const selectUpdateuserData = createSelector(
   selectUsersState,
   (state: UsersState) => state.updateUserData
 );
 
+export const selectDeleteuserCallState = createSelector(
+  selectUsersState,
+  (state: UsersState) => state.callState.deleteUser
+);
+
+export const selectDeleteuserLoading = createSelector(
+  selectDeleteuserCallState,
+  (callState) => callState.status === 'loading'
+);
+
+export const selectDeleteuserError = createSelector(
+  selectDeleteuserCallState,
+  (callState) => callState.error
+);
+
 export const selectDeleteuserData = createSelector(
   selectUsersState,
   (state: UsersState) => state.deleteUserData
 );
 
+export const selectGetuserprofileCallState = createSelector(
+  selectUsersState,
+  (state: UsersState) => state.callState.getUserProfile
+);
+
+export const selectGetuserprofileLoading = createSelector(
+  selectGetuserprofileCallState,
+  (callState) => callState.status === 'loading'
+);
+
+export const selectGetuserprofileError = createSelector(
+  selectGetuserprofileCallState,
+  (callState) => callState.error
+);
+
 export const selectGetuserprofileData = createSelector(
   selectUsersState,
   (state: UsersState) => state.getUserProfileData
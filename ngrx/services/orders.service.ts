@@ -1,7 +1,23 @@
 import { Injectable } from '@angular/core';
-import { HttpClient } from '@angular/common/http';
+import { HttpClient, HttpParams } from '@angular/common/http';
 import { Observable } from 'rxjs';
 
+export interface GetordersParams {
+  status?: string;
+  page?: number;
+}
+
+export function buildGetordersParams(params: GetordersParams): HttpParams {
+  let httpParams = new HttpParams();
+  if (params.status != null) {
+    httpParams = httpParams.set('status', String(params.status));
+  }
+  if (params.page != null) {
+    httpParams = httpParams.set('page', String(params.page));
+  }
+  return httpParams;
+}
+
 @Injectable({
   providedIn: 'root'
 })
@@ -10,8 +26,9 @@ export class OrdersService {
 
   constructor(private http: HttpClient) {}
 
-  getOrders(): Observable<any> {
-    return this.http.get<any>(`${this.baseUrl}/orders`);
+  getOrders(params: GetordersParams = {}): Observable<{ orders?: Order[]; pagination?: Pagination }> {
+    const httpParams = buildGetordersParams(params);
+    return this.http.get<{ orders?: Order[]; pagination?: Pagination }>(`${this.baseUrl}/orders`, { params: httpParams });
   }
 
   createOrder(payload: any): Observable<Order> {
@@ -1,7 +1,31 @@
 import { Injectable } from '@angular/core';
-import { HttpClient } from '@angular/common/http';
+import { HttpClient, HttpParams } from '@angular/common/http';
 import { Observable } from 'rxjs';
 
+export interface GetproductsParams {
+  category?: string;
+  minPrice?: number;
+  maxPrice?: number;
+  page?: number;
+}
+
+export function buildGetproductsParams(params: GetproductsParams): HttpParams {
+  let httpParams = new HttpParams();
+  if (params.category != null) {
+    httpParams = httpParams.set('category', String(params.category));
+  }
+  if (params.minPrice != null) {
+    httpParams = httpParams.set('minPrice', String(params.minPrice));
+  }
+  if (params.maxPrice != null) {
+    httpParams = httpParams.set('maxPrice', String(params.maxPrice));
+  }
+  if (params.page != null) {
+    httpParams = httpParams.set('page', String(params.page));
+  }
+  return httpParams;
+}
+
 @Injectable({
   providedIn: 'root'
 })
@@ -10,8 +34,9 @@ export class ProductsService {
 
   constructor(private http: HttpClient) {}
 
-  getProducts(): Observable<any> {
-    return this.http.get<any>(`${this.baseUrl}/products`);
+  getProducts(params: GetproductsParams = {}): Observable<{ products?: Product[]; pagination?: Pagination }> {
+    const httpParams = buildGetproductsParams(params);
+    return this.http.get<{ products?: Product[]; pagination?: Pagination }>(`${this.baseUrl}/products`, { params: httpParams });
   }
 
   createProduct(payload: any): Observable<Product> {
@@ -1,7 +1,23 @@
 import { Injectable } from '@angular/core';
-import { HttpClient } from '@angular/common/http';
+import { HttpClient, HttpParams } from '@angular/common/http';
 import { Observable } from 'rxjs';
 
+export interface GetusersParams {
+  page?: number;
+  limit?: number;
+}
+
+export function buildGetusersParams(params: GetusersParams): HttpParams {
+  let httpParams = new HttpParams();
+  if (params.page != null) {
+    httpParams = httpParams.set('page', String(params.page));
+  }
+  if (params.limit != null) {
+    httpParams = httpParams.set('limit', String(params.limit));
+  }
+  return httpParams;
+}
+
 @Injectable({
   providedIn: 'root'
 })
@@ -10,8 +26,9 @@ export class UsersService {
 
   constructor(private http: HttpClient) {}
 
-  getUsers(): Observable<any> {
-    return this.http.get<any>(`${this.baseUrl}/users`);
+  getUsers(params: GetusersParams = {}): Observable<{ users?: User[]; pagination?: Pagination }> {
+    const httpParams = buildGetusersParams(params);
+    return this.http.get<{ users?: User[]; pagination?: Pagination }>(`${this.baseUrl}/users`, { params: httpParams });
   }
 
   createUser(payload: any): Observable<User> {
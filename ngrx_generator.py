@@ -4,29 +4,1653 @@ NgRx Generator from Swagger/OpenAPI
 Generates NgRx store files (actions, effects, reducers, selectors, services) from Swagger/OpenAPI specification
 """
 
+import io
 import json
 import yaml
 import os
+import hashlib
+import hmac
+import pickle
+import time
 import argparse
-from typing import Dict, List, Any, Optional
+import threading
+import queue
+import socket
+import socketserver
+import tempfile
+import secrets
+import cProfile
+import pstats
+import tracemalloc
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from itertools import chain, islice, repeat
+from typing import Dict, List, Any, Optional, Tuple, Union, Callable, Iterable, Iterator, BinaryIO
 from pathlib import Path
+from types import CodeType, MappingProxyType
 import re
+import builtins
+import marshal
+import symtable
+import sys
+from urllib.parse import unquote
+
+try:
+    import orjson
+except ImportError:  # optional, speeds up large JSON specs
+    orjson = None
+
+
+# libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Parsed specs and compiled templates load as code, so they live outside the
+# output tree, in a per-user directory only its owner can write to
+USER_CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                              'ngrx-generator')
+
+# Stands in for the file name of specs passed as a dict, bytes or stream
+MEMORY_SPEC_NAME = '<memory>'
+
+
+def parse_spec_bytes(data: bytes, filename: str) -> Tuple[Any, str]:
+    """Parse raw spec bytes, returning the document and the parser used"""
+    if filename.endswith('.json'):
+        if orjson is not None:
+            return orjson.loads(data), 'orjson'
+        return json.loads(data), 'json'
+    parser = 'libyaml' if YAML_LOADER is not yaml.SafeLoader else 'PyYAML'
+    return yaml.load(data, Loader=YAML_LOADER), parser
+
+
+def parse_spec_input(spec: Any) -> Tuple[Any, str]:
+    """Parse an in-memory spec: an already-parsed document, raw bytes or a binary/text stream
+    
+    Returns the document and where it came from ('memory' or the parser name).
+    """
+    if isinstance(spec, dict):
+        return spec, 'memory'
+    if hasattr(spec, 'read'):
+        spec = spec.read()
+    if isinstance(spec, str):
+        spec = spec.encode('utf-8')
+    if not isinstance(spec, (bytes, bytearray, memoryview)):
+        raise TypeError(f"Unsupported spec input of type {type(spec).__name__}")
+    data = bytes(spec)
+    # JSON documents start with an object; anything else goes to the YAML parser
+    return parse_spec_bytes(data, 'spec.json' if data.lstrip()[:1] == b'{' else 'spec.yaml')
+
+
+def _cache_stem(path: str) -> str:
+    """Cache file prefix of a spec: its name plus a hash of where it lives, so
+    same-named specs of different projects keep separate entries in the shared cache"""
+    location = hashlib.sha256(os.path.abspath(path).encode()).hexdigest()[:8]
+    return f"{Path(path).name}-{location}"
+
+
+def load_spec_file(path: str, cache_dir: Optional[Path] = None) -> Tuple[Any, str]:
+    """Load a spec file, reusing a pickled parse keyed by the file's content hash
+    
+    Returns the document and where it came from ('cache' or the parser name).
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    
+    if cache_dir is None:
+        return parse_spec_bytes(data, path)
+    
+    stem = _cache_stem(path)
+    cache_file = cache_dir / f"{stem}-{hashlib.sha256(data).hexdigest()[:32]}.pickle"
+    try:
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f), 'cache'
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+    
+    document, parser = parse_spec_bytes(data, path)
+    
+    # Replace any stale cache entry for this spec
+    cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    for stale in cache_dir.glob(f"{stem}-*.pickle"):
+        stale.unlink()
+    temp_file = cache_file.with_suffix('.tmp')
+    with open(temp_file, 'wb') as f:
+        pickle.dump(document, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_file, cache_file)
+    
+    return document, parser
+
+
+# YAML anchors (&name) and aliases (*name), which can tie a path item to the ones around it
+YAML_ANCHOR_PATTERN = re.compile(r'(?:^|[\s\[{,:-])([&*])([^\s\[\]{},]+)')
+# A $ref into another file; path items with one can add or drop external schemas
+EXTERNAL_REF_PATTERN = re.compile(r'\$ref[\'"]?\s*:(?!\s*[\'"]?#)')
+
+
+def _path_item_starts(text: str) -> Optional[Tuple[List[int], int]]:
+    """Lines that start each entry of a block-style YAML spec's top-level paths, ending with
+    the line after the section, plus the entries' indentation; None for other layouts"""
+    header = re.search(r'^paths:[ \t]*(?:#.*)?\r?$', text, re.MULTILINE)
+    if header is None:
+        return None
+    # Entries and the section's end are the first lines, at their indentation, that are not blank or comments
+    first = re.compile(r'^( *)(?=[^\s#])', re.MULTILINE).search(text, header.end())
+    if first is None or not first.group(1):
+        return None
+    indent = len(first.group(1))
+    end = re.compile(r'^(?=[^\s#])', re.MULTILINE).search(text, header.end())
+    end = end.start() if end else len(text)
+    
+    starts: List[int] = []
+    line, offset = text.count('\n', 0, header.end()), header.end()
+    for entry in re.compile(r'^ {%d}(?=[^\s#])' % indent, re.MULTILINE).finditer(text, offset, end):
+        line += text.count('\n', offset, entry.start())
+        offset = entry.start()
+        starts.append(line)
+    return starts + [line + text.count('\n', offset, end)], indent
+
+
+def _shared_lines(a: List[str], b: List[str]) -> int:
+    """Number of leading lines a and b have in common"""
+    shared, shortest = 0, min(len(a), len(b))
+    # Whole blocks compare in C; only the block holding the first difference is walked
+    while shared + 256 <= shortest and a[shared:shared + 256] == b[shared:shared + 256]:
+        shared += 256
+    while shared < shortest and a[shared] == b[shared]:
+        shared += 1
+    return shared
+
+
+def _anchors_escape(entries: str, spec: str) -> Tuple[bool, bool]:
+    """Whether entries alias an anchor defined before them, and whether text after them aliases one of theirs"""
+    anchors, aliases = set(), set()
+    for kind, name in YAML_ANCHOR_PATTERN.findall(entries):
+        (anchors if kind == '&' else aliases).add(name)
+    
+    def uses(name: str, text: str) -> int:
+        return len(re.findall(r'\*' + re.escape(name) + r'(?![^\s\[\]{},])', text))
+    
+    return not aliases <= anchors, any(uses(name, spec) != uses(name, entries) for name in anchors)
+
+
+def patch_path_items(document: Any, old: bytes, new: bytes) -> Optional[set]:
+    """Apply an edit of a YAML spec to its parsed document by re-parsing only the path items it touched
+    
+    old must be the text document was parsed from. Returns the paths whose
+    items were added, removed or changed, or None when the edit reaches
+    outside the top-level paths or into path items that reference other
+    files (the caller then re-parses the file).
+    """
+    paths = document.get('paths') if isinstance(document, dict) else None
+    if not isinstance(paths, dict):
+        return None
+    try:
+        old_text, new_text = old.decode('utf-8'), new.decode('utf-8')
+    except UnicodeDecodeError:
+        return None
+    old_lines, new_lines = old_text.split('\n'), new_text.split('\n')
+    old_layout, new_layout = _path_item_starts(old_text), _path_item_starts(new_text)
+    if old_layout is None or new_layout is None or old_layout[1] != new_layout[1]:
+        return None
+    (old_starts, indent), (new_starts, _) = old_layout, new_layout
+    # Each entry must be one key, so entries map to positions in paths
+    if len(old_starts) - 1 != len(paths):
+        return None
+    
+    # The edit lies between the lines both texts share at either end
+    prefix = _shared_lines(old_lines, new_lines)
+    if prefix == len(old_lines) == len(new_lines):
+        return set()
+    suffix = min(_shared_lines(old_lines[::-1], new_lines[::-1]), min(len(old_lines), len(new_lines)) - prefix)
+    
+    # Widen it to whole entries. Shared lines before the edit start the same entries
+    # in both texts, and shared lines after it end the same entries, counted from the end.
+    start = max((line for line in set(old_starts[:-1]) & set(new_starts[:-1]) if line <= prefix), default=None)
+    tail = min(
+        len(lines) - next((line for line in starts if line >= len(lines) - suffix), len(lines) + 1)
+        for lines, starts in ((old_lines, old_starts), (new_lines, new_starts))
+    )
+    if start is None or tail < 0 or len(old_lines) - tail not in old_starts or len(new_lines) - tail not in new_starts:
+        return None
+    first = old_starts.index(start)
+    ends = [old_starts.index(len(old_lines) - tail), new_starts.index(len(new_lines) - tail)]
+    
+    # Then over neighbouring entries until the edited ones share no anchors with the rest
+    texts = (old_text, new_text)
+    while True:
+        entries = [
+            '\n'.join(line[min(indent, len(line) - len(line.lstrip(' '))):] for line in lines[starts[first]:starts[end]])
+            for lines, starts, end in ((old_lines, old_starts, ends[0]), (new_lines, new_starts, ends[1]))
+        ]
+        before, after = map(any, zip(*(_anchors_escape(text, spec) for text, spec in zip(entries, texts))))
+        if not (before or after):
+            break
+        if before:
+            if first == 0:
+                return None
+            first -= 1
+        if after:
+            if ends[0] == len(old_starts) - 1:
+                return None
+            ends = [ends[0] + 1, ends[1] + 1]
+    
+    if any(EXTERNAL_REF_PATTERN.search(text) for text in entries):
+        return None
+    try:
+        removed, added = (yaml.load(text, Loader=YAML_LOADER) or {} for text in entries)
+    except yaml.YAMLError:
+        return None
+    if not isinstance(removed, dict) or not isinstance(added, dict):
+        return None
+    keys = list(paths)
+    if keys[first:first + len(removed)] != list(removed):
+        return None
+    kept = keys[:first] + keys[first + len(removed):]
+    if set(added) & set(kept):
+        return None
+    
+    items = [(key, paths[key]) for key in keys[:first]]
+    items += added.items()
+    items += [(key, paths[key]) for key in keys[first + len(removed):]]
+    paths.clear()
+    paths.update(items)
+    return {key for key in removed.keys() | added.keys() if removed.get(key) != added.get(key)}
+
+
+# Top-level sections (and every components/<section>) of a streamed spec that load entry by entry
+STREAMED_SECTIONS = ('paths', 'definitions', 'parameters', 'responses')
+STREAM_SUFFIX = '.stream'
+# Entries of each streamed section kept decoded, and models rendered per batch
+STREAM_LRU_SIZE = 256
+STREAM_CHUNK_SIZE = 500
+
+
+class SpecFragments:
+    """Pickled spec entries, read back by (offset, length) from a file or an in-memory buffer"""
+    
+    def __init__(self, path: Optional[Path] = None, data: Optional[bytes] = None):
+        self.path = path
+        self.data = data
+        self._file = None
+        self._lock = threading.Lock()
+    
+    def __getstate__(self):
+        # Other processes reopen the file; in-memory fragments travel as bytes
+        return {'path': self.path, 'data': self.data}
+    
+    def __setstate__(self, state):
+        self.__init__(state['path'], state['data'])
+    
+    def read(self, offset: int, length: int) -> Any:
+        if self.data is not None:
+            return pickle.loads(memoryview(self.data)[offset:offset + length])
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'rb')
+            self._file.seek(offset)
+            data = self._file.read(length)
+        return pickle.loads(data)
+
+
+class LazySection(Mapping):
+    """A streamed spec section: entries are unpickled on access, the most recent ones kept decoded"""
+    
+    def __init__(self, fragments: SpecFragments, table: Dict[Any, Tuple[int, int]]):
+        self.fragments = fragments
+        self.table = table
+        self._recent: OrderedDict = OrderedDict()
+    
+    def __getstate__(self):
+        return {'fragments': self.fragments, 'table': self.table}
+    
+    def __setstate__(self, state):
+        self.__init__(state['fragments'], state['table'])
+    
+    def __getitem__(self, key):
+        if key in self._recent:
+            self._recent.move_to_end(key)
+            return self._recent[key]
+        value = self.fragments.read(*self.table[key])
+        self._recent[key] = value
+        if len(self._recent) > STREAM_LRU_SIZE:
+            self._recent.popitem(last=False)
+        return value
+    
+    def __contains__(self, key) -> bool:
+        return key in self.table
+    
+    def __iter__(self):
+        return iter(self.table)
+    
+    def __len__(self) -> int:
+        return len(self.table)
+
+
+def _compose_event_node(loader: Any, anchors: Dict[str, yaml.Node]) -> yaml.Node:
+    """Compose the next node from parser events; the C parser only composes whole documents"""
+    event = loader.get_event()
+    if isinstance(event, yaml.AliasEvent):
+        if event.anchor not in anchors:
+            raise yaml.composer.ComposerError(None, None, f"found undefined alias {event.anchor!r}", event.start_mark)
+        return anchors[event.anchor]
+    
+    if isinstance(event, yaml.ScalarEvent):
+        tag = event.tag
+        if tag is None or tag == '!':
+            tag = loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+        node = yaml.ScalarNode(tag, event.value, event.start_mark, event.end_mark, style=event.style)
+    elif isinstance(event, yaml.SequenceStartEvent):
+        tag = event.tag
+        if tag is None or tag == '!':
+            tag = loader.resolve(yaml.SequenceNode, None, event.implicit)
+        node = yaml.SequenceNode(tag, [], event.start_mark, None, flow_style=event.flow_style)
+        while not loader.check_event(yaml.SequenceEndEvent):
+            node.value.append(_compose_event_node(loader, anchors))
+        node.end_mark = loader.get_event().end_mark
+    else:
+        tag = event.tag
+        if tag is None or tag == '!':
+            tag = loader.resolve(yaml.MappingNode, None, event.implicit)
+        node = yaml.MappingNode(tag, [], event.start_mark, None, flow_style=event.flow_style)
+        while not loader.check_event(yaml.MappingEndEvent):
+            key = _compose_event_node(loader, anchors)
+            node.value.append((key, _compose_event_node(loader, anchors)))
+        node.end_mark = loader.get_event().end_mark
+    
+    if event.anchor is not None:
+        anchors[event.anchor] = node
+    return node
+
+
+def _stream_spec(stream: Any, name: str, out: BinaryIO) -> Tuple[Dict[str, Any], List[Tuple[tuple, Dict]]]:
+    """Parse a spec, pickling every entry of a streamed section into out as soon as it is composed
+    
+    Returns the rest of the document plus (key path, entry -> (offset, length))
+    for each streamed section. JSON is parsed as the YAML it is a subset of.
+    """
+    loader = YAML_LOADER(stream)
+    anchors: Dict[str, yaml.Node] = {}
+    
+    def load() -> Any:
+        return loader.construct_document(_compose_event_node(loader, anchors))
+    
+    def spill_section() -> Dict[Any, Tuple[int, int]]:
+        table = {}
+        loader.get_event()
+        while not loader.check_event(yaml.MappingEndEvent):
+            key = load()
+            data = pickle.dumps(load(), protocol=pickle.HIGHEST_PROTOCOL)
+            table[key] = (out.tell(), len(data))
+            out.write(data)
+        loader.get_event()
+        return table
+    
+    try:
+        loader.get_event()
+        if loader.check_event(yaml.StreamEndEvent):
+            raise ValueError(f"Spec '{name}' is empty")
+        loader.get_event()
+        if not loader.check_event(yaml.MappingStartEvent):
+            raise ValueError(f"Spec '{name}' is not a mapping")
+        loader.get_event()
+        
+        document: Dict[str, Any] = {}
+        sections: List[Tuple[tuple, Dict]] = []
+        while not loader.check_event(yaml.MappingEndEvent):
+            key = load()
+            if key in STREAMED_SECTIONS and loader.check_event(yaml.MappingStartEvent):
+                sections.append(((key,), spill_section()))
+            elif key == 'components' and loader.check_event(yaml.MappingStartEvent):
+                components = document[key] = {}
+                loader.get_event()
+                while not loader.check_event(yaml.MappingEndEvent):
+                    section = load()
+                    if loader.check_event(yaml.MappingStartEvent):
+                        sections.append(((key, section), spill_section()))
+                    else:
+                        components[section] = load()
+                loader.get_event()
+            else:
+                document[key] = load()
+    finally:
+        loader.dispose()
+    return document, sections
+
+
+def _assemble_streamed_spec(document: Dict[str, Any], sections: List[Tuple[tuple, Dict]],
+                            fragments: SpecFragments) -> Dict[str, Any]:
+    """Put a LazySection at the key path of every streamed section"""
+    for keys, table in sections:
+        parent = document
+        for key in keys[:-1]:
+            parent = parent.setdefault(key, {})
+        parent[keys[-1]] = LazySection(fragments, table)
+    return document
+
+
+def _stream_to_memory(stream: Any, name: str) -> Dict[str, Any]:
+    """Stream a spec, keeping its fragments in an in-memory buffer"""
+    out = io.BytesIO()
+    document, sections = _stream_spec(stream, name, out)
+    return _assemble_streamed_spec(document, sections, SpecFragments(data=out.getvalue()))
+
+
+def stream_spec_input(spec: Union[bytes, BinaryIO]) -> Tuple[Dict[str, Any], str]:
+    """Stream an in-memory spec (raw bytes or a stream), keeping its fragments in memory"""
+    if isinstance(spec, (bytes, bytearray, memoryview)):
+        spec = io.BytesIO(bytes(spec))
+    return _stream_to_memory(spec, MEMORY_SPEC_NAME), 'stream'
+
+
+def stream_spec_file(path: str, cache_dir: Optional[Path] = None) -> Tuple[Dict[str, Any], str]:
+    """Load a spec file one section entry at a time, so only the entries in use are ever decoded
+    
+    With a cache_dir the fragments live in a file keyed by the spec's content
+    hash and are reused by later runs; otherwise they are kept in memory.
+    Returns the document and where it came from ('cache' or 'stream').
+    """
+    if cache_dir is None:
+        with open(path, 'rb') as f:
+            return _stream_to_memory(f, path), 'stream'
+    
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    stem = _cache_stem(path)
+    cache_file = cache_dir / f"{stem}-{digest.hexdigest()[:32]}{STREAM_SUFFIX}"
+    
+    # Layout: fragments, then the pickled (document, sections) footer, then the footer's offset
+    try:
+        with open(cache_file, 'rb') as f:
+            f.seek(-8, os.SEEK_END)
+            f.seek(int.from_bytes(f.read(8), 'little'))
+            document, sections = pickle.load(f)
+        return _assemble_streamed_spec(document, sections, SpecFragments(cache_file)), 'cache'
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        pass
+    
+    cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    for stale in cache_dir.glob(f"{stem}-*{STREAM_SUFFIX}"):
+        try:
+            stale.unlink()
+        except OSError:  # still open elsewhere on Windows
+            pass
+    temp_file = cache_file.with_name(cache_file.name + '.tmp')
+    with open(path, 'rb') as f, open(temp_file, 'wb') as out:
+        document, sections = _stream_spec(f, path, out)
+        footer = out.tell()
+        pickle.dump((document, sections), out, protocol=pickle.HIGHEST_PROTOCOL)
+        out.write(footer.to_bytes(8, 'little'))
+    os.replace(temp_file, cache_file)
+    
+    return _assemble_streamed_spec(document, sections, SpecFragments(cache_file)), 'stream'
+
+
+def _unescape_pointer_token(token: str) -> str:
+    """Decode one JSON pointer segment"""
+    return unquote(token).replace('~1', '/').replace('~0', '~')
+
+
+# Pointer tokens that lead into a schema rather than to a named one
+SCHEMA_KEYWORDS = frozenset(('properties', 'items', 'additionalProperties', 'allOf', 'oneOf', 'anyOf', 'not'))
+
+
+class RefResolver:
+    """Resolve $ref pointers across the root spec and sibling files
+    
+    Every target is resolved once and memoized; chains of $ref-only nodes are
+    followed with cycle detection. Named schemas that live in other files are
+    collected in external_schemas so they can be emitted as models.
+    """
+    
+    def __init__(self, document: Any, root_path: Optional[str] = None, cache_dir: Optional[Path] = None):
+        self.root_path = os.path.abspath(root_path) if root_path else ''
+        self.cache_dir = cache_dir
+        self.documents: Dict[str, Any] = {self.root_path: document}
+        self.external_schemas: Dict[str, Tuple[str, Any]] = {}
+        self._targets: Dict[Tuple[str, str], Tuple[str, Any]] = {}
+        self._names: Dict[Tuple[str, str], Optional[str]] = {}
+    
+    def split(self, ref: str, base: Optional[str] = None) -> Tuple[str, str]:
+        """Split a $ref into (absolute file, JSON pointer) relative to the referring file"""
+        base = base or self.root_path
+        file_part, _, pointer = ref.partition('#')
+        if not file_part:
+            return base, pointer
+        return os.path.normpath(os.path.join(os.path.dirname(base), file_part)), pointer
+    
+    def _document(self, path: str) -> Any:
+        if path not in self.documents:
+            if not os.path.exists(path):
+                raise ValueError(f"Referenced file '{path}' not found")
+            self.documents[path], _ = load_spec_file(path, self.cache_dir)
+        return self.documents[path]
+    
+    def _walk(self, path: str, pointer: str) -> Any:
+        node = self._document(path)
+        for token in pointer.split('/')[1:]:
+            token = _unescape_pointer_token(token)
+            try:
+                node = node[int(token)] if isinstance(node, list) else node[token]
+            except (KeyError, IndexError, ValueError, TypeError):
+                raise ValueError(f"Cannot resolve $ref '{path}#{pointer}'")
+        return node
+    
+    def resolve(self, ref: str, base: Optional[str] = None) -> Tuple[str, Any]:
+        """Follow a $ref, and any $ref chain it lands on, to (file, target)"""
+        key = self.split(ref, base)
+        if key in self._targets:
+            return self._targets[key]
+        
+        chain = []
+        path, pointer = key
+        while True:
+            if (path, pointer) in chain:
+                cycle = ' -> '.join(f"{p}#{q}" for p, q in chain + [(path, pointer)])
+                raise ValueError(f"Circular $ref chain: {cycle}")
+            chain.append((path, pointer))
+            if (path, pointer) in self._targets:
+                path, node = self._targets[(path, pointer)]
+                break
+            node = self._walk(path, pointer)
+            if isinstance(node, dict) and '$ref' in node and len(node) == 1:
+                path, pointer = self.split(node['$ref'], path)
+                continue
+            break
+        
+        for link in chain:
+            self._targets[link] = (path, node)
+        return path, node
+    
+    def forget(self, prefix: str):
+        """Drop memoized targets and names under a JSON pointer prefix of the root document"""
+        for memo in (self._targets, self._names):
+            for key in [key for key in memo if key[0] == self.root_path and key[1].startswith(prefix)]:
+                del memo[key]
+    
+    def circular(self, ref: str, base: Optional[str] = None) -> bool:
+        """Whether a $ref only leads through $ref-only nodes back to one it already passed"""
+        seen = set()
+        path, pointer = self.split(ref, base)
+        while (path, pointer) not in seen:
+            if (path, pointer) in self._targets:
+                return False
+            seen.add((path, pointer))
+            try:
+                node = self._walk(path, pointer)
+            except ValueError:
+                # Dangling refs are reported, or kept by name, where they are used
+                return False
+            if not (isinstance(node, dict) and '$ref' in node and len(node) == 1):
+                return False
+            path, pointer = self.split(node['$ref'], path)
+        return True
+    
+    def schema_name(self, ref: str, base: Optional[str] = None) -> Optional[str]:
+        """TypeScript name for a ref to a named schema, or None for anonymous targets"""
+        key = self.split(ref, base)
+        if key in self._names:
+            return self._names[key]
+        
+        path, pointer = key
+        tokens = [_unescape_pointer_token(t) for t in pointer.split('/')[1:]]
+        if len(tokens) == 3 and tokens[:2] == ['components', 'schemas'] or len(tokens) == 2 and tokens[0] == 'definitions':
+            name = tokens[-1]
+        elif not tokens and path != self.root_path:
+            # Whole-file schema such as ./schemas/order-item.yaml
+            _, schema = self.resolve(ref, base)
+            stem = Path(path).stem
+            name = schema.get('title') if isinstance(schema, dict) else None
+            name = name or ''.join(part.capitalize() for part in re.split(r'[-_.\s]+', stem) if part)
+        elif path != self.root_path and not SCHEMA_KEYWORDS.intersection(tokens):
+            # Schema keyed anywhere in a sibling file, such as common.yaml#/Owner
+            name = tokens[-1]
+        else:
+            name = None
+        
+        # Local named schemas are never resolved, so dangling refs still yield their name
+        if name and path != self.root_path and name not in self.external_schemas:
+            self.external_schemas[name] = self.resolve(ref, base)
+        
+        self._names[key] = name
+        return name
+
+
+class OutputSink:
+    """Single destination for every generated file
+    
+    Directories are created once, content is compared against the file on disk
+    (size first, then hash) and only differing files are written, atomically
+    through a temp file and rename. Safe to use from the writer thread pool.
+    """
+    
+    on_disk = True
+    
+    def __init__(self, root: Path):
+        self.root = root
+        self._lock = threading.Lock()
+        self._dirs: set = set()
+        self.reset()
+    
+    def reset(self):
+        """Forget the counters and hashes of the previous run"""
+        self.hashes: Dict[str, str] = {}
+        self.written: List[str] = []
+        self.unchanged: List[str] = []
+        self.removed: List[str] = []
+        self.bytes_written = 0
+        self.bytes_total = 0
+    
+    def _ensure_dir(self, directory: Path):
+        if directory not in self._dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            with self._lock:
+                self._dirs.add(directory)
+    
+    def write(self, path: Path, content: str) -> bool:
+        """Write content to path unless the file already holds it; returns True if written"""
+        data = content.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        relative = path.relative_to(self.root).as_posix()
+        
+        try:
+            unchanged = path.stat().st_size == len(data) and hashlib.sha256(path.read_bytes()).hexdigest() == digest
+        except OSError:
+            unchanged = False
+        
+        if not unchanged:
+            self._ensure_dir(path.parent)
+            temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        
+        with self._lock:
+            self.hashes[relative] = digest
+            self.bytes_total += len(data)
+            if unchanged:
+                self.unchanged.append(relative)
+            else:
+                self.written.append(relative)
+                self.bytes_written += len(data)
+        return not unchanged
+    
+    def remove(self, relative: str):
+        """Delete a previously generated file that no longer has a source"""
+        path = self.root / relative
+        if path.exists():
+            path.unlink()
+            with self._lock:
+                self.removed.append(relative)
+            # Folders left empty, such as a dropped tag's feature folder, go too
+            directory = path.parent
+            while directory != self.root and self.root in directory.parents:
+                try:
+                    directory.rmdir()
+                except OSError:
+                    break
+                with self._lock:
+                    self._dirs.discard(directory)
+                directory = directory.parent
+    
+    def exists(self, relative: str) -> bool:
+        """Whether a generated file is present in the output"""
+        return (self.root / relative).exists()
+    
+    def list_files(self, directory: Path) -> List[str]:
+        """Sorted names of the files directly inside directory"""
+        return sorted(f.name for f in directory.glob("*") if f.is_file())
+    
+    def list_dirs(self, directory: Path) -> List[Path]:
+        """Sorted subdirectories of directory"""
+        return sorted(d for d in directory.glob("*") if d.is_dir())
+    
+    def summary(self) -> str:
+        return (f"{len(self.written)} written, {len(self.unchanged)} unchanged, "
+                f"{len(self.removed)} removed")
+
+
+class MemorySink(OutputSink):
+    """Output sink that keeps the generated tree in memory instead of on disk
+    
+    files maps each relative path to its content and survives reset(), so
+    incremental runs compare against the previous tree just like on disk.
+    listener, when set, is called with (relative path, content) for every
+    written file and with (relative path, None) for every removed one.
+    """
+    
+    on_disk = False
+    
+    def __init__(self, root: Path, listener: Optional[Callable[[str, Optional[str]], None]] = None):
+        self.files: Dict[str, str] = {}
+        self.listener = listener
+        super().__init__(root)
+    
+    def write(self, path: Path, content: str) -> bool:
+        """Store content under path unless it is already held; returns True if stored"""
+        data = content.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        relative = path.relative_to(self.root).as_posix()
+        
+        with self._lock:
+            unchanged = self.files.get(relative) == content
+            self.files[relative] = content
+            self.hashes[relative] = digest
+            self.bytes_total += len(data)
+            if unchanged:
+                self.unchanged.append(relative)
+            else:
+                self.written.append(relative)
+                self.bytes_written += len(data)
+        
+        if not unchanged and self.listener is not None:
+            self.listener(relative, content)
+        return not unchanged
+    
+    def remove(self, relative: str):
+        """Drop a previously generated file that no longer has a source"""
+        with self._lock:
+            if self.files.pop(relative, None) is None:
+                return
+            self.removed.append(relative)
+        if self.listener is not None:
+            self.listener(relative, None)
+    
+    def exists(self, relative: str) -> bool:
+        """Whether a generated file is present in the tree"""
+        return relative in self.files
+    
+    def _relative_dir(self, directory: Path) -> str:
+        prefix = directory.relative_to(self.root).as_posix()
+        return '' if prefix == '.' else f"{prefix}/"
+    
+    def list_files(self, directory: Path) -> List[str]:
+        """Sorted names of the files directly inside directory"""
+        prefix = self._relative_dir(directory)
+        return sorted(
+            relative[len(prefix):] for relative in list(self.files)
+            if relative.startswith(prefix) and '/' not in relative[len(prefix):]
+        )
+    
+    def list_dirs(self, directory: Path) -> List[Path]:
+        """Sorted subdirectories of directory"""
+        prefix = self._relative_dir(directory)
+        names = {
+            relative[len(prefix):].split('/', 1)[0] for relative in list(self.files)
+            if relative.startswith(prefix) and '/' in relative[len(prefix):]
+        }
+        return [directory / name for name in sorted(names)]
+
+
+class Instrumentation:
+    """Timing and output counters for one generator
+    
+    Records wall-clock and CPU time per phase, render time per tag and per
+    schema, and file/byte counts. Subclass and override on_phase/on_render to
+    forward measurements to build telemetry as they happen.
+    """
+    
+    def __init__(self):
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self.renders: Dict[str, Dict[str, float]] = {}
+        self.profile: Optional[Dict[str, Any]] = None
+    
+    def on_phase(self, name: str, wall: float, cpu: float):
+        """Called after every phase; no-op hook for subclasses"""
+    
+    def on_render(self, kind: str, key: str, seconds: float):
+        """Called after every tag or schema render; no-op hook for subclasses"""
+    
+    def record_phase(self, name: str, wall: float, cpu: float):
+        self.phases[name] = {'wall': wall, 'cpu': cpu}
+        self.on_phase(name, wall, cpu)
+    
+    def record_render(self, kind: str, key: str, seconds: float):
+        self.renders.setdefault(kind, {})[key] = seconds
+        self.on_render(kind, key, seconds)
+    
+    @contextmanager
+    def phase(self, name: str):
+        """Time the enclosed block as a named phase"""
+        wall_started, cpu_started = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            self.record_phase(name, time.perf_counter() - wall_started, time.process_time() - cpu_started)
+    
+    @contextmanager
+    def profiled(self, mode: Optional[str], output: Optional[str] = None, top: int = 25):
+        """Run the enclosed block under cProfile or tracemalloc
+        
+        cProfile stats are dumped to output (default: ngrx-profile.prof);
+        tracemalloc's top allocation sites go to output (default:
+        ngrx-tracemalloc.txt). Only the calling process is profiled.
+        """
+        if mode is None:
+            yield
+            return
+        
+        if mode == 'cprofile':
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                yield
+            finally:
+                profiler.disable()
+                output = output or 'ngrx-profile.prof'
+                profiler.dump_stats(output)
+                stats = pstats.Stats(profiler).sort_stats('cumulative')
+                self.profile = {
+                    'mode': mode,
+                    'output': output,
+                    'top': [
+                        {'function': f"{func[0]}:{func[1]}({func[2]})", 'calls': calls, 'cumulative': cumulative}
+                        for func, (_, calls, _, cumulative, _) in sorted(
+                            stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:top]
+                    ],
+                }
+        elif mode == 'tracemalloc':
+            tracemalloc.start()
+            try:
+                yield
+            finally:
+                snapshot = tracemalloc.take_snapshot()
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                output = output or 'ngrx-tracemalloc.txt'
+                top_stats = snapshot.statistics('lineno')[:top]
+                with open(output, 'w') as f:
+                    f.write(f"Peak traced memory: {peak} bytes\n")
+                    f.writelines(f"{stat}\n" for stat in top_stats)
+                self.profile = {
+                    'mode': mode,
+                    'output': output,
+                    'peak_bytes': peak,
+                    'top': [{'location': str(stat.traceback), 'bytes': stat.size, 'blocks': stat.count}
+                            for stat in top_stats],
+                }
+        else:
+            raise ValueError(f"Unknown profile mode '{mode}'")
+    
+    def report(self, sink: Optional['OutputSink'] = None) -> Dict[str, Any]:
+        """Everything measured so far as a JSON-serializable dict"""
+        report: Dict[str, Any] = {
+            'phases': self.phases,
+            'total': {
+                'wall': sum(phase['wall'] for phase in self.phases.values()),
+                'cpu': sum(phase['cpu'] for phase in self.phases.values()),
+            },
+            'renders': self.renders,
+            'slowest_renders': [
+                {'kind': kind, 'key': key, 'seconds': seconds}
+                for kind, key, seconds in sorted(
+                    ((kind, key, seconds) for kind, timings in self.renders.items()
+                     for key, seconds in timings.items()),
+                    key=lambda item: item[2], reverse=True)[:10]
+            ],
+        }
+        if sink is not None:
+            report['files'] = {
+                'written': len(sink.written),
+                'unchanged': len(sink.unchanged),
+                'removed': len(sink.removed),
+                'bytes_written': sink.bytes_written,
+                'bytes_total': sink.bytes_total,
+            }
+        if self.profile is not None:
+            report['profile'] = self.profile
+        return report
+
+
+# Built-in templates ship next to the script; --templates overlays a user directory
+DEFAULT_TEMPLATE_DIR = Path(__file__).resolve().parent / 'templates'
+TEMPLATE_SUFFIX = '.ts.tmpl'
+TEMPLATE_ENGINE_VERSION = 1
+
+_TEMPLATE_TOKEN = re.compile(r'({{.*?}}|{%.*?%}|{#.*?#})')
+_TEMPLATE_BLOCK_LINE = re.compile(r'[ \t]*(?:(?:{%.*?%}|{#.*?#})[ \t]*)+\n?')
+
+
+def compile_template(name: str, source: str, load_source) -> CodeType:
+    """Translate a template into code defining _render(_w, **context), which writes through _w
+    
+    Supports {{ expr }}, {# comments #} and {% for/if/elif/else/set/include %}
+    blocks closed by {% endfor %} / {% endif %}. Expressions are plain Python.
+    Lines holding only block tags or comments produce no output, {%- trims the
+    whitespace before a tag and one trailing newline of the template is ignored.
+    """
+    lines: List[str] = []
+    stack: List[str] = []
+    # Text and expressions between two block tags are fused into one %-format call
+    pieces: List[str] = []
+    values: List[str] = []
+    
+    def flush():
+        if pieces:
+            indent = '    ' * len(stack)
+            text = ''.join(pieces)
+            if values:
+                lines.append(f"{indent}_w({text!r} % ({', '.join(values)},))")
+            else:
+                lines.append(f"{indent}_w({text!r})")
+            pieces.clear()
+            values.clear()
+    
+    def emit(template_name: str, text: str, depth: int = 0):
+        if depth > 10:
+            raise ValueError(f"Template include depth exceeded in '{template_name}'")
+        if text.endswith('\n'):
+            text = text[:-1]
+        # Drop lines that only carry block tags, including their newline
+        text = ''.join(
+            line.strip(' \t\n') if _TEMPLATE_BLOCK_LINE.fullmatch(line) else line
+            for line in text.splitlines(keepends=True)
+        )
+        tokens = _TEMPLATE_TOKEN.split(text)
+        for position, token in enumerate(tokens):
+            # {%- trims the whitespace, newlines included, in front of the tag
+            following = tokens[position + 1] if position + 1 < len(tokens) else ''
+            if following.startswith('{%-') and not token.startswith('{'):
+                token = token.rstrip()
+            if not token or token.startswith('{#'):
+                continue
+            if token.startswith('{{'):
+                pieces.append('%s')
+                values.append(f"({token[2:-2].strip()})")
+                continue
+            if not token.startswith('{%'):
+                pieces.append(token.replace('%', '%%'))
+                continue
+            
+            flush()
+            indent = '    ' * len(stack)
+            keyword, _, argument = token[2:-2].strip(' \t-').partition(' ')
+            argument = argument.strip()
+            if keyword in ('for', 'if'):
+                lines.extend([f"{indent}{keyword} {argument}:", f"{indent}    pass"])
+                stack.append(keyword)
+            elif keyword in ('elif', 'else'):
+                if not stack or stack[-1] != 'if':
+                    raise ValueError(f"Unexpected {{% {keyword} %}} in template '{template_name}'")
+                outer = '    ' * (len(stack) - 1)
+                lines.extend([f"{outer}{keyword} {argument}:" if keyword == 'elif' else f"{outer}else:",
+                              f"{indent}pass"])
+            elif keyword in ('endfor', 'endif'):
+                if not stack or stack.pop() != keyword[3:]:
+                    raise ValueError(f"Unexpected {{% {keyword} %}} in template '{template_name}'")
+            elif keyword == 'set':
+                lines.append(f"{indent}{argument}")
+            elif keyword == 'include':
+                included = argument.strip('\'"')
+                emit(included, load_source(included), depth + 1)
+            else:
+                raise ValueError(f"Unknown tag {{% {keyword} %}} in template '{template_name}'")
+        flush()
+    
+    emit(name, source)
+    if stack:
+        raise ValueError(f"Unclosed {{% {stack[-1]} %}} in template '{name}'")
+    
+    # Wrap the body in a function whose keyword-only parameters are the free
+    # names, so template variables are fast locals instead of dict lookups
+    body = '\n'.join(f"    {line}" for line in lines) or '    pass'
+    filename = f"<template {name}>"
+    scopes = [symtable.symtable(f"def _render(_w):\n{body}", filename, 'exec').get_children()[0]]
+    free_names = set()
+    while scopes:
+        scope = scopes.pop()
+        free_names.update(scope.get_globals())
+        scopes.extend(scope.get_children())
+    keywords = [free for free in sorted(free_names) if not hasattr(builtins, free)]
+    parameters = ', '.join(['_w'] + (['*'] + keywords if keywords else []) + ['**_unused'])
+    return compile(f"def _render({parameters}):\n{body}", filename, 'exec')
+
+
+class TemplateSet:
+    """The built-in templates, overlaid by an optional user directory
+    
+    Every template is compiled on first use and the code objects are cached
+    with marshal in cache_dir, keyed by the template sources, the engine
+    version and the Python bytecode tag.
+    """
+    
+    def __init__(self, override_dir: Optional[Path] = None, cache_dir: Optional[Path] = None):
+        self.override_dir = Path(override_dir) if override_dir else None
+        self.cache_dir = cache_dir
+        self._codes: Optional[Dict[str, CodeType]] = None
+        self._sources: Optional[Dict[str, str]] = None
+        self._digest: Optional[str] = None
+        self._functions: Dict[str, Any] = {}
+    
+    def __getstate__(self):
+        # Code objects do not pickle, their marshalled form does
+        state = self.__dict__.copy()
+        state['_codes'] = None if self._codes is None else marshal.dumps(self._codes)
+        state['_sources'] = None
+        state['_functions'] = {}
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self._codes is not None:
+            self._codes = marshal.loads(self._codes)
+    
+    def sources(self) -> Dict[str, str]:
+        """Template name -> source, user templates replacing built-in ones of the same name"""
+        sources = {}
+        for directory in (DEFAULT_TEMPLATE_DIR, self.override_dir):
+            if directory is None:
+                continue
+            for path in sorted(directory.glob(f"*{TEMPLATE_SUFFIX}")):
+                sources[path.name[:-len(TEMPLATE_SUFFIX)]] = path.read_text(encoding='utf-8')
+        return sources
+    
+    def digest(self) -> str:
+        """Hash of the engine version, the bytecode tag and every template source"""
+        if self._digest is None:
+            self._sources = self.sources()
+            self._digest = hashlib.sha256(json.dumps(
+                [TEMPLATE_ENGINE_VERSION, sys.implementation.cache_tag, self._sources], sort_keys=True
+            ).encode()).hexdigest()[:32]
+        return self._digest
+    
+    def load(self) -> Dict[str, CodeType]:
+        """Compile every template once, reusing the marshal cache when the sources match"""
+        if self._codes is not None:
+            return self._codes
+        
+        digest = self.digest()
+        sources = self._sources
+        cache_file = self.cache_dir / f"templates-{digest}.marshal" if self.cache_dir else None
+        
+        if cache_file is not None:
+            try:
+                with open(cache_file, 'rb') as f:
+                    self._codes = marshal.load(f)
+                return self._codes
+            except (OSError, EOFError, ValueError, TypeError):
+                pass
+        
+        self._codes = {name: compile_template(name, source, sources.__getitem__) for name, source in sources.items()}
+        
+        if cache_file is not None:
+            self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            for stale in self.cache_dir.glob("templates-*.marshal"):
+                stale.unlink()
+            temp_file = cache_file.with_suffix('.tmp')
+            with open(temp_file, 'wb') as f:
+                marshal.dump(self._codes, f)
+            os.replace(temp_file, cache_file)
+        
+        return self._codes
+    
+    def render(self, name: str, **context) -> str:
+        """Render a template with the given variables"""
+        function = self._functions.get(name)
+        if function is None:
+            namespace: Dict[str, Any] = {}
+            exec(self.load()[name], namespace)
+            function = self._functions[name] = namespace['_render']
+        out: List[str] = []
+        function(out.append, **context)
+        return ''.join(out)
+
+
+class _Frozen:
+    """Base for immutable __slots__ records; attributes are set once in __init__"""
+    __slots__ = ()
+
+    def _init(self, **values):
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return (_rebuild_frozen, (type(self), {name: getattr(self, name) for name in self.__slots__}))
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+def _rebuild_frozen(cls, values):
+    """Unpickle helper for _Frozen records"""
+    record = cls.__new__(cls)
+    record._init(**values)
+    return record
+
+
+class OperationRecord(_Frozen):
+    """A single operation with every name, parameter list and URL already resolved"""
+    __slots__ = (
+        'operation_id', 'name', 'pascal', 'method', 'path', 'summary',
+        'parameters', 'request_body', 'return_type', 'response_kind', 'response_schema', 'tag',
+        'action_props', 'service_params', 'call_args', 'url',
+        'flattening', 'debounce', 'concurrency', 'query_params', 'params_type', 'pagination',
+    )
+
+    def __init__(self, **values):
+        self._init(**values)
+
+
+class PaginationInfo(_Frozen):
+    """Where a paginated response keeps its items (and their schema, if named) and its page metadata"""
+    __slots__ = ('items_field', 'items_schema', 'meta_field', 'total_field')
+
+    def __init__(self, **values):
+        self._init(**values)
+
+
+class EntityInfo(_Frozen):
+    """Schema a tag normalizes through an @ngrx/entity adapter"""
+    __slots__ = ('schema', 'id_field', 'adapter')
+
+    def __init__(self, **values):
+        self._init(**values)
+
+
+class IndexInfo(_Frozen):
+    """Lookup selectors derived from a schema property marked with x-ngrx-index"""
+    __slots__ = ('name', 'source', 'field', 'accessor', 'by', 'unique', 'key_type')
+
+    def __init__(self, **values):
+        self._init(**values)
+
+
+class BatchInfo(_Frozen):
+    """How an item operation's requests are coalesced into calls of a bulk operation"""
+    __slots__ = ('operation', 'param', 'bulk', 'call', 'key', 'window', 'max_size')
+
+    def __init__(self, **values):
+        self._init(**values)
+
+
+class TagGroup(_Frozen):
+    """All operations sharing a tag, with the tag's derived names"""
+    __slots__ = ('tag', 'pascal', 'camel', 'lower', 'operations', 'entity', 'indexes', 'batches')
+
+    def __init__(self, **values):
+        values.setdefault('entity', None)
+        values.setdefault('indexes', ())
+        values.setdefault('batches', ())
+        self._init(**values)
+
+    def entity_role(self, op: 'OperationRecord') -> str:
+        """'collection', 'page' or 'item' when op's response is stored in the entity adapter, else ''"""
+        if self.entity is None:
+            return ''
+        if op.pagination is not None and op.pagination.items_schema == self.entity.schema:
+            return 'page'
+        if op.response_schema != self.entity.schema:
+            return ''
+        return op.response_kind
+
+
+class OperationIndex(_Frozen):
+    """Immutable index of operations grouped by tag, built once per run"""
+    __slots__ = ('operations', 'tags')
+
+    def __init__(self, operations, tags):
+        self._init(operations=tuple(operations), tags=MappingProxyType(dict(tags)))
+
+    def __iter__(self):
+        return iter(self.tags.values())
+
+    def __len__(self):
+        return len(self.operations)
+
+    def __reduce__(self):
+        return (OperationIndex, (self.operations, dict(self.tags)))
+
+    def subset(self, tags) -> 'OperationIndex':
+        """Index restricted to the given tags, preserving order"""
+        groups = {tag: group for tag, group in self.tags.items() if tag in tags}
+        operations = [op for group in groups.values() for op in group.operations]
+        return OperationIndex(operations, groups)
+
+
+class _ModelMap(Mapping):
+    """Model name -> (file, schema) over the spec's schemas plus named external ones"""
+
+    def __init__(self, local: Mapping, external_names: List[str], external: Dict[str, Tuple[str, Any]]):
+        self.local = local
+        self.external_names = external_names
+        self.external = external
+        self._external_set = set(external_names)
+
+    def __getitem__(self, name: str) -> Tuple[Optional[str], Any]:
+        if name in self.local:
+            return None, self.local[name]
+        if name in self._external_set:
+            return self.external[name]
+        raise KeyError(name)
+
+    def __contains__(self, name) -> bool:
+        return name in self.local or name in self._external_set
+
+    def __iter__(self):
+        return chain(self.local, self.external_names)
+
+    def __len__(self) -> int:
+        return len(self.local) + len(self.external_names)
+
+
+# Schema keys that document a value without changing its TypeScript shape
+SCHEMA_ANNOTATIONS = frozenset(('description', 'title', 'example', 'examples', 'default', 'format', 'xml',
+                                'externalDocs', 'deprecated', 'readOnly', 'writeOnly'))
+TS_IDENTIFIER = re.compile(r'^[A-Za-z_$][\w$]*$')
+TS_PRIMITIVES = {'string': 'string', 'integer': 'number', 'number': 'number', 'boolean': 'boolean', 'object': 'any'}
+
+
+def _shape_fingerprint(schema: Any, base: Optional[str]) -> str:
+    """Structural hash of a schema node, ignoring annotations and x- extensions"""
+    def strip(node: Any, is_properties: bool = False) -> Any:
+        if isinstance(node, dict):
+            # Property names are part of the shape even when they look like annotations
+            return {
+                key: strip(value, key == 'properties' and not is_properties) for key, value in node.items()
+                if is_properties or key not in SCHEMA_ANNOTATIONS and not str(key).startswith('x-')
+            }
+        if isinstance(node, list):
+            return [strip(value) for value in node]
+        return node
+    return _fragment_hash([base, strip(schema)])
+
+
+def _ts_literal(value: Any) -> str:
+    """TypeScript literal type for one enum value"""
+    if isinstance(value, str):
+        return "'" + value.replace('\\', '\\\\').replace("'", "\\'") + "'"
+    return json.dumps(value)
+
+
+def _pascal_identifier(text: str) -> str:
+    """PascalCase identifier part for a property name such as first-name or $id"""
+    return ''.join(part[:1].upper() + part[1:] for part in re.split(r'[^A-Za-z0-9]+', str(text)) if part) or 'Field'
+
+
+# Composition keyword -> (type operator, hint label of each member)
+TS_COMPOSITIONS = (('allOf', ' & ', 'Part'), ('oneOf', ' | ', 'Option'), ('anyOf', ' | ', 'Option'))
+
+
+def _ts_property_key(name: Any) -> str:
+    """Property key as written in TypeScript, quoted unless it is an identifier"""
+    name = str(name)
+    return name if TS_IDENTIFIER.match(name) else json.dumps(name)
+
+
+def _ts_operand(ts_type: str) -> str:
+    """Parenthesize a union or intersection used as an array item or composition member"""
+    return f"({ts_type})" if ' ' in ts_type and not ts_type.startswith('{') else ts_type
+
+
+def _ts_fields(schema: Dict, base: Optional[str],
+               convert: Callable[[Any, Optional[str], str], str]) -> List[Tuple[str, str, str]]:
+    """(key, optional marker, type) of each property of an object schema"""
+    required = schema.get('required', [])
+    return [
+        (_ts_property_key(prop_name), '' if prop_name in required else '?',
+         convert(prop_schema, base, _pascal_identifier(prop_name)))
+        for prop_name, prop_schema in schema.get('properties', {}).items()
+    ]
+
+
+def _ts_type(schema: Dict, base: Optional[str], convert: Callable[[Any, Optional[str], str], str],
+             hoist: Optional[Callable[[Dict, Optional[str]], str]] = None) -> str:
+    """TypeScript type of a schema node other than a $ref, for regular and compact models alike
+    
+    convert(node, base, label) types a nested node; label names it within its
+    parent (Part1, Option2, a property name, Value, Item). hoist, when given,
+    types enums and objects with properties, which are otherwise inlined.
+    """
+    for keyword, separator, label in TS_COMPOSITIONS:
+        if keyword in schema:
+            members = []
+            for position, member in enumerate(schema[keyword], 1):
+                member_type = _ts_operand(convert(member, base, f"{label}{position}"))
+                if member_type not in members:
+                    members.append(member_type)
+            return separator.join(members) if members else 'any'
+    
+    schema_type = schema.get('type', 'any')
+    if hoist is not None and (schema.get('enum') or schema_type == 'object' and 'properties' in schema):
+        return hoist(schema, base)
+    if schema_type == 'object' and 'properties' in schema:
+        fields = _ts_fields(schema, base, convert)
+        return f"{{ {'; '.join(f'{key}{optional}: {ts_type}' for key, optional, ts_type in fields)} }}" if fields else 'any'
+    if schema_type == 'object' and isinstance(schema.get('additionalProperties'), dict):
+        return f"{{ [key: string]: {convert(schema['additionalProperties'], base, 'Value')} }}"
+    if schema_type == 'array':
+        return f"{_ts_operand(convert(schema.get('items', {}), base, 'Item'))}[]"
+    return TS_PRIMITIVES.get(schema_type, 'any')
+
+
+class _CompactModels:
+    """Model declarations with inline shapes hoisted into named types and each distinct shape declared once
+    
+    declarations maps every emitted name to (owner model, alias, properties,
+    referenced names): alias is the right-hand side of a type alias, properties
+    the (key, optional, type) fields of an interface. Inline objects and enums
+    are keyed by their TypeScript shape; the first occurrence names it and
+    later ones, named models included, refer to that name.
+    """
+    
+    def __init__(self, generator: 'NgRxGenerator', models: Mapping):
+        self.generator = generator
+        self.resolver = generator.resolver
+        self.declarations: Dict[str, Tuple[str, Optional[str], Optional[List[Tuple[str, str, str]]], set]] = {}
+        self.shapes: Dict[tuple, str] = {}
+        self.taken = set(models) | set(generator.shared_models)
+        self._resolving: set = set()
+        
+        # Inline copies of a named schema, and enums listing its values in any order, take its name
+        self.named: Dict[str, str] = {}
+        for name, (base, schema) in models.items():
+            if self._hoistable(schema):
+                self.named.setdefault(_shape_fingerprint(schema, base), name)
+            if isinstance(schema, dict) and schema.get('enum') and 'properties' not in schema:
+                self.shapes.setdefault(('enum', tuple(sorted(self._enum_literals(schema)))), name)
+        
+        for name, (base, schema) in models.items():
+            if name not in generator.shared_models:
+                self._declare_model(name, schema, base)
+    
+    @staticmethod
+    def _hoistable(schema: Any) -> bool:
+        return isinstance(schema, dict) and any(key in schema for key in ('properties', 'enum', 'allOf', 'oneOf', 'anyOf'))
+    
+    @staticmethod
+    def _enum_literals(schema: Dict) -> List[str]:
+        return list(dict.fromkeys(_ts_literal(value) for value in schema['enum']))
+    
+    def _declare_model(self, name: str, schema: Dict, base: Optional[str]):
+        refs: set = set()
+        # Same interface/alias split as _generate_model_interface
+        if ('properties' not in schema and
+                (any(key in schema for key in ('allOf', 'oneOf', 'anyOf', '$ref'))
+                 or schema.get('type', 'object') != 'object')):
+            if self.generator._circular_alias(name, schema, base):
+                alias = 'unknown'
+            else:
+                alias = self.type_of(schema, base, name, refs, name, name)
+            if name not in self.declarations:
+                self.declarations[name] = (name, alias, None, refs)
+            return
+        properties = self._fields(schema, base, name, refs, name)
+        self._hoist(('object', tuple(sorted(properties))), name, None, properties, refs, name, set(), name)
+    
+    def _unique_name(self, hint: str) -> str:
+        hint = hint if re.match(r'[A-Za-z_$]', hint) else f"T{hint}"
+        candidate, suffix = hint, 2
+        while candidate in self.taken:
+            candidate, suffix = f"{hint}{suffix}", suffix + 1
+        self.taken.add(candidate)
+        return candidate
+    
+    def _hoist(self, key: tuple, hint: str, alias: Optional[str], properties: Optional[List], body_refs: set,
+               owner: str, refs: set, name: Optional[str] = None) -> str:
+        """Declare a shape once; name declares a named model, which aliases an identical earlier shape"""
+        existing = self.shapes.get(key)
+        if name is not None:
+            if existing is not None and existing != name:
+                self.declarations[name] = (owner, existing, None, {existing})
+            else:
+                self.shapes[key] = name
+                self.declarations[name] = (owner, alias, properties, body_refs)
+            return name
+        if existing is None:
+            existing = self._unique_name(hint)
+            self.shapes[key] = existing
+            self.declarations[existing] = (owner, alias, properties, body_refs)
+        refs.add(existing)
+        return existing
+    
+    def _fields(self, schema: Dict, base: Optional[str], hint: str, refs: set, owner: str) -> List[Tuple[str, str, str]]:
+        return _ts_fields(schema, base, lambda node, node_base, label: self.type_of(node, node_base, f"{hint}{label}", refs, owner))
+    
+    def type_of(self, schema: Any, base: Optional[str], hint: str, refs: set, owner: str,
+                name: Optional[str] = None) -> str:
+        """TypeScript type of a schema node, adding the names it uses to refs"""
+        if not isinstance(schema, dict):
+            return 'any'
+        if '$ref' in schema:
+            ref_name = self.resolver.schema_name(schema['$ref'], base)
+            if ref_name:
+                refs.add(ref_name)
+                return ref_name
+            target = self.resolver.split(schema['$ref'], base)
+            if target in self._resolving:
+                return 'any'
+            self._resolving.add(target)
+            try:
+                target_base, target_node = self.resolver.resolve(schema['$ref'], base)
+                return self.type_of(target_node, target_base, hint, refs, owner, name)
+            finally:
+                self._resolving.discard(target)
+        
+        if name is None and self._hoistable(schema):
+            named = self.named.get(_shape_fingerprint(schema, base))
+            if named is not None:
+                refs.add(named)
+                return named
+        
+        return _ts_type(
+            schema, base, lambda node, node_base, label: self.type_of(node, node_base, f"{hint}{label}", refs, owner),
+            lambda node, node_base: self._hoist_shape(node, node_base, hint, refs, owner, name),
+        )
+    
+    def _hoist_shape(self, schema: Dict, base: Optional[str], hint: str, refs: set, owner: str,
+                     name: Optional[str]) -> str:
+        """Named type of an enum or an object with properties"""
+        if schema.get('enum'):
+            literals = self._enum_literals(schema)
+            return self._hoist(('enum', tuple(sorted(literals))), hint, ' | '.join(literals), None, set(),
+                               owner, refs, name)
+        body_refs: set = set()
+        properties = self._fields(schema, base, hint, body_refs, owner)
+        if not properties:
+            return 'any'
+        return self._hoist(('object', tuple(sorted(properties))), hint, None, properties, body_refs,
+                           owner, refs, name)
+
+
+def _content_hash(text: str) -> str:
+    """Stable hash of emitted file content"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _fragment_hash(fragment: Any) -> str:
+    """Stable hash of a spec fragment or index record"""
+    return _content_hash(json.dumps(fragment, sort_keys=True, default=repr))
+
+
+# Per-tag outputs as (directory, file suffix)
+TAG_FILE_KINDS = (
+    ('actions', 'actions'),
+    ('effects', 'effects'),
+    ('reducers', 'reducer'),
+    ('selectors', 'selectors'),
+    ('services', 'service'),
+)
+
+MANIFEST_FILE = '.ngrx-manifest.json'
+MANIFEST_VERSION = 1
+
+# Upper bound on concurrent file writes, regardless of --jobs
+MAX_WRITER_THREADS = 8
+
+# Operators effects may flatten service calls with; 'auto' derives one from the method
+FLATTENING_OPERATORS = ('switchMap', 'concatMap', 'mergeMap', 'exhaustMap')
+# Matched against the operationId's words, so loginUser or user_logout match but catalogInfo does not
+AUTH_OPERATION_PATTERN = re.compile(
+    r'\b(?:log ?in|log ?out|sign ?in|sign ?up|sign ?out|register|authenticate|refresh (?:token|session|auth))\b'
+)
+OPERATION_WORD_PATTERN = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+')
+
+# Item requests coalesced into one bulk call per window (x-ngrx-batch / --batch)
+BATCH_WINDOW_MS = 10
+BATCH_MAX_SIZE = 100
+
+# Feature layout: one folder per tag, shared runtime files and the lazy-load manifest
+LAYOUTS = ('flat', 'feature')
+FEATURES_DIR = 'features'
+SHARED_DIR = 'shared'
+FEATURE_MANIFEST_FILE = 'store.features'
+
+# Per-operation request status shared by every reducer
+CALL_STATE_FILE = 'call-state'
+CALL_STATE_IMPORTS = 'CallState, initialCallState, loadingCallState, loadedCallState, errorCallState'
+
+# Shared service-side response cache emitted with --http-cache
+HTTP_CACHE_FILE = 'http-cache'
+HTTP_CACHE_TTL_MS = 30000
+HTTP_CACHE_MAX_ENTRIES = 500
+
+# Shared selector helpers: memoized factories (--selector-factories) and x-ngrx-index lookups
+SELECTOR_UTILS_FILE = 'selector-utils'
+SELECTOR_CACHE_MAX_ENTRIES = 100
+INDEX_EXTENSION = 'x-ngrx-index'
+# x-ngrx-index value -> whether each key maps to a single item rather than a list
+INDEX_KINDS = {True: False, 'group': False, 'unique': True}
+
+# Generator copy installed in each render worker process
+_worker_generator = None
+
+
+def _init_render_worker(generator: 'NgRxGenerator'):
+    """Process pool initializer: keep one generator per worker"""
+    global _worker_generator
+    _worker_generator = generator
+
+
+def _timed_render(generator: 'NgRxGenerator', method_name: str, args: tuple) -> Tuple[str, float]:
+    """Run one pure _generate_* renderer, returning its output and duration"""
+    started = time.perf_counter()
+    content = getattr(generator, method_name)(*args)
+    return content, time.perf_counter() - started
+
+
+def _render_in_worker(method_name: str, args: tuple) -> Tuple[str, float]:
+    """Run one renderer inside a worker process"""
+    return _timed_render(_worker_generator, method_name, args)
+
+
+# Instrumentation label for each renderer
+RENDER_KINDS = {
+    '_generate_model_interface': 'models',
+    '_generate_model_file': 'models',
+    '_generate_actions_content': 'actions',
+    '_generate_effects_content': 'effects',
+    '_generate_reducer_content': 'reducers',
+    '_generate_selector_content': 'selectors',
+    '_generate_service_content': 'services',
+    '_generate_feature_content': 'features',
+}
 
 
 class NgRxGenerator:
-    def __init__(self, swagger_file: str, output_dir: str = "./src/app/store"):
-        self.swagger_file = swagger_file
+    def __init__(self, swagger_file: Union[str, Dict[str, Any], bytes, BinaryIO], output_dir: str = "./src/app/store",
+                 incremental: bool = False, jobs: int = 1, cache_dir: Optional[str] = None,
+                 instrumentation: Optional[Instrumentation] = None, entity_adapters: bool = False,
+                 http_cache: bool = False, flattening: str = 'auto', effect_debounce: int = 0,
+                 merge_concurrency: int = 0, layout: str = 'flat', template_dir: Optional[str] = None,
+                 in_memory: bool = False, quiet: bool = False, streaming: bool = False,
+                 compact_models: bool = False, model_files: int = 0, selector_factories: bool = False,
+                 batch_endpoints: Optional[Dict[str, str]] = None, batch_window: int = BATCH_WINDOW_MS):
+        # A path is read from disk; a parsed dict, bytes or a stream is used as is
+        if isinstance(swagger_file, (str, os.PathLike)):
+            self.swagger_file = os.fspath(swagger_file)
+            self.spec_input = None
+        else:
+            self.swagger_file = MEMORY_SPEC_NAME
+            self.spec_input = swagger_file
         self.output_dir = Path(output_dir)
+        self.incremental = incremental
+        self.jobs = max(1, jobs)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.stats = instrumentation or Instrumentation()
+        self.entity_adapters = entity_adapters
+        self.http_cache = http_cache
+        self.flattening = flattening
+        self.effect_debounce = effect_debounce
+        self.merge_concurrency = merge_concurrency
+        self.layout = layout
+        self.quiet = quiet
+        self.streaming = streaming
+        # Grouping models into files needs the cross-file imports of compact models
+        self.model_files = max(0, model_files)
+        self.compact_models = compact_models or self.model_files > 0
+        self.selector_factories = selector_factories
+        # Item operationId -> bulk operationId, on top of x-ngrx-batch in the spec
+        self.batch_endpoints = dict(batch_endpoints or {})
+        self.batch_window = batch_window
+        # Model name -> import specifier of its file in a batch's shared models package
+        self.shared_models: Dict[str, str] = {}
+        self.templates = TemplateSet(template_dir, self.cache_dir)
+        self._render_pool: Optional[ProcessPoolExecutor] = None
+        self._write_pool: Optional[ThreadPoolExecutor] = None
         self.swagger_data = self._load_swagger_file()
         self.base_url = self._extract_base_url()
+        self.resolver = RefResolver(self.swagger_data, self._spec_path(), self.cache_dir)
+        self._schema_graph: Optional[Dict[str, set]] = None
+        # Schema name -> fragment hash, kept with the graph while only path items change
+        self._schema_hashes: Dict[str, str] = {}
+        self._type_cache: Dict[Tuple[int, Optional[str]], Tuple[Any, str]] = {}
         
-    def _load_swagger_file(self) -> Dict[str, Any]:
-        """Load and parse the Swagger/OpenAPI file"""
-        with open(self.swagger_file, 'r') as file:
-            if self.swagger_file.endswith('.json'):
-                return json.load(file)
+        self.sink = MemorySink(self.output_dir) if in_memory else OutputSink(self.output_dir)
+        # Last manifest written, kept warm for watch mode
+        self._manifest: Optional[Dict[str, Any]] = None
+        # Watch mode and the daemon: the spec text last parsed, and each path item's
+        # extracted operations, so reload() can re-parse and re-extract only what a save touched
+        self._spec_bytes: Optional[bytes] = None
+        self._path_operations: Optional[Dict[str, List[Dict]]] = None
+        
+    def __getstate__(self):
+        # Executors stay in the parent process
+        state = self.__dict__.copy()
+        state['_render_pool'] = None
+        state['_write_pool'] = None
+        state['sink'] = None
+        state['stats'] = None
+        # Streams do not pickle; workers only need the parsed document
+        state['spec_input'] = None
+        # Keyed by object ids, which mean nothing in another process
+        state['_type_cache'] = {}
+        state['_spec_bytes'] = None
+        state['_path_operations'] = None
+        return state
+    
+    def _load_swagger_file(self, data: Optional[bytes] = None) -> Dict[str, Any]:
+        """Load and parse the Swagger/OpenAPI file (or data read from it), recording how long it took"""
+        with self.stats.phase('load'):
+            if data is not None:
+                document, self.load_source = parse_spec_bytes(data, self.swagger_file)
+            elif self.spec_input is None:
+                load = stream_spec_file if self.streaming else load_spec_file
+                document, self.load_source = load(self.swagger_file, self.cache_dir)
+            elif self.streaming and not isinstance(self.spec_input, dict):
+                document, self.load_source = stream_spec_input(self.spec_input)
             else:
-                return yaml.safe_load(file)
+                document, self.load_source = parse_spec_input(self.spec_input)
+        self.load_seconds = self.stats.phases['load']['wall']
+        return document
+    
+    def _spec_path(self) -> Optional[str]:
+        """The spec file, or None for in-memory specs whose relative $refs resolve from the working directory"""
+        return self.swagger_file if self.spec_input is None else None
+    
+    def _log(self, message: str):
+        """Print a progress message unless the generator is quiet"""
+        if not self.quiet:
+            print(message)
     
     def _extract_base_url(self) -> str:
         """Extract base URL from Swagger spec"""
@@ -50,475 +1674,1003 @@ class NgRxGenerator:
         """Extract parameter names from path like /users/{id}"""
         return re.findall(r'\{([^}]+)\}', path)
     
-    def _get_return_type(self, responses: Dict) -> str:
-        """Extract return type from responses"""
+    def _extract_query_parameters(self, operation: Dict, path_item: Dict,
+                                  base: Optional[str] = None) -> List[Tuple[str, str, bool]]:
+        """Extract (name, TypeScript type, required) for every query parameter of an operation"""
+        merged: Dict[str, Tuple[Dict, Optional[str]]] = {}
+        # Operation-level parameters override path-item ones with the same name
+        for param in path_item.get('parameters', []) + operation.get('parameters', []):
+            param_base = base
+            if '$ref' in param:
+                param_base, param = self.resolver.resolve(param['$ref'], base)
+            if param.get('in') == 'query':
+                merged[param['name']] = (param, param_base)
+        
+        return [
+            (name, self._get_typescript_type(param.get('schema', param), param_base), bool(param.get('required')))
+            for name, (param, param_base) in merged.items()
+        ]
+    
+    def _detect_pagination(self, responses: Dict, base: Optional[str],
+                           query_params: List[Tuple[str, str, bool]]) -> Optional[Dict]:
+        """Recognize `{ items: T[], meta: { page, totalPages | total + limit } }` responses paged by a `page` param"""
+        if 'page' not in {name for name, _, _ in query_params}:
+            return None
+        
+        schema, base = self._get_success_schema(responses, base)
+        if schema and '$ref' in schema:
+            base, schema = self.resolver.resolve(schema['$ref'], base)
+        if not schema or 'properties' not in schema:
+            return None
+        
+        items_field = meta_field = total_field = None
+        items_schema = ''
+        for prop_name, prop in schema['properties'].items():
+            prop_base = base
+            if '$ref' in prop:
+                prop_base, prop = self.resolver.resolve(prop['$ref'], base)
+            if prop.get('type') == 'array' and items_field is None:
+                items_field = prop_name
+                if '$ref' in prop.get('items', {}):
+                    items_schema = self.resolver.schema_name(prop['items']['$ref'], prop_base) or ''
+                continue
+            fields = prop.get('properties', {})
+            if 'page' in fields and meta_field is None:
+                if 'totalPages' in fields:
+                    meta_field, total_field = prop_name, 'totalPages'
+                elif 'total' in fields and 'limit' in fields:
+                    meta_field, total_field = prop_name, 'total'
+        
+        if items_field is None or meta_field is None:
+            return None
+        return {'itemsField': items_field, 'itemsSchema': items_schema, 'metaField': meta_field, 'totalField': total_field}
+    
+    def _get_success_schema(self, responses: Dict, base: Optional[str] = None) -> Tuple[Optional[Dict], Optional[str]]:
+        """Return the JSON schema of the success response and the file it lives in"""
         success_response = responses.get('200', responses.get('201', {}))
+        if '$ref' in success_response:
+            base, success_response = self.resolver.resolve(success_response['$ref'], base)
         if 'content' in success_response:
             content = success_response['content']
             if 'application/json' in content:
-                schema = content['application/json'].get('schema', {})
-                if '$ref' in schema:
-                    return schema['$ref'].split('/')[-1]
-                elif 'type' in schema:
-                    if schema['type'] == 'array' and 'items' in schema:
-                        if '$ref' in schema['items']:
-                            return f"{schema['items']['$ref'].split('/')[-1]}[]"
-                        return 'any[]'
-                    return 'any'
-        return 'any'
+                return content['application/json'].get('schema', {}), base
+        elif 'schema' in success_response:
+            # Swagger 2.0 responses carry the schema directly
+            return success_response['schema'], base
+        return None, base
+    
+    def _get_return_type(self, responses: Dict, base: Optional[str] = None) -> str:
+        """Extract return type from responses"""
+        schema, base = self._get_success_schema(responses, base)
+        if schema is None:
+            return 'any'
+        return self._get_typescript_type(schema, base)
+    
+    def _get_response_shape(self, responses: Dict, base: Optional[str] = None) -> Tuple[str, str]:
+        """Classify the success response as ('item', Schema), ('collection', Schema) or ('', '')"""
+        schema, base = self._get_success_schema(responses, base)
+        if not schema:
+            return '', ''
+        if '$ref' in schema:
+            name = self.resolver.schema_name(schema['$ref'], base)
+            return ('item', name) if name else ('', '')
+        if schema.get('type') == 'array' and '$ref' in schema.get('items', {}):
+            name = self.resolver.schema_name(schema['items']['$ref'], base)
+            return ('collection', name) if name else ('', '')
+        return '', ''
     
     def _extract_operations(self) -> List[Dict]:
         """Extract all operations from Swagger paths"""
-        operations = []
-        
+        return list(self._iter_operations())
+    
+    def _iter_operations(self) -> Iterator[Dict]:
+        """Yield operations one path item at a time; streamed specs decode each item only while it is read"""
+        warm = self._path_operations
         for path, path_item in self.swagger_data.get('paths', {}).items():
-            for method, operation in path_item.items():
-                if method.lower() in ['get', 'post', 'put', 'delete', 'patch']:
-                    operation_id = operation.get('operationId', f"{method}_{path.replace('/', '_').replace('{', '').replace('}', '')}")
-                    
-                    operations.append({
-                        'operationId': operation_id,
-                        'method': method.upper(),
-                        'path': path,
-                        'summary': operation.get('summary', ''),
-                        'parameters': self._extract_path_parameters(path),
-                        'requestBody': 'requestBody' in operation,
-                        'returnType': self._get_return_type(operation.get('responses', {})),
-                        'tags': operation.get('tags', ['default'])
-                    })
-        
-        return operations
-    
-    def generate_models(self):
-        """Generate TypeScript interfaces from Swagger components/definitions"""
-        components = self.swagger_data.get('components', {}).get('schemas', {})
-        if not components:
-            components = self.swagger_data.get('definitions', {})
+            if warm is None:
+                yield from self._path_item_operations(path, path_item)
+            else:
+                if path not in warm:
+                    warm[path] = list(self._path_item_operations(path, path_item))
+                yield from warm[path]
+            # Cached types would keep every decoded path item alive
+            if self.streaming:
+                self._type_cache = {}
+    
+    def _path_item_operations(self, path: str, path_item: Dict[str, Any]) -> Iterator[Dict]:
+        """Extract the operations of one path item"""
+        base = None
+        if '$ref' in path_item:
+            base, path_item = self.resolver.resolve(path_item['$ref'])
+        for method, operation in path_item.items():
+            if method.lower() in ['get', 'post', 'put', 'delete', 'patch']:
+                operation_id = operation.get('operationId', f"{method}_{path.replace('/', '_').replace('{', '').replace('}', '')}")
+                
+                response_kind, response_schema = self._get_response_shape(operation.get('responses', {}), base)
+                query_params = self._extract_query_parameters(operation, path_item, base)
+                
+                yield {
+                    'operationId': operation_id,
+                    'method': method.upper(),
+                    'path': path,
+                    'summary': operation.get('summary', ''),
+                    'parameters': self._extract_path_parameters(path),
+                    'queryParams': query_params,
+                    'pagination': self._detect_pagination(operation.get('responses', {}), base, query_params),
+                    'requestBody': 'requestBody' in operation,
+                    'returnType': self._get_return_type(operation.get('responses', {}), base),
+                    'responseKind': response_kind,
+                    'responseSchema': response_schema,
+                    'flattening': operation.get('x-ngrx-flattening'),
+                    'batch': operation.get('x-ngrx-batch'),
+                    'tags': operation.get('tags', ['default'])
+                }
+    
+    def _build_operation_index(self, operations: Iterable[Dict]) -> OperationIndex:
+        """Group operations by tag and resolve names, params and URLs exactly once"""
+        records = []
+        grouped: Dict[str, List[OperationRecord]] = {}
+        batch_specs: Dict[str, Any] = {}
         
-        if not components:
-            return
+        for op in operations:
+            tag = op['tags'][0] if op['tags'] else 'default'
+            parameters = tuple(op['parameters'])
+            
+            action_props = []
+            if parameters:
+                action_props.append(f"{', '.join(parameters)}: string")
+            if op['requestBody']:
+                action_props.append("payload: any")
+            
+            service_params = [f"{param}: string" for param in parameters]
+            call_args = [f"action.{param}" for param in parameters]
+            if op['requestBody']:
+                service_params.append("payload: any")
+                call_args.append("action.payload")
+            
+            query_params = tuple(tuple(param) for param in op.get('queryParams', ()))
+            params_type = ''
+            if query_params:
+                params_type = f"{self._to_pascal_case(op['operationId'])}Params"
+                # Optional unless the spec requires one of them
+                optional = '' if any(required for _, _, required in query_params) else '?'
+                action_props.append(f"params{optional}: {params_type}")
+                service_params.append(f"params: {params_type}" + (" = {}" if optional else ""))
+                call_args.append("action.params")
+            
+            url = f"`${{this.baseUrl}}{op['path']}`"
+            for param in parameters:
+                url = url.replace(f"{{{param}}}", f"${{{param}}}")
+            
+            flattening, debounce, concurrency = self._resolve_flattening(op)
+            
+            record = OperationRecord(
+                operation_id=op['operationId'],
+                name=self._to_camel_case(op['operationId']),
+                pascal=self._to_pascal_case(op['operationId']),
+                method=op['method'],
+                path=op['path'],
+                summary=op['summary'],
+                parameters=parameters,
+                request_body=op['requestBody'],
+                return_type=op['returnType'],
+                response_kind=op.get('responseKind', ''),
+                response_schema=op.get('responseSchema', ''),
+                tag=tag,
+                action_props='; '.join(action_props),
+                service_params=', '.join(service_params),
+                call_args=', '.join(call_args),
+                url=url,
+                flattening=flattening,
+                debounce=debounce,
+                concurrency=concurrency,
+                query_params=query_params,
+                params_type=params_type,
+                pagination=PaginationInfo(
+                    items_field=op['pagination']['itemsField'],
+                    items_schema=op['pagination'].get('itemsSchema', ''),
+                    meta_field=op['pagination']['metaField'],
+                    total_field=op['pagination']['totalField'],
+                ) if op.get('pagination') else None,
+            )
+            records.append(record)
+            grouped.setdefault(tag, []).append(record)
+            batch = self.batch_endpoints.get(op['operationId'], op.get('batch'))
+            if batch:
+                batch_specs[record.name] = batch
         
-        models_dir = self.output_dir / "models"
-        models_dir.mkdir(parents=True, exist_ok=True)
+        tags = {}
+        # Built once, since the model map scans every schema
+        models = self._get_models()
+        for tag, tag_records in grouped.items():
+            entity = self._detect_entity(tag, tag_records) if self.entity_adapters else None
+            tags[tag] = TagGroup(
+                tag=tag,
+                pascal=self._to_pascal_case(tag),
+                camel=self._to_camel_case(tag),
+                lower=tag.lower(),
+                operations=tuple(tag_records),
+                entity=entity,
+                indexes=self._detect_indexes(tag_records, entity, models),
+                batches=self._resolve_batches(tag_records, batch_specs),
+            )
+        return OperationIndex(records, tags)
+    
+    def _resolve_flattening(self, op: Dict) -> Tuple[str, int, int]:
+        """Pick the effect's flattening operator, debounce (ms) and mergeMap concurrency"""
+        override = op.get('flattening') or {}
+        if isinstance(override, str):
+            override = {'operator': override}
         
-        # Generate barrel export
-        index_exports = []
+        method = op['method'].upper()
+        operator = override.get('operator') or self.flattening
+        if operator == 'auto':
+            words = ' '.join(OPERATION_WORD_PATTERN.findall(op['operationId'])).lower()
+            if method != 'GET' and AUTH_OPERATION_PATTERN.search(words):
+                # A second login click must not start a second session
+                operator = 'exhaustMap'
+            elif method == 'GET':
+                operator = 'switchMap'
+            else:
+                operator = 'concatMap'
+        if operator not in FLATTENING_OPERATORS:
+            raise ValueError(f"Unknown flattening operator '{operator}' for {op['operationId']} "
+                             f"(expected one of {', '.join(FLATTENING_OPERATORS)})")
         
-        for model_name, schema in components.items():
-            model_content = self._generate_model_interface(model_name, schema)
-            model_file = models_dir / f"{model_name.lower()}.model.ts"
+        # Debouncing writes would drop them, so the CLI default only applies to reads
+        debounce = int(override.get('debounce', self.effect_debounce if method == 'GET' else 0))
+        concurrency = int(override.get('concurrency', self.merge_concurrency)) if operator == 'mergeMap' else 0
+        return operator, debounce, concurrency
+    
+    def _resolve_batches(self, records: List[OperationRecord], specs: Dict[str, Any]) -> Tuple[BatchInfo, ...]:
+        """Check each batched item operation against its bulk operation and resolve how to call it"""
+        batches = []
+        for op in records:
+            spec = specs.get(op.name)
+            if not spec:
+                continue
+            if isinstance(spec, str):
+                spec = {'operation': spec}
+            where = f"x-ngrx-batch of {op.operation_id}"
+            target = spec.get('operation')
+            bulk = next((record for record in records if target in (record.operation_id, record.name)), None)
+            if bulk is None:
+                raise ValueError(f"{where}: no operation '{target}' in tag '{op.tag}'")
+            if op.method != 'GET' or len(op.parameters) != 1 or op.response_kind != 'item':
+                raise ValueError(f"{where}: only GETs with one path parameter that return a schema can be batched")
+            if bulk.response_kind != 'collection' or bulk.response_schema != op.response_schema or bulk.parameters:
+                raise ValueError(f"{where}: {bulk.operation_id} must return a list of {op.response_schema} "
+                                 f"and take no path parameters")
+            
+            # Ids go in the named (or first array) query parameter, else in the request body
+            query_types = {name: ts_type for name, ts_type, _ in bulk.query_params}
+            arrays = [name for name, ts_type in query_types.items() if ts_type.endswith('[]')]
+            param = spec.get('param') or (arrays[0] if arrays else None)
+            if param is not None:
+                if param not in query_types:
+                    raise ValueError(f"{where}: {bulk.operation_id} has no query parameter '{param}'")
+                key = param if TS_IDENTIFIER.match(param) else json.dumps(param)
+                value = 'ids.map(Number)' if query_types[param] == 'number[]' else 'ids'
+                call = '{ ids }' if key == value else f"{{ {key}: {value} }}"
+            elif bulk.request_body:
+                call = 'ids'
+            else:
+                raise ValueError(f"{where}: {bulk.operation_id} takes neither an array query parameter nor a body")
             
-            with open(model_file, 'w') as f:
-                f.write(model_content)
+            # Results are matched back to the requested ids by the schema's own key
+            schema_name = op.response_schema
+            model = self._get_models().get(schema_name)
+            properties = model[1].get('properties', {}) if model else {}
+            candidates = ('id', f"{schema_name[:1].lower()}{schema_name[1:]}Id")
+            id_field = spec.get('key') or next((field for field in candidates if field in properties), None)
+            if id_field is None:
+                raise ValueError(f"{where}: set 'key' to the {schema_name} property holding the id")
             
-            index_exports.append(f"export * from './{model_name.lower()}.model';")
+            batches.append(BatchInfo(
+                operation=op.name,
+                param=op.parameters[0],
+                bulk=bulk.name,
+                call=call,
+                key=f"item.{id_field}" if TS_IDENTIFIER.match(id_field) else f"item[{json.dumps(id_field)}]",
+                window=int(spec.get('window', self.batch_window)),
+                max_size=int(spec.get('maxSize', BATCH_MAX_SIZE)),
+            ))
+        return tuple(batches)
+    
+    def _detect_entity(self, tag: str, records: List[OperationRecord]) -> Optional[EntityInfo]:
+        """Pick the schema returned both as a collection and as an item within a tag"""
+        # Pages of a paginated wrapper count as lists of their items
+        collections = [op.response_schema for op in records if op.response_kind == 'collection']
+        collections += [op.pagination.items_schema for op in records
+                        if op.pagination is not None and op.pagination.items_schema]
+        items = {op.response_schema for op in records if op.response_kind == 'item'}
+        models = self._get_models()
         
-        # Create index.ts for barrel exports
-        with open(models_dir / "index.ts", 'w') as f:
-            f.write('\n'.join(index_exports))
+        for schema_name in collections:
+            if schema_name not in items or schema_name not in models:
+                continue
+            properties = models[schema_name][1].get('properties', {})
+            # Only the entity's own key works as an id; foreign keys like userId do not
+            for id_field in ('id', f"{schema_name[:1].lower()}{schema_name[1:]}Id"):
+                if id_field in properties:
+                    return EntityInfo(
+                        schema=schema_name,
+                        id_field=id_field,
+                        adapter=f"{self._to_camel_case(tag)}Adapter",
+                    )
+        return None
     
-    def _generate_model_interface(self, model_name: str, schema: Dict) -> str:
-        """Generate TypeScript interface from schema"""
-        interface_lines = [f"export interface {model_name} {{"]
+    def _detect_indexes(self, records: List[OperationRecord], entity: Optional[EntityInfo],
+                        models: Mapping) -> Tuple[IndexInfo, ...]:
+        """Lookup selectors for x-ngrx-index properties of the entity and of other list responses"""
+        sources = []
+        if entity is not None:
+            sources.append((entity.schema, entity.schema, f"selectAll{entity.schema}"))
+        for op in records:
+            if op.response_kind == 'collection' and op.pagination is None and (
+                    entity is None or op.response_schema != entity.schema):
+                sources.append((op.response_schema, op.pascal, f"select{op.pascal}Data"))
+        if not sources:
+            return ()
         
-        properties = schema.get('properties', {})
-        required = schema.get('required', [])
+        indexes = []
+        for schema_name, name, source in sources:
+            if schema_name not in models:
+                continue
+            base, schema = models[schema_name]
+            for prop_name, prop_schema in (schema.get('properties') or {}).items():
+                kind = prop_schema.get(INDEX_EXTENSION) if isinstance(prop_schema, dict) else None
+                if kind is None or kind is False:
+                    continue
+                if kind not in INDEX_KINDS:
+                    raise ValueError(f"Unknown {INDEX_EXTENSION} value {kind!r} on {schema_name}.{prop_name} "
+                                     f"(expected true, 'group' or 'unique')")
+                identifier = TS_IDENTIFIER.match(prop_name)
+                indexes.append(IndexInfo(
+                    name=name,
+                    source=source,
+                    field=prop_name,
+                    accessor=f"item.{prop_name}" if identifier else f"item[{json.dumps(prop_name)}]",
+                    by=_pascal_identifier(prop_name),
+                    unique=INDEX_KINDS[kind],
+                    key_type=self._get_typescript_type(prop_schema, base),
+                ))
+        return tuple(indexes)
+    
+    def _as_index(self, operations) -> OperationIndex:
+        """Accept either a prebuilt index or a raw operation list from _extract_operations"""
+        if isinstance(operations, OperationIndex):
+            return operations
+        return self._build_operation_index(operations)
+    
+    def _get_schemas(self) -> Dict[str, Any]:
+        """Return components/schemas (OpenAPI 3) or definitions (Swagger 2)"""
+        components = self.swagger_data.get('components', {}).get('schemas', {})
+        if not components:
+            components = self.swagger_data.get('definitions', {})
+        return components or {}
+    
+    def _get_models(self) -> Mapping:
+        """All schemas to emit as models: local ones plus named schemas from referenced files
         
-        for prop_name, prop_schema in properties.items():
-            optional = '' if prop_name in required else '?'
-            prop_type = self._get_typescript_type(prop_schema)
-            interface_lines.append(f"  {prop_name}{optional}: {prop_type};")
+        Values are (file the schema lives in, schema); None is the root spec.
+        Schemas are looked up on access, so streamed specs decode them one at a time.
+        """
+        local = self._get_schemas()
+        external = [
+            name for name in self.schema_dependencies()
+            if name not in local and name in self.resolver.external_schemas
+        ]
+        return _ModelMap(local, external, self.resolver.external_schemas)
+    
+    def _collect_refs(self, node: Any, base: Optional[str], names: set, visited: set):
+        """Collect named schemas referenced anywhere below node, looking through anonymous refs"""
+        if isinstance(node, dict):
+            if '$ref' in node:
+                name = self.resolver.schema_name(node['$ref'], base)
+                if name:
+                    names.add(name)
+                else:
+                    target = self.resolver.split(node['$ref'], base)
+                    if target not in visited:
+                        visited.add(target)
+                        target_base, target_node = self.resolver.resolve(node['$ref'], base)
+                        self._collect_refs(target_node, target_base, names, visited)
+            for key, value in node.items():
+                if key != '$ref':
+                    self._collect_refs(value, base, names, visited)
+        elif isinstance(node, list):
+            for value in node:
+                self._collect_refs(value, base, names, visited)
+    
+    def schema_dependencies(self) -> Dict[str, set]:
+        """Schema dependency graph (name -> directly referenced schema names), built once per run"""
+        if self._schema_graph is not None:
+            return self._schema_graph
         
-        interface_lines.append("}")
+        graph: Dict[str, set] = {}
+        # Lazy, so streamed schemas are decoded one at a time
+        pending: Iterable = ((name, None, schema) for name, schema in self._get_schemas().items())
+        while pending:
+            for name, base, schema in pending:
+                if name not in graph:
+                    graph[name] = set()
+                    self._collect_refs(schema, base, graph[name], set())
+            # External schemas discovered along the way are walked too
+            pending = [
+                (name, base, schema) for name, (base, schema) in self.resolver.external_schemas.items()
+                if name not in graph
+            ]
         
-        return '\n'.join(interface_lines)
+        self._schema_graph = graph
+        return graph
     
-    def _get_typescript_type(self, schema: Dict) -> str:
-        """Convert OpenAPI schema type to TypeScript type"""
-        if '$ref' in schema:
-            return schema['$ref'].split('/')[-1]
+    def _operation_refs(self) -> Dict[str, set]:
+        """Tag -> named schemas its operations reference through parameters, bodies and responses"""
+        refs: Dict[str, set] = {}
+        for path_item in self.swagger_data.get('paths', {}).values():
+            base = None
+            if '$ref' in path_item:
+                base, path_item = self.resolver.resolve(path_item['$ref'])
+            shared: set = set()
+            self._collect_refs(path_item.get('parameters', []), base, shared, set())
+            for method, operation in path_item.items():
+                if method.lower() in ['get', 'post', 'put', 'delete', 'patch']:
+                    tags = operation.get('tags', ['default'])
+                    names = refs.setdefault(tags[0] if tags else 'default', set())
+                    names |= shared
+                    self._collect_refs(operation, base, names, set())
+        return refs
+    
+    def _write_output(self, path: Path, content: str):
+        """Hand a generated file to the output sink"""
+        self.sink.write(path, content)
+    
+    @contextmanager
+    def _worker_pools(self):
+        """Render on a process pool and write on a bounded thread pool while --jobs > 1"""
+        if self.jobs == 1:
+            yield
+            return
         
-        schema_type = schema.get('type', 'any')
+        # Compile before the pool starts so workers receive the code objects instead of recompiling
+        self.templates.load()
+        with ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_render_worker,
+                                 initargs=(self,)) as render_pool, \
+                ThreadPoolExecutor(max_workers=min(self.jobs, MAX_WRITER_THREADS)) as write_pool:
+            self._render_pool, self._write_pool = render_pool, write_pool
+            try:
+                yield
+            finally:
+                self._render_pool, self._write_pool = None, None
+    
+    def _render_many(self, method_name: str, items: List[tuple]) -> List[str]:
+        """Call a pure _generate_* renderer for every argument tuple, keeping input order"""
+        if self._render_pool is None or len(items) < 2:
+            results = [_timed_render(self, method_name, args) for args in items]
+        else:
+            chunksize = max(1, len(items) // (self.jobs * 4))
+            results = list(self._render_pool.map(_render_in_worker, repeat(method_name), items, chunksize=chunksize))
         
-        type_mapping = {
-            'string': 'string',
-            'integer': 'number',
-            'number': 'number',
-            'boolean': 'boolean',
-            'object': 'any'
-        }
+        kind = RENDER_KINDS.get(method_name, method_name)
+        for args, (_, seconds) in zip(items, results):
+            key = args[0].tag if isinstance(args[0], TagGroup) else str(args[0])
+            self.stats.record_render(kind, key, seconds)
+        return [content for content, _ in results]
+    
+    def _write_many(self, outputs: List[tuple]):
+        """Write (path, content) pairs, concurrently when a writer pool is active"""
+        if self._write_pool is None:
+            for path, content in outputs:
+                self._write_output(path, content)
+            return
+        
+        # list() surfaces the first write error
+        list(self._write_pool.map(lambda output: self._write_output(*output), outputs))
+    
+    def _tag_file(self, lower: str, subdir: str, suffix: str) -> Path:
+        """Where a tag's file of one kind lives in the selected layout"""
+        if self.layout == 'feature':
+            return self.output_dir / FEATURES_DIR / lower / f"{lower}.{suffix}.ts"
+        return self.output_dir / subdir / f"{lower}.{suffix}.ts"
+    
+    def _tag_files(self, lower: str) -> List[str]:
+        """Output paths, relative to the output directory, of everything generated for one tag"""
+        kinds = TAG_FILE_KINDS + ((('features', 'feature'),) if self.layout == 'feature' else ())
+        return [self._tag_file(lower, subdir, suffix).relative_to(self.output_dir).as_posix()
+                for subdir, suffix in kinds]
+    
+    def _tag_import(self, lower: str, subdir: str, suffix: str) -> str:
+        """Import specifier of a tag's file as seen from another file of the same tag"""
+        if self.layout == 'feature':
+            return f"./{lower}.{suffix}"
+        return f"../{subdir}/{lower}.{suffix}"
+    
+    def _shared_file(self, subdir: str, name: str) -> Path:
+        """Where a file shared by every tag lives; the feature layout gathers them in shared/"""
+        return self.output_dir / (SHARED_DIR if self.layout == 'feature' else subdir) / f"{name}.ts"
+    
+    def _shared_import(self, from_subdir: str, subdir: str, name: Optional[str] = None) -> str:
+        """Import specifier of models or a shared file as seen from a tag's file in from_subdir"""
+        if self.layout == 'feature':
+            target = subdir if name is None else f"{SHARED_DIR}/{name}"
+            return f"../../{target}"
+        if name is None:
+            return f"../{subdir}"
+        return f"./{name}" if subdir == from_subdir else f"../{subdir}/{name}"
+    
+    def generate_models(self, schema_names: Optional[set] = None):
+        """Generate TypeScript interfaces from Swagger components/definitions
+        
+        When schema_names is given only those model files are rendered; the
+        barrel always lists every schema.
+        """
+        components = self._get_models()
+        
+        if not components:
+            return
+        
+        models_dir = self.output_dir / "models"
+        
+        if self.compact_models:
+            self._generate_compact_models(components, models_dir)
+            return
+        
+        selected = (
+            (model_name, schema, base) for model_name, (base, schema) in components.items()
+            if (schema_names is None or model_name in schema_names) and model_name not in self.shared_models
+        )
+        # Streamed specs decode and render a bounded number of schemas at a time
+        chunk_size = STREAM_CHUNK_SIZE if self.streaming else None
+        while True:
+            chunk = list(islice(selected, chunk_size))
+            if not chunk:
+                break
+            model_contents = self._render_many('_generate_model_interface', chunk)
+            self._write_many([
+                (models_dir / f"{model_name.lower()}.model.ts", model_content)
+                for (model_name, _, _), model_content in zip(chunk, model_contents)
+            ])
+            if self.streaming:
+                self._type_cache = {}
         
-        if schema_type == 'array':
-            items = schema.get('items', {})
-            item_type = self._get_typescript_type(items)
-            return f"{item_type}[]"
+        # Models emitted once in a batch's shared package replace any local copy
+        for model_name in self.shared_models:
+            self.sink.remove(f"models/{model_name.lower()}.model.ts")
         
-        return type_mapping.get(schema_type, 'any')
+        # Create index.ts for barrel exports
+        index_exports = [
+            f"export * from '{self.shared_models[model_name]}';" if model_name in self.shared_models
+            else f"export * from './{model_name.lower()}.model';"
+            for model_name in components
+        ]
+        self._write_output(models_dir / "index.ts", '\n'.join(index_exports))
     
-    def generate_actions(self, operations: List[Dict]):
-        """Generate NgRx actions"""
-        actions_dir = self.output_dir / "actions"
-        actions_dir.mkdir(parents=True, exist_ok=True)
+    def _model_file(self, owner: str) -> str:
+        """Stem of the compact models file holding a model and the shapes hoisted out of it"""
+        if not self.model_files:
+            return f"{owner.lower()}.model"
+        if self.model_files == 1:
+            return "models"
+        # Hash-based so adding a schema does not move the others
+        return f"models-{int(_content_hash(owner)[:8], 16) % self.model_files + 1}"
+    
+    def _generate_compact_models(self, components: Mapping, models_dir: Path):
+        """Emit every distinct shape once, with imports across model files
         
-        # Group operations by tags
-        grouped_operations = {}
-        for op in operations:
-            tag = op['tags'][0] if op['tags'] else 'default'
-            if tag not in grouped_operations:
-                grouped_operations[tag] = []
-            grouped_operations[tag].append(op)
+        Hoisting spans schemas, so all model files are rendered together;
+        unchanged files are left alone by the sink.
+        """
+        declarations = _CompactModels(self, components).declarations
         
-        for tag, tag_operations in grouped_operations.items():
-            actions_content = self._generate_actions_content(tag, tag_operations)
-            actions_file = actions_dir / f"{tag.lower()}.actions.ts"
-            
-            with open(actions_file, 'w') as f:
-                f.write(actions_content)
+        files: Dict[str, List[str]] = {}
+        for name, (owner, _, _, _) in declarations.items():
+            files.setdefault(self._model_file(owner), []).append(name)
+        
+        items = []
+        for stem, names in files.items():
+            imports: Dict[str, set] = {}
+            for name in names:
+                for ref in declarations[name][3]:
+                    if ref in self.shared_models:
+                        imports.setdefault(self.shared_models[ref], set()).add(ref)
+                    elif ref in declarations and self._model_file(declarations[ref][0]) != stem:
+                        imports.setdefault(f"./{self._model_file(declarations[ref][0])}", set()).add(ref)
+            items.append((
+                [(source, sorted(refs)) for source, refs in sorted(imports.items())],
+                [(name, declarations[name][1], declarations[name][2]) for name in names],
+            ))
+        contents = self._render_many('_generate_model_file', items)
+        self._write_many([(models_dir / f"{stem}.ts", content) for stem, content in zip(files, contents)])
+        
+        # Files of schemas that were removed or merged into a group
+        for file_name in self.sink.list_files(models_dir):
+            if file_name.endswith('.ts') and file_name != "index.ts" and file_name[:-3] not in files:
+                self.sink.remove(f"models/{file_name}")
+        
+        exports = []
+        for model_name in components:
+            source = self.shared_models.get(model_name) or f"./{self._model_file(model_name)}"
+            if source not in exports:
+                exports.append(source)
+        if self.model_files:
+            exports.sort()
+        self._write_output(models_dir / "index.ts", '\n'.join(f"export * from '{source}';" for source in exports))
     
-    def _generate_actions_content(self, tag: str, operations: List[Dict]) -> str:
-        """Generate actions content for a specific tag"""
-        tag_pascal = self._to_pascal_case(tag)
+    def _generate_model_file(self, imports: List[Tuple[str, List[str]]],
+                             declarations: List[Tuple[str, Optional[str], Optional[List]]]) -> str:
+        """Render one compact models file"""
+        return self.templates.render('models', imports=imports, declarations=declarations)
+    
+    def schema_fingerprints(self) -> Dict[str, str]:
+        """Structural hash of every model, covering the models it references
         
-        content = [
-            "import { createAction, props } from '@ngrx/store';",
-            "",
-            f"// {tag_pascal} Actions",
-            ""
-        ]
+        Named $refs are replaced by the target's own fingerprint, so two specs
+        give a schema the same fingerprint only when it and everything it
+        references render identically.
+        """
+        models = self._get_models()
+        fingerprints: Dict[str, str] = {}
+        in_progress: set = set()
         
-        for op in operations:
-            op_name = self._to_camel_case(op['operationId'])
-            op_pascal = self._to_pascal_case(op['operationId'])
-            
-            # Start action
-            params = []
-            if op['parameters']:
-                params.append(f"{', '.join(op['parameters'])}: string")
-            if op['requestBody']:
-                params.append("payload: any")
-            
-            if params:
-                content.append(f"export const {op_name} = createAction(")
-                content.append(f"  '[{tag_pascal}] {op_pascal}',")
-                content.append(f"  props<{{ {'; '.join(params)} }}>()")
-                content.append(");")
-            else:
-                content.append(f"export const {op_name} = createAction('[{tag_pascal}] {op_pascal}');")
-            
-            # Success action
-            content.append(f"export const {op_name}Success = createAction(")
-            content.append(f"  '[{tag_pascal}] {op_pascal} Success',")
-            content.append(f"  props<{{ data: {op['returnType']} }}>()")
-            content.append(");")
-            
-            # Failure action
-            content.append(f"export const {op_name}Failure = createAction(")
-            content.append(f"  '[{tag_pascal}] {op_pascal} Failure',")
-            content.append("  props<{ error: any }>()")
-            content.append(");")
-            content.append("")
+        def canonical(node: Any, base: Optional[str], visited: frozenset) -> Any:
+            if isinstance(node, dict):
+                if '$ref' in node:
+                    name = self.resolver.schema_name(node['$ref'], base)
+                    if name:
+                        return {'$ref': [name, fingerprint(name)]}
+                    target = self.resolver.split(node['$ref'], base)
+                    if target in visited:
+                        return {'$ref': list(target)}
+                    target_base, target_node = self.resolver.resolve(node['$ref'], base)
+                    return canonical(target_node, target_base, visited | {target})
+                return {key: canonical(value, base, visited) for key, value in node.items()}
+            if isinstance(node, list):
+                return [canonical(value, base, visited) for value in node]
+            return node
+        
+        def fingerprint(name: str) -> str:
+            if name in fingerprints:
+                return fingerprints[name]
+            # Back-edges of recursive schemas and unknown targets contribute their name only
+            if name in in_progress or name not in models:
+                return name
+            in_progress.add(name)
+            base, schema = models[name]
+            fingerprints[name] = _fragment_hash([name, canonical(schema, base, frozenset())])
+            in_progress.discard(name)
+            return fingerprints[name]
+        
+        for name in models:
+            fingerprint(name)
+        return fingerprints
+    
+    def _generate_model_interface(self, model_name: str, schema: Dict, base: Optional[str] = None) -> str:
+        """Generate TypeScript interface from schema"""
+        # Compositions, refs and non-object schemas become type aliases
+        if ('properties' not in schema and
+                (any(key in schema for key in ('allOf', 'oneOf', 'anyOf', '$ref'))
+                 or schema.get('type', 'object') != 'object')):
+            alias = 'unknown' if self._circular_alias(model_name, schema, base) else self._get_typescript_type(schema, base)
+            return self.templates.render('model', model_name=model_name, alias=alias, properties=None)
         
-        return '\n'.join(content)
+        properties = _ts_fields(schema, base, lambda node, node_base, label: self._get_typescript_type(node, node_base))
+        return self.templates.render('model', model_name=model_name, alias=None, properties=properties)
     
-    def generate_effects(self, operations: List[Dict]):
-        """Generate NgRx effects"""
-        effects_dir = self.output_dir / "effects"
-        effects_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Group operations by tags
-        grouped_operations = {}
-        for op in operations:
-            tag = op['tags'][0] if op['tags'] else 'default'
-            if tag not in grouped_operations:
-                grouped_operations[tag] = []
-            grouped_operations[tag].append(op)
+    def _circular_alias(self, model_name: str, schema: Dict, base: Optional[str]) -> bool:
+        """Whether a $ref-only model never reaches a concrete schema, in which case a warning is logged"""
+        if set(schema) != {'$ref'} or not self.resolver.circular(schema['$ref'], base):
+            return False
+        self._log(f"⚠️  Model {model_name} never reaches a schema through its circular $ref chain; emitted as unknown")
+        return True
+    
+    def _get_typescript_type(self, schema: Dict, base: Optional[str] = None) -> str:
+        """Convert OpenAPI schema type to TypeScript type, memoized per schema node"""
+        key = (id(schema), base)
+        cached = self._type_cache.get(key)
+        if cached is not None and cached[0] is schema:
+            return cached[1]
         
-        for tag, tag_operations in grouped_operations.items():
-            effects_content = self._generate_effects_content(tag, tag_operations)
-            effects_file = effects_dir / f"{tag.lower()}.effects.ts"
-            
-            with open(effects_file, 'w') as f:
-                f.write(effects_content)
+        # Entries keep the node alive so its id cannot be reused; the placeholder
+        # guards against anonymous refs that point back at themselves
+        self._type_cache[key] = (schema, 'any')
+        ts_type = self._convert_typescript_type(schema, base)
+        self._type_cache[key] = (schema, ts_type)
+        return ts_type
+    
+    def _convert_typescript_type(self, schema: Dict, base: Optional[str]) -> str:
+        """Uncached body of _get_typescript_type; the same rules as compact models without hoisting"""
+        if not isinstance(schema, dict):
+            return 'any'
+        if '$ref' in schema:
+            name = self.resolver.schema_name(schema['$ref'], base)
+            if name:
+                return name
+            target_base, target = self.resolver.resolve(schema['$ref'], base)
+            return self._get_typescript_type(target, target_base)
+        return _ts_type(schema, base, lambda node, node_base, label: self._get_typescript_type(node, node_base))
+    
+    def generate_actions(self, operations: Union[OperationIndex, List[Dict]]):
+        """Generate NgRx actions"""
+        groups = list(self._as_index(operations))
+        contents = self._render_many('_generate_actions_content', [(group,) for group in groups])
+        self._write_many([
+            (self._tag_file(group.lower, 'actions', 'actions'), content) for group, content in zip(groups, contents)
+        ])
+    
+    def _generate_actions_content(self, group: TagGroup) -> str:
+        """Generate actions content for a specific tag"""
+        return self.templates.render(
+            'actions', group=group, tag_import=self._tag_import,
+            params_types=[op.params_type for op in group.operations if op.params_type],
+            keyed=self._selector_keys(group), removes=self._entity_removals(group),
+        )
+    
+    def generate_effects(self, operations: Union[OperationIndex, List[Dict]]):
+        """Generate NgRx effects"""
+        groups = list(self._as_index(operations))
+        contents = self._render_many('_generate_effects_content', [(group,) for group in groups])
+        self._write_many([
+            (self._tag_file(group.lower, 'effects', 'effects'), content) for group, content in zip(groups, contents)
+        ])
     
-    def _generate_effects_content(self, tag: str, operations: List[Dict]) -> str:
+    def _generate_effects_content(self, group: TagGroup) -> str:
         """Generate effects content for a specific tag"""
-        tag_pascal = self._to_pascal_case(tag)
-        tag_camel = self._to_camel_case(tag)
-        
-        content = [
-            "import { Injectable } from '@angular/core';",
-            "import { Actions, createEffect, ofType } from '@ngrx/effects';",
-            "import { of } from 'rxjs';",
-            "import { catchError, map, switchMap } from 'rxjs/operators';",
-            f"import {{ {tag_pascal}Service }} from '../services/{tag.lower()}.service';",
-            f"import * as {tag_pascal}Actions from '../actions/{tag.lower()}.actions';",
-            "",
-            "@Injectable()",
-            f"export class {tag_pascal}Effects {{",
-            "",
-            f"  constructor(",
-            f"    private actions$: Actions,",
-            f"    private {tag_camel}Service: {tag_pascal}Service",
-            f"  ) {{}}",
-            ""
-        ]
+        # Batched operations buffer their actions and fan one bulk response out per id
+        batches = {batch.operation: batch for batch in group.batches}
+        single = [op for op in group.operations if op.name not in batches]
         
-        for op in operations:
-            op_name = self._to_camel_case(op['operationId'])
-            op_pascal = self._to_pascal_case(op['operationId'])
-            
-            content.extend([
-                f"  {op_name}$ = createEffect(() =>",
-                f"    this.actions$.pipe(",
-                f"      ofType({tag_pascal}Actions.{op_name}),",
-                f"      switchMap((action) =>",
-                f"        this.{tag_camel}Service.{op_name}(",
-            ])
-            
-            # Add parameters
-            params = []
-            if op['parameters']:
-                params.extend([f"action.{param}" for param in op['parameters']])
-            if op['requestBody']:
-                params.append("action.payload")
-            
-            if params:
-                content.append(f"          {', '.join(params)}")
-            
-            content.extend([
-                f"        ).pipe(",
-                f"          map((data) => {tag_pascal}Actions.{op_name}Success({{ data }})),",
-                f"          catchError((error) => of({tag_pascal}Actions.{op_name}Failure({{ error }})))",
-                f"        )",
-                f"      )",
-                f"    )",
-                f"  );",
-                ""
-            ])
+        operators = {'catchError'} | {op.flattening for op in single}
+        if single:
+            operators.add('map')
+        if batches:
+            operators |= {'buffer', 'exhaustMap', 'mergeMap', 'share'}
+        if any(op.debounce for op in single):
+            operators.add('debounceTime')
         
-        content.append("}")
+        # Next-page effects call the service again with the last request and the following page
+        next_page_args = {}
+        for op in group.operations:
+            if op.pagination is None:
+                continue
+            request = f"state.{op.name}Request!"
+            args = [f"{request}.{param}" for param in op.parameters]
+            if op.request_body:
+                args.append(f"{request}.payload")
+            args.append(f"{{ ...{request}.params, page: (state.{op.name}Page ?? 0) + 1 }}")
+            next_page_args[op.name] = ', '.join(args)
+        if next_page_args:
+            operators |= {'exhaustMap', 'filter', 'withLatestFrom'}
         
-        return '\n'.join(content)
+        return self.templates.render(
+            'effects', group=group, tag_import=self._tag_import,
+            operators=sorted(operators), next_page_args=next_page_args,
+            keyed=self._selector_keys(group, 'action.'), removes=self._entity_removals(group, 'action.'),
+            batches=batches,
+        )
+    
+    def _selector_keys(self, group: TagGroup, prefix: str = '') -> Dict[str, str]:
+        """Key expression of each GET whose responses are also kept per path parameters (--selector-factories)"""
+        if not self.selector_factories:
+            return {}
+        keys = {}
+        for op in group.operations:
+            if op.method != 'GET' or not op.parameters or op.pagination is not None:
+                continue
+            params = [f"{prefix}{param}" for param in op.parameters]
+            keys[op.name] = params[0] if len(params) == 1 else f"[{', '.join(params)}].join('/')"
+        return keys
+    
+    def _entity_removals(self, group: TagGroup, prefix: str = '') -> Dict[str, str]:
+        """Id expression of each DELETE on the entity's item path, whose success removes the entity"""
+        if group.entity is None:
+            return {}
+        item_paths = {op.path for op in group.operations if group.entity_role(op) == 'item'}
+        return {
+            op.name: f"{prefix}{op.parameters[-1]}" for op in group.operations
+            if op.method == 'DELETE' and op.parameters and op.path in item_paths
+        }
     
-    def generate_reducers(self, operations: List[Dict]):
+    def generate_reducers(self, operations: Union[OperationIndex, List[Dict]]):
         """Generate NgRx reducers"""
-        reducers_dir = self.output_dir / "reducers"
-        reducers_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Group operations by tags
-        grouped_operations = {}
-        for op in operations:
-            tag = op['tags'][0] if op['tags'] else 'default'
-            if tag not in grouped_operations:
-                grouped_operations[tag] = []
-            grouped_operations[tag].append(op)
-        
-        for tag, tag_operations in grouped_operations.items():
-            reducer_content = self._generate_reducer_content(tag, tag_operations)
-            reducer_file = reducers_dir / f"{tag.lower()}.reducer.ts"
-            
-            with open(reducer_file, 'w') as f:
-                f.write(reducer_content)
-    
-    def _generate_reducer_content(self, tag: str, operations: List[Dict]) -> str:
-        """Generate reducer content for a specific tag"""
-        tag_pascal = self._to_pascal_case(tag)
-        tag_camel = self._to_camel_case(tag)
-        
-        content = [
-            "import { createReducer, on } from '@ngrx/store';",
-            f"import * as {tag_pascal}Actions from '../actions/{tag.lower()}.actions';",
-            "",
-            f"export interface {tag_pascal}State {{",
-            "  loading: boolean;",
-            "  error: any;",
-        ]
-        
-        # Add state properties for each operation
-        for op in operations:
-            op_name = self._to_camel_case(op['operationId'])
-            content.append(f"  {op_name}Data: {op['returnType']} | null;")
-        
-        content.extend([
-            "}",
-            "",
-            f"export const initial{tag_pascal}State: {tag_pascal}State = {{",
-            "  loading: false,",
-            "  error: null,",
-        ])
-        
-        for op in operations:
-            op_name = self._to_camel_case(op['operationId'])
-            content.append(f"  {op_name}Data: null,")
-        
-        content.extend([
-            "};",
-            "",
-            f"export const {tag_camel}Reducer = createReducer(",
-            f"  initial{tag_pascal}State,",
+        groups = list(self._as_index(operations))
+        contents = self._render_many('_generate_reducer_content', [(group,) for group in groups])
+        self._write_many([
+            (self._tag_file(group.lower, 'reducers', 'reducer'), content) for group, content in zip(groups, contents)
         ])
+        self._write_output(self._shared_file('reducers', CALL_STATE_FILE), self._generate_call_state_content())
+    
+    def _generate_call_state_content(self) -> str:
+        """Generate the per-operation request status shared by every reducer"""
+        return self.templates.render('call-state')
+    
+    def _generate_reducer_content(self, group: TagGroup) -> str:
+        """Generate reducer content for a specific tag, normalized through an adapter when it has an entity"""
+        entity = group.entity
         
-        # Add reducer cases
-        for op in operations:
-            op_name = self._to_camel_case(op['operationId'])
-            
-            content.extend([
-                f"  on({tag_pascal}Actions.{op_name}, (state) => ({{",
-                "    ...state,",
-                "    loading: true,",
-                "    error: null",
-                "  })),",
-                f"  on({tag_pascal}Actions.{op_name}Success, (state, {{ data }}) => ({{",
-                "    ...state,",
-                "    loading: false,",
-                f"    {op_name}Data: data",
-                "  })),",
-                f"  on({tag_pascal}Actions.{op_name}Failure, (state, {{ error }}) => ({{",
-                "    ...state,",
-                "    loading: false,",
-                "    error",
-                "  })),",
-            ])
+        # Entity responses keep only ids; the objects themselves live once in `entities`
+        fields = []
+        values = {}
+        for op in group.operations:
+            role = group.entity_role(op) if entity is not None else ''
+            if role == 'collection':
+                fields.append((op, f"{op.name}Ids", "(string | number)[]", role))
+                values[op.name] = f"data.map((item) => {entity.adapter}.selectId(item))"
+            elif role == 'page':
+                # Only page metadata stays with the operation; the items go to the adapter
+                fields.append((op, f"{op.name}Ids", "(string | number)[]", role))
+                values[op.name] = f"(data.{op.pagination.items_field} ?? []).map((item) => {entity.adapter}.selectId(item))"
+            elif role == 'item':
+                fields.append((op, f"{op.name}Id", "string | number", role))
+                values[op.name] = f"{entity.adapter}.selectId(data)"
+            else:
+                fields.append((op, f"{op.name}Data", op.return_type, role))
+                values[op.name] = "data"
         
-        content.append(");")
+        # A new request replaces the list, next pages append to it
+        pagination = {}
+        for op in group.operations:
+            info = op.pagination
+            if info is None:
+                continue
+            meta = f"data.{info.meta_field}"
+            if info.total_field == 'totalPages':
+                has_more = f"({meta}?.page ?? 0) < ({meta}?.totalPages ?? 0)"
+            else:
+                has_more = f"({meta}?.page ?? 0) * ({meta}?.limit ?? 0) < ({meta}?.total ?? 0)"
+            pagination[op.name] = (meta, info.items_field, has_more)
         
-        return '\n'.join(content)
+        return self.templates.render(
+            'reducer', group=group, entity=entity, fields=fields, values=values, pagination=pagination,
+            keyed=self._selector_keys(group), removes=self._entity_removals(group),
+            call_state_imports=CALL_STATE_IMPORTS, call_state_file=CALL_STATE_FILE, selector_utils_file=SELECTOR_UTILS_FILE,
+            shared_import=self._shared_import, tag_import=self._tag_import,
+        )
     
-    def generate_selectors(self, operations: List[Dict]):
-        """Generate NgRx selectors"""
-        selectors_dir = self.output_dir / "selectors"
-        selectors_dir.mkdir(parents=True, exist_ok=True)
+    def generate_selectors(self, operations: Union[OperationIndex, List[Dict]],
+                           index: Optional[OperationIndex] = None):
+        """Generate NgRx selectors
         
-        # Group operations by tags
-        grouped_operations = {}
-        for op in operations:
-            tag = op['tags'][0] if op['tags'] else 'default'
-            if tag not in grouped_operations:
-                grouped_operations[tag] = []
-            grouped_operations[tag].append(op)
+        index is the whole run when operations only holds the changed tags;
+        it decides whether any selector file still needs the shared helpers.
+        """
+        groups = list(self._as_index(operations))
+        contents = self._render_many('_generate_selector_content', [(group,) for group in groups])
+        self._write_many([
+            (self._tag_file(group.lower, 'selectors', 'selectors'), content) for group, content in zip(groups, contents)
+        ])
         
-        for tag, tag_operations in grouped_operations.items():
-            selector_content = self._generate_selector_content(tag, tag_operations)
-            selector_file = selectors_dir / f"{tag.lower()}.selectors.ts"
-            
-            with open(selector_file, 'w') as f:
-                f.write(selector_content)
+        selector_utils_file = self._shared_file('selectors', SELECTOR_UTILS_FILE)
+        if self.selector_factories or any(group.indexes for group in (groups if index is None else index)):
+            self._write_output(selector_utils_file, self._generate_selector_utils_content())
+        else:
+            self.sink.remove(selector_utils_file.relative_to(self.output_dir).as_posix())
     
-    def _generate_selector_content(self, tag: str, operations: List[Dict]) -> str:
+    def _generate_selector_content(self, group: TagGroup) -> str:
         """Generate selector content for a specific tag"""
-        tag_pascal = self._to_pascal_case(tag)
-        tag_camel = self._to_camel_case(tag)
-        
-        content = [
-            "import { createFeatureSelector, createSelector } from '@ngrx/store';",
-            f"import {{ {tag_pascal}State }} from '../reducers/{tag.lower()}.reducer';",
-            "",
-            f"export const select{tag_pascal}State = createFeatureSelector<{tag_pascal}State>('{tag_camel}');",
-            "",
-            f"export const select{tag_pascal}Loading = createSelector(",
-            f"  select{tag_pascal}State,",
-            f"  (state: {tag_pascal}State) => state.loading",
-            ");",
-            "",
-            f"export const select{tag_pascal}Error = createSelector(",
-            f"  select{tag_pascal}State,",
-            f"  (state: {tag_pascal}State) => state.error",
-            ");",
-            ""
-        ]
+        keys = self._selector_keys(group)
+        keyed = {
+            op.name: (', '.join(f"{param}: string" for param in op.parameters), keys[op.name])
+            for op in group.operations if op.name in keys
+        }
         
-        for op in operations:
-            op_name = self._to_camel_case(op['operationId'])
-            op_pascal = self._to_pascal_case(op['operationId'])
-            
-            content.extend([
-                f"export const select{op_pascal}Data = createSelector(",
-                f"  select{tag_pascal}State,",
-                f"  (state: {tag_pascal}State) => state.{op_name}Data",
-                ");",
-                ""
-            ])
+        utils = []
+        if keyed or group.indexes:
+            utils.append('memoizeSelectorFactory')
+        if any(index.unique for index in group.indexes):
+            utils.append('indexBy')
+        if any(not index.unique for index in group.indexes):
+            utils.append('groupBy')
         
-        return '\n'.join(content)
+        return self.templates.render(
+            'selectors', group=group, entity=group.entity, tag_import=self._tag_import,
+            keyed=keyed, utils=utils, selector_utils_file=SELECTOR_UTILS_FILE, shared_import=self._shared_import,
+        )
+    
+    def _generate_selector_utils_content(self) -> str:
+        """Generate the memoized selector factory, keyed state and index helpers shared by selectors and reducers"""
+        return self.templates.render('selector-utils', max_entries=SELECTOR_CACHE_MAX_ENTRIES)
     
-    def generate_services(self, operations: List[Dict]):
+    def generate_services(self, operations: Union[OperationIndex, List[Dict]]):
         """Generate Angular services"""
-        services_dir = self.output_dir / "services"
-        services_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Group operations by tags
-        grouped_operations = {}
-        for op in operations:
-            tag = op['tags'][0] if op['tags'] else 'default'
-            if tag not in grouped_operations:
-                grouped_operations[tag] = []
-            grouped_operations[tag].append(op)
+        groups = list(self._as_index(operations))
+        contents = self._render_many('_generate_service_content', [(group,) for group in groups])
+        self._write_many([
+            (self._tag_file(group.lower, 'services', 'service'), content) for group, content in zip(groups, contents)
+        ])
         
-        for tag, tag_operations in grouped_operations.items():
-            service_content = self._generate_service_content(tag, tag_operations)
-            service_file = services_dir / f"{tag.lower()}.service.ts"
-            
-            with open(service_file, 'w') as f:
-                f.write(service_content)
+        # Shared by every service, so it is written on each run rather than per tag
+        http_cache_file = self._shared_file('services', HTTP_CACHE_FILE)
+        if self.http_cache:
+            self._write_output(http_cache_file, self._generate_http_cache_content())
+        else:
+            self.sink.remove(http_cache_file.relative_to(self.output_dir).as_posix())
     
-    def _generate_service_content(self, tag: str, operations: List[Dict]) -> str:
+    def _generate_service_content(self, group: TagGroup) -> str:
         """Generate service content for a specific tag"""
-        tag_pascal = self._to_pascal_case(tag)
-        
-        content = [
-            "import { Injectable } from '@angular/core';",
-            "import { HttpClient } from '@angular/common/http';",
-            "import { Observable } from 'rxjs';",
-            "",
-            "@Injectable({",
-            "  providedIn: 'root'",
-            "})",
-            f"export class {tag_pascal}Service {{",
-            f"  private baseUrl = '{self.base_url}';",
-            "",
-            "  constructor(private http: HttpClient) {}",
-            ""
-        ]
-        
-        for op in operations:
-            op_name = self._to_camel_case(op['operationId'])
-            method = op['method'].lower()
-            path = op['path']
-            
-            # Build method signature
-            params = []
-            if op['parameters']:
-                params.extend([f"{param}: string" for param in op['parameters']])
-            if op['requestBody']:
-                params.append("payload: any")
-            
-            param_str = ', '.join(params) if params else ''
-            
-            content.append(f"  {op_name}({param_str}): Observable<{op['returnType']}> {{")
-            
-            # Build URL
-            url = f"`${{this.baseUrl}}{path}`"
-            for param in op['parameters']:
-                url = url.replace(f"{{{param}}}", f"${{{param}}}")
+        query_params = {}
+        calls = {}
+        for op in group.operations:
+            method = op.method.lower()
+            options = ''
+            cache_key = op.url
+            if op.params_type:
+                query_params[op.name] = self._query_param_fields(op)
+                options = ", { params: httpParams }"
+                cache_key = f"{op.url[:-1]}?${{httpParams.toString()}}`"
             
             # HTTP call
             if method == 'get' or method == 'delete':
-                content.append(f"    return this.http.{method}<{op['returnType']}>({url});")
+                call = f"this.http.{method}<{op.return_type}>({op.url}{options})"
+            elif op.request_body:
+                call = f"this.http.{method}<{op.return_type}>({op.url}, payload{options})"
             else:
-                if op['requestBody']:
-                    content.append(f"    return this.http.{method}<{op['returnType']}>({url}, payload);")
-                else:
-                    content.append(f"    return this.http.{method}<{op['returnType']}>({url}, {{}});")
-            
-            content.append("  }")
-            content.append("")
+                call = f"this.http.{method}<{op.return_type}>({op.url}, {{}}{options})"
+            calls[op.name] = (call, cache_key)
         
-        content.append("}")
-        
-        return '\n'.join(content)
+        return self.templates.render(
+            'service', group=group, query_params=query_params, calls=calls, base_url=self.base_url,
+            http_cache=self.http_cache, http_cache_file=HTTP_CACHE_FILE, shared_import=self._shared_import,
+        )
+    
+    def _query_param_fields(self, op: OperationRecord) -> List[Tuple[str, str, str, str, str]]:
+        """(interface key, HttpParams key, accessor, type, optional marker) for each query parameter"""
+        fields = []
+        for name, ts_type, required in op.query_params:
+            key = _ts_property_key(name)
+            accessor = f"params[{key}]" if key.startswith('"') else f"params.{name}"
+            fields.append((key, f"'{name}'", accessor, ts_type, '' if required else '?'))
+        return fields
+    
+    def _generate_http_cache_content(self) -> str:
+        """Generate the response cache shared by services built with --http-cache"""
+        return self.templates.render('http-cache', ttl=HTTP_CACHE_TTL_MS, max_entries=HTTP_CACHE_MAX_ENTRIES)
+    
+    def generate_features(self, operations: Union[OperationIndex, List[Dict]]):
+        """Generate a provideState/provideEffects feature per tag for the feature layout"""
+        groups = list(self._as_index(operations))
+        contents = self._render_many('_generate_feature_content', [(group,) for group in groups])
+        self._write_many([
+            (self._tag_file(group.lower, 'features', 'feature'), content) for group, content in zip(groups, contents)
+        ])
+    
+    def _generate_feature_content(self, group: TagGroup) -> str:
+        """Generate the standalone store feature for a specific tag"""
+        return self.templates.render('feature', group=group)
     
-    def generate_index_files(self):
-        """Generate barrel export index files"""
+    def _generate_feature_manifest(self, index: OperationIndex) -> str:
+        """Generate the lazy-load manifest mapping each feature key to a dynamic import"""
+        return self.templates.render(
+            'store-features', features_dir=FEATURES_DIR,
+            groups=sorted(index, key=lambda group: group.camel),
+        )
+    
+    def generate_index_files(self, index: Optional[OperationIndex] = None):
+        """Generate barrel export index files
+        
+        In the feature layout the root barrel leaves tag code out so it can be
+        lazy-loaded; the manifest is written when the full index is given.
+        """
+        if self.layout == 'feature':
+            self._write_output(self.output_dir / "index.ts", '\n'.join([
+                "export * from './models';",
+                f"export * from './{SHARED_DIR}';",
+                f"export * from './{FEATURE_MANIFEST_FILE}';",
+            ]))
+            if index is not None:
+                self._write_output(self.output_dir / f"{FEATURE_MANIFEST_FILE}.ts", self._generate_feature_manifest(index))
+            
+            # One narrow barrel per feature folder, plus the shared runtime
+            for subdir_path in [self.output_dir / SHARED_DIR] + self.sink.list_dirs(self.output_dir / FEATURES_DIR):
+                files = [f[:-3] for f in self.sink.list_files(subdir_path) if f.endswith('.ts') and f != "index.ts"]
+                index_file = subdir_path / "index.ts"
+                if not files and subdir_path.parent.name == FEATURES_DIR:
+                    # Folder of a removed tag
+                    self.sink.remove(index_file.relative_to(self.output_dir).as_posix())
+                    continue
+                self._write_output(index_file, '\n'.join(f"export * from './{f}';" for f in files))
+            return
+        
         # Main store index
         store_index = [
             "export * from './actions';",
@@ -529,76 +2681,1276 @@ class NgRxGenerator:
             "export * from './models';"
         ]
         
-        with open(self.output_dir / "index.ts", 'w') as f:
-            f.write('\n'.join(store_index))
+        self._write_output(self.output_dir / "index.ts", '\n'.join(store_index))
         
         # Generate index files for each subdirectory
         subdirs = ['actions', 'effects', 'reducers', 'selectors', 'services']
         
         for subdir in subdirs:
             subdir_path = self.output_dir / subdir
-            if subdir_path.exists():
-                files = [f for f in subdir_path.glob("*.ts") if f.name != "index.ts"]
-                exports = [f"export * from './{f.stem}';" for f in files]
-                
-                with open(subdir_path / "index.ts", 'w') as f:
-                    f.write('\n'.join(exports))
+            # Sorted so the barrel is stable between runs
+            files = [f[:-3] for f in self.sink.list_files(subdir_path) if f.endswith('.ts') and f != "index.ts"]
+            exports = [f"export * from './{f}';" for f in files]
+            
+            self._write_output(subdir_path / "index.ts", '\n'.join(exports))
+    
+    def _settings_hash(self) -> str:
+        """Hash of everything besides spec fragments that affects emitted content"""
+        return _fragment_hash({
+            'version': MANIFEST_VERSION,
+            'baseUrl': self.base_url,
+            'entityAdapters': self.entity_adapters,
+            'httpCache': self.http_cache,
+            'flattening': [self.flattening, self.effect_debounce, self.merge_concurrency],
+            'layout': self.layout,
+            'models': [self.compact_models, self.model_files],
+            'selectorFactories': self.selector_factories,
+            'templates': self.templates.digest(),
+            'sharedModels': sorted(self.shared_models.items()),
+        })
+    
+    def _load_manifest(self) -> Dict[str, Any]:
+        """Load the manifest written by the previous incremental run, if usable"""
+        manifest = self._manifest
+        if manifest is None:
+            if not self.sink.on_disk:
+                return {}
+            try:
+                with open(self.output_dir / MANIFEST_FILE, 'r') as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError):
+                return {}
+        if manifest.get('settings') != self._settings_hash():
+            return {}
+        return manifest
+    
+    def _save_manifest(self, tag_hashes: Dict[str, str], schema_hashes: Dict[str, str]):
+        """Persist fragment and file hashes for the next incremental run"""
+        manifest = {
+            'settings': self._settings_hash(),
+            'tags': tag_hashes,
+            'schemas': schema_hashes,
+            'files': dict(sorted(self.sink.hashes.items())),
+        }
+        if self.sink.on_disk:
+            with open(self.output_dir / MANIFEST_FILE, 'w') as f:
+                json.dump(manifest, f, indent=2)
+        self._manifest = manifest
+    
+    def _generate_incremental(self, operations: OperationIndex):
+        """Re-render only tags and schemas whose spec fragments changed since the last run"""
+        manifest = self._load_manifest()
+        previous_tags = manifest.get('tags', {})
+        previous_schemas = manifest.get('schemas', {})
+        previous_files = manifest.get('files', {})
+        
+        tag_hashes = {group.tag: _fragment_hash(repr(group)) for group in operations}
+        # Schemas only change on a full reload(), which clears the memo
+        schema_hashes = {}
+        for name, (_, schema) in self._get_models().items():
+            if name not in self._schema_hashes:
+                self._schema_hashes[name] = _fragment_hash(schema)
+            schema_hashes[name] = self._schema_hashes[name]
+        
+        def tag_files(tag: str) -> List[str]:
+            return self._tag_files(tag.lower())
+        
+        def schema_file(name: str) -> str:
+            return f"models/{name.lower()}.model.ts"
+        
+        changed_tags = {
+            tag for tag, digest in tag_hashes.items()
+            if previous_tags.get(tag) != digest
+            or not all(f in previous_files and self.sink.exists(f) for f in tag_files(tag))
+        }
+        changed_schemas = {
+            name for name, digest in schema_hashes.items()
+            if previous_schemas.get(name) != digest
+            or schema_file(name) not in previous_files
+            or not self.sink.exists(schema_file(name))
+        }
+        if self.compact_models:
+            # Compact model files span schemas and are always rendered together
+            changed_schemas = set(schema_hashes)
+        
+        # Unchanged fragments keep the file hashes recorded last time
+        for tag in tag_hashes.keys() - changed_tags:
+            for relative in tag_files(tag):
+                self.sink.hashes[relative] = previous_files[relative]
+        for name in schema_hashes.keys() - changed_schemas:
+            relative = schema_file(name)
+            self.sink.hashes[relative] = previous_files[relative]
+        
+        # Outputs of removed tags and schemas
+        for tag in previous_tags.keys() - tag_hashes.keys():
+            for relative in tag_files(tag):
+                self.sink.remove(relative)
+        for name in previous_schemas.keys() - schema_hashes.keys():
+            self.sink.remove(schema_file(name))
+        
+        self._log(f"Incremental: {len(changed_tags)}/{len(tag_hashes)} tags and "
+                  f"{len(changed_schemas)}/{len(schema_hashes)} schemas changed")
+        
+        changed = operations.subset(changed_tags)
+        
+        self._run_emitters(changed, changed_schemas, operations)
+        
+        with self.stats.phase('save_manifest'):
+            self._save_manifest(tag_hashes, schema_hashes)
+    
+    def impact_fragments(self) -> Dict[str, Any]:
+        """Per-operation, per-tag and per-schema hashes plus the $ref edges a spec diff follows"""
+        index = self._build_operation_index(self._iter_operations())
+        return {
+            'index': index,
+            'settings': self._settings_hash(),
+            'operations': {op.operation_id: _fragment_hash(repr(op)) for op in index.operations},
+            'tags': {group.tag: _fragment_hash(repr(group)) for group in index},
+            'schemas': {name: _fragment_hash(schema) for name, (_, schema) in self._get_models().items()},
+            'graph': self.schema_dependencies(),
+            'refs': self._operation_refs(),
+        }
+    
+    def generate_impact(self, impact: Dict[str, Any], index: OperationIndex):
+        """Re-render only the tags and schemas a spec diff affects and drop the outputs it removes"""
+        if self.sink.on_disk:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.sink.reset()
+        for relative in impact['files']['remove']:
+            self.sink.remove(relative)
+        
+        self._log(f"Impact: {len(impact['tags']['affected'])}/{len(index.tags)} tags and "
+                  f"{len(impact['schemas']['affected'])} schemas affected")
+        with self._worker_pools():
+            self._run_emitters(index.subset(impact['tags']['affected']), set(impact['schemas']['affected']), index)
+        self._log(f"Files: {self.sink.summary()}")
+    
+    def _run_emitters(self, operations: OperationIndex, schema_names: Optional[set] = None,
+                      index: Optional[OperationIndex] = None):
+        """Run every emitter over the given index; barrels always cover the whole output (index)"""
+        emitters = [
+            ('models', self.generate_models, (schema_names,)),
+            ('actions', self.generate_actions, (operations,)),
+            ('effects', self.generate_effects, (operations,)),
+            ('reducers', self.generate_reducers, (operations,)),
+            ('selectors', self.generate_selectors, (operations, index)),
+            ('services', self.generate_services, (operations,)),
+        ]
+        if self.layout == 'feature':
+            emitters.append(('features', self.generate_features, (operations,)))
+        emitters.append(('index files', self.generate_index_files, (operations if index is None else index,)))
+        
+        for label, emitter, args in emitters:
+            self._log(f"Generating {label}...")
+            with self.stats.phase(emitter.__name__):
+                emitter(*args)
     
     def generate_all(self):
         """Generate all NgRx files"""
-        print(f"Generating NgRx files from {self.swagger_file}")
-        print(f"Output directory: {self.output_dir}")
+        self._log(f"Generating NgRx files from {self.swagger_file}")
+        self._log(f"Output directory: {self.output_dir}")
+        self._log(f"Spec loaded in {self.load_seconds * 1000:.1f} ms ({self.load_source})")
         
         # Create output directory
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if self.sink.on_disk:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.sink.reset()
+        
+        # Extract operations and index them once for every emitter
+        if self.streaming:
+            # Each path item is indexed as it is decoded, so no operation list is held
+            with self.stats.phase('extract_operations'):
+                operations = self._build_operation_index(self._iter_operations())
+        else:
+            with self.stats.phase('extract_operations'):
+                extracted = self._extract_operations()
+            with self.stats.phase('build_index'):
+                operations = self._build_operation_index(extracted)
+        self._log(f"Found {len(operations)} operations")
+        
+        # Resolve the schema graph up front so external schemas are known before rendering
+        with self.stats.phase('resolve_schemas'):
+            schema_count = len(self.schema_dependencies())
+        self._log(f"Resolved {schema_count} schemas")
+        
+        with self.stats.phase('compile_templates'):
+            self.templates.load()
+        
+        with self._worker_pools():
+            if self.incremental:
+                self._generate_incremental(operations)
+            else:
+                self._run_emitters(operations)
+        
+        self._log(f"Files: {self.sink.summary()}")
+        self._log(f"✅ NgRx generation completed in {self.stats.report()['total']['wall'] * 1000:.0f} ms!")
+    
+    def write_report(self, path: str):
+        """Write the instrumentation report of the last run as JSON"""
+        report = self.stats.report(self.sink)
+        report['spec'] = self.swagger_file
+        report['load_source'] = self.load_source
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+    
+    def _watched_files(self) -> Dict[str, Optional[Tuple[int, int]]]:
+        """Snapshot (mtime, size) of the spec and every file it references"""
+        snapshot = {}
+        for path in {os.path.abspath(self.swagger_file), *self.resolver.documents}:
+            if not path:
+                continue
+            try:
+                stat = os.stat(path)
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                snapshot[path] = None
+        return snapshot
+    
+    def keep_warm(self):
+        """Keep the spec text and every path item's operations, so reload() can
+        re-parse and re-extract only the path items a save touched"""
+        if self.spec_input is None and not self.streaming:
+            with open(self.swagger_file, 'rb') as f:
+                self._spec_bytes = f.read()
+            self._path_operations = {}
+    
+    def reload(self, changed_files: Optional[set] = None):
+        """Re-read the spec after an edit, keeping unchanged referenced files warm
+        
+        After keep_warm(), an edit confined to the paths of a YAML spec is
+        applied to the parsed document in place; the resolver, schema graph
+        and other path items' operations stay as they are.
+        """
+        root_path = os.path.abspath(self.swagger_file)
+        warm = {
+            path: document for path, document in self.resolver.documents.items()
+            if path != self.resolver.root_path and (changed_files is None or path not in changed_files)
+        }
+        
+        if changed_files is None or root_path in changed_files:
+            data = None
+            if self._spec_bytes is not None:
+                with open(self.swagger_file, 'rb') as f:
+                    data = f.read()
+                if changed_files == {root_path} and self._patch_paths(data):
+                    return
+                self._spec_bytes = data
+            self.swagger_data = self._load_swagger_file(data)
+            self.base_url = self._extract_base_url()
+        
+        self.resolver = RefResolver(self.swagger_data, self._spec_path(), self.cache_dir)
+        self.resolver.documents.update(warm)
+        self._schema_graph = None
+        self._schema_hashes = {}
+        self._type_cache = {}
+        if self._path_operations is not None:
+            self._path_operations = {}
+    
+    def _patch_paths(self, data: bytes) -> bool:
+        """Apply a save of the spec by re-parsing only the path items it touched
+        
+        Returns False, changing nothing, when the edit reaches outside the
+        top-level paths or the spec is not YAML.
+        """
+        if not self.swagger_file.endswith(('.yaml', '.yml')):
+            return False
+        with self.stats.phase('load'):
+            changed = patch_path_items(self.swagger_data, self._spec_bytes, data)
+        if changed is None:
+            return False
+        self.load_seconds, self.load_source = self.stats.phases['load']['wall'], 'patch'
+        self._spec_bytes = data
+        for path in changed:
+            self._path_operations.pop(path, None)
+        self.resolver.forget('/paths/')
+        return True
+    
+    def update_spec(self, swagger_file: Union[Dict[str, Any], bytes, BinaryIO]):
+        """Swap in a new in-memory spec, keeping templates, manifest and output tree warm"""
+        self.spec_input = swagger_file
+        self.reload()
+    
+    def generate_files(self) -> Dict[str, str]:
+        """Run the generator and return the output tree as relative path -> content
+        
+        Needs in_memory=True. The tree persists on the generator, so with
+        incremental=True later runs only re-render what changed.
+        """
+        if self.sink.on_disk:
+            raise ValueError("generate_files() needs a generator created with in_memory=True")
+        self.generate_all()
+        return dict(sorted(self.sink.files.items()))
+    
+    def iter_files(self) -> Iterator[Tuple[str, Optional[str]]]:
+        """Run the generator, yielding (relative path, content) as each file is produced
         
-        # Extract operations
-        operations = self._extract_operations()
-        print(f"Found {len(operations)} operations")
+        Removed files are yielded with None as content; files that did not
+        change since the previous run on this generator are not yielded.
+        """
+        if self.sink.on_disk:
+            raise ValueError("iter_files() needs a generator created with in_memory=True")
         
-        # Generate all components
-        print("Generating models...")
-        self.generate_models()
+        produced: queue.Queue = queue.Queue()
+        done = object()
+        failure: List[BaseException] = []
         
-        print("Generating actions...")
-        self.generate_actions(operations)
+        def run():
+            try:
+                self.generate_all()
+            except BaseException as e:
+                failure.append(e)
+            finally:
+                produced.put(done)
         
-        print("Generating effects...")
-        self.generate_effects(operations)
+        self.sink.listener = lambda relative, content: produced.put((relative, content))
+        worker = threading.Thread(target=run, name='ngrx-generate', daemon=True)
+        worker.start()
+        try:
+            while True:
+                item = produced.get()
+                if item is done:
+                    break
+                yield item
+        finally:
+            worker.join()
+            self.sink.listener = None
+        if failure:
+            raise failure[0]
+    
+    def watch(self, debounce: float = 0.05, poll_interval: float = 0.02):
+        """Regenerate on every change to the spec or a referenced file, until interrupted
         
-        print("Generating reducers...")
-        self.generate_reducers(operations)
+        The spec, resolver documents, extracted operations and manifest stay in
+        memory between cycles: a save that only touches paths re-parses just
+        the edited path items, and only tags and schemas whose fragments
+        changed are re-rendered.
+        """
+        if self.spec_input is not None:
+            raise ValueError("Watch mode needs a spec file, not an in-memory spec")
+        self.incremental = True
+        self.keep_warm()
+        self.generate_all()
+        # Later cycles touch a handful of tags; pool start-up would dominate
+        self.jobs = 1
         
-        print("Generating selectors...")
-        self.generate_selectors(operations)
+        snapshot = self._watched_files()
+        self._log(f"👀 Watching {len(snapshot)} file(s) for changes (Ctrl+C to stop)")
         
-        print("Generating services...")
-        self.generate_services(operations)
+        try:
+            while True:
+                time.sleep(poll_interval)
+                current = self._watched_files()
+                if current == snapshot:
+                    continue
+                
+                # Debounce: wait until a burst of saves has settled
+                while True:
+                    time.sleep(debounce)
+                    settled = self._watched_files()
+                    if settled == current:
+                        break
+                    current = settled
+                
+                changed = {path for path in current.keys() | snapshot.keys() if current.get(path) != snapshot.get(path)}
+                started = time.perf_counter()
+                try:
+                    self.reload(changed)
+                    self.generate_all()
+                except Exception as e:
+                    self._log(f"❌ Error: {str(e)}")
+                else:
+                    self._log(f"⚡ Regenerated in {(time.perf_counter() - started) * 1000:.0f} ms")
+                
+                # Files first referenced by this cycle start from their current state
+                snapshot = {**self._watched_files(), **current}
+        except KeyboardInterrupt:
+            self._log("Stopped watching")
+
+
+def generate_files(swagger_file: Union[Dict[str, Any], bytes, BinaryIO, str], output_dir: str = '.',
+                   **options) -> Dict[str, str]:
+    """Generate the store for a spec in memory and return relative path -> content
+    
+    swagger_file is a parsed document, raw bytes, a stream or a path; options are
+    the NgRxGenerator keyword arguments. Nothing is printed or written to disk
+    (pass cache_dir to keep the compiled templates between processes).
+    """
+    options.setdefault('quiet', True)
+    return NgRxGenerator(swagger_file, output_dir, in_memory=True, **options).generate_files()
+
+
+def _compare_hashes(previous: Dict[str, str], current: Dict[str, str]) -> Dict[str, List[str]]:
+    """Keys added, removed and changed between two name -> hash maps"""
+    return {
+        'added': sorted(current.keys() - previous.keys()),
+        'removed': sorted(previous.keys() - current.keys()),
+        'changed': sorted(key for key in current.keys() & previous.keys() if current[key] != previous[key]),
+    }
+
+
+def diff_specs(old_spec: Union[Dict[str, Any], bytes, BinaryIO, str], new_spec: Union[Dict[str, Any], bytes, BinaryIO, str],
+               output_dir: str = './src/app/store', apply: bool = False, **options) -> Dict[str, Any]:
+    """Impact report of moving from old_spec to new_spec, as plain JSON data
+    
+    A changed schema affects every schema and tag that reaches it through $refs;
+    the report lists those plus the output files to rewrite and remove. With
+    apply only that set is regenerated into output_dir. options are the
+    NgRxGenerator keyword arguments.
+    """
+    options.setdefault('quiet', True)
+    started = time.perf_counter()
+    old = NgRxGenerator(old_spec, output_dir, in_memory=True, **options)
+    new = NgRxGenerator(new_spec, output_dir, in_memory=not apply, **options)
+    before, after = old.impact_fragments(), new.impact_fragments()
+    
+    operations = _compare_hashes(before['operations'], after['operations'])
+    tags = _compare_hashes(before['tags'], after['tags'])
+    schemas = _compare_hashes(before['schemas'], after['schemas'])
+    if before['settings'] != after['settings']:
+        # e.g. a new server URL, which every service embeds
+        tags['changed'] = sorted(before['tags'].keys() & after['tags'].keys())
+    
+    # Spread schema changes backwards along $ref edges of either version
+    dependents: Dict[str, set] = {}
+    for graph in (before['graph'], after['graph']):
+        for name, refs in graph.items():
+            for ref in refs:
+                dependents.setdefault(ref, set()).add(name)
+    reached = set(schemas['added'] + schemas['removed'] + schemas['changed'])
+    pending = list(reached)
+    while pending:
+        for dependent in dependents.get(pending.pop(), ()):
+            if dependent not in reached:
+                reached.add(dependent)
+                pending.append(dependent)
+    schemas['affected'] = sorted(reached & after['schemas'].keys())
+    tags['affected'] = sorted(
+        tag for tag in after['tags']
+        if tag in tags['added'] or tag in tags['changed'] or after['refs'].get(tag, set()) & reached
+    )
+    
+    write = set()
+    remove = set()
+    for tag in tags['affected']:
+        write.update(new._tag_files(after['index'].tags[tag].lower))
+    for tag in tags['removed']:
+        remove.update(old._tag_files(before['index'].tags[tag].lower))
+    for name in schemas['affected']:
+        write.add(f"models/{new._model_file(name)}.ts")
+    # Compact model files outlive a removed schema while other schemas still own them
+    remove.update(
+        {f"models/{old._model_file(name)}.ts" for name in schemas['removed']}
+        - {f"models/{new._model_file(name)}.ts" for name in after['schemas']}
+    )
+    if schemas['added'] or schemas['removed']:
+        write.add("models/index.ts")
+    if tags['added'] or tags['removed']:
+        if new.layout == 'feature':
+            write.add(f"{FEATURE_MANIFEST_FILE}.ts")
+            write.update(f"{FEATURES_DIR}/{after['index'].tags[tag].lower}/index.ts" for tag in tags['added'])
+            remove.update(f"{FEATURES_DIR}/{before['index'].tags[tag].lower}/index.ts" for tag in tags['removed'])
+        else:
+            write.update(f"{subdir}/index.ts" for subdir, _ in TAG_FILE_KINDS)
+    
+    report = {
+        'old': old.swagger_file,
+        'new': new.swagger_file,
+        'operations': operations,
+        'tags': tags,
+        'schemas': schemas,
+        'files': {'write': sorted(write), 'remove': sorted(remove - write)},
+    }
+    report['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 1)
+    if apply:
+        new.generate_impact(report, after['index'])
+        report['written'] = sorted(new.sink.written)
+        report['removed'] = sorted(new.sink.removed)
+    return report
+
+
+# Per-user socket of the generator daemon
+DAEMON_SOCKET = os.path.join(tempfile.gettempdir(), f"ngrx-generator-{getattr(os, 'getuid', lambda: 'user')()}.sock")
+DAEMON_MAX_GENERATORS = 16
+# NgRxGenerator keyword arguments that daemon requests and batch configs may set, with their types
+GENERATOR_OPTIONS = {
+    'jobs': int, 'cache_dir': (str, type(None)), 'entity_adapters': bool, 'http_cache': bool,
+    'flattening': str, 'effect_debounce': int, 'merge_concurrency': int, 'layout': str,
+    'template_dir': (str, type(None)), 'streaming': bool, 'compact_models': bool, 'model_files': int,
+    'selector_factories': bool, 'batch_endpoints': dict, 'batch_window': int,
+}
+# Directories the daemon loads compiled templates and pickled specs from; only its own command line sets them
+DAEMON_LOCAL_OPTIONS = ('cache_dir', 'template_dir')
+# Secret a TCP client must send, in a directory only its owner can read
+DAEMON_TOKEN_DIR = os.path.join(os.path.expanduser('~'), '.ngrx-generator')
+# Options limited to a fixed set of values
+GENERATOR_OPTION_CHOICES = {
+    'flattening': ('auto',) + FLATTENING_OPERATORS,
+    'layout': LAYOUTS,
+}
+
+
+def _check_generator_options(options: Dict[str, Any], where: str = '') -> None:
+    """Raise ValueError for unknown options and values of the wrong type"""
+    unknown = sorted(set(options) - set(GENERATOR_OPTIONS))
+    if unknown:
+        raise ValueError(f"Unknown option(s){where}: {', '.join(unknown)}")
+    for name, value in options.items():
+        expected = GENERATOR_OPTIONS[name]
+        # bool is an int subclass, but true is no job count
+        if not isinstance(value, expected) or isinstance(value, bool) and expected is int:
+            names = ' or '.join(t.__name__ for t in (expected if isinstance(expected, tuple) else (expected,)))
+            raise ValueError(f"Option '{name}'{where} must be {names}, got {type(value).__name__}")
+        if name in GENERATOR_OPTION_CHOICES and value not in GENERATOR_OPTION_CHOICES[name]:
+            raise ValueError(f"Option '{name}'{where} must be one of {', '.join(GENERATOR_OPTION_CHOICES[name])}, "
+                             f"got '{value}'")
+
+
+class _DaemonEntry:
+    """A warm generator plus the spec file state it last generated from"""
+    __slots__ = ('lock', 'generator', 'snapshot')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.generator: Optional[NgRxGenerator] = None
+        self.snapshot: Dict[str, Optional[Tuple[int, int]]] = {}
+
+
+class GeneratorDaemon:
+    """Answer generate requests from warm generators, evicting the least recently used
+    
+    Every (spec, output, options) combination keeps one incremental generator,
+    so a repeated request only re-reads the spec files that were edited and
+    re-renders the tags and schemas that changed. Outputs must lie under one of
+    output_roots; with a token, every request has to carry it.
+    """
+    
+    def __init__(self, max_generators: int = DAEMON_MAX_GENERATORS, output_roots: Optional[List[str]] = None,
+                 token: Optional[str] = None, cache_dir: Optional[str] = None, template_dir: Optional[str] = None):
+        self.max_generators = max(1, max_generators)
+        self.output_roots = [os.path.realpath(root) for root in (output_roots or [os.getcwd()])]
+        self.token = token
+        self.local_options = {'cache_dir': cache_dir, 'template_dir': template_dir}
+        self.requests = 0
+        self._entries: 'OrderedDict[Tuple[str, str, str], _DaemonEntry]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Dispatch one decoded request; errors are raised to the caller"""
+        if self.token is not None and not hmac.compare_digest(str(request.get('token', '')), self.token):
+            raise ValueError("Missing or wrong daemon token")
+        with self._lock:
+            self.requests += 1
+        command = request.get('command', 'generate')
+        if command == 'ping':
+            with self._lock:
+                warm = sum(1 for entry in self._entries.values() if entry.generator is not None)
+            return {'ok': True, 'generators': warm, 'requests': self.requests}
+        if command == 'generate':
+            for field in ('spec', 'output'):
+                if not isinstance(request.get(field), str):
+                    raise ValueError(f"generate request needs a '{field}' path")
+            options = request.get('options') or {}
+            if not isinstance(options, dict):
+                raise ValueError("generate request 'options' must be an object")
+            return self.generate(request['spec'], request['output'], options)
+        if command == 'shutdown':
+            return {'ok': True, 'shutdown': True}
+        raise ValueError(f"Unknown command '{command}'")
+    
+    def _keep(self, key: Tuple[str, str, str], entry: _DaemonEntry):
+        """Keep entry as the most recently used and evict the oldest warm generators beyond the limit"""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            warm = [k for k, e in self._entries.items() if e.generator is not None]
+            for stale in warm[:max(0, len(warm) - self.max_generators)]:
+                del self._entries[stale]
+    
+    def generate(self, spec: str, output: str, options: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate spec into output and report which files changed"""
+        local = sorted(set(DAEMON_LOCAL_OPTIONS) & set(options))
+        if local:
+            raise ValueError(f"Option(s) {', '.join(local)} can only be set on the daemon's command line")
+        _check_generator_options(options)
+        resolved = os.path.realpath(output)
+        if not any(os.path.commonpath([resolved, root]) == root for root in self.output_roots):
+            raise ValueError(f"Output '{output}' is outside the daemon's allowed roots: {', '.join(self.output_roots)}")
         
-        print("Generating index files...")
-        self.generate_index_files()
+        key = (os.path.abspath(spec), os.path.abspath(output), json.dumps(options, sort_keys=True))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                # Shared by concurrent requests, but only counted and kept once its generator is built
+                entry = self._entries[key] = _DaemonEntry()
+            self._entries.move_to_end(key)
         
-        print("✅ NgRx generation completed!")
+        started = time.perf_counter()
+        with entry.lock:
+            generator = entry.generator
+            try:
+                if generator is None:
+                    if not os.path.exists(key[0]):
+                        raise ValueError(f"Swagger file '{spec}' not found")
+                    generator = NgRxGenerator(key[0], key[1], incremental=True, quiet=True,
+                                              **options, **self.local_options)
+                    generator.keep_warm()
+                    current = generator._watched_files()
+                    state = 'cold'
+                else:
+                    current = generator._watched_files()
+                    changed = {path for path in current.keys() | entry.snapshot.keys()
+                               if current.get(path) != entry.snapshot.get(path)}
+                    if changed:
+                        generator.reload(changed)
+                    state = 'reloaded' if changed else 'warm'
+                
+                generator.generate_all()
+            except BaseException:
+                if entry.generator is None:
+                    with self._lock:
+                        if self._entries.get(key) is entry:
+                            del self._entries[key]
+                raise
+            entry.generator = generator
+            # Files first referenced by this run start from their current state
+            entry.snapshot = {**generator._watched_files(), **current}
+            self._keep(key, entry)
+            sink = generator.sink
+            return {
+                'ok': True,
+                'cache': state,
+                'written': sorted(sink.written),
+                'removed': sorted(sink.removed),
+                'unchanged': len(sink.unchanged),
+                'elapsed_ms': round((time.perf_counter() - started) * 1000, 2),
+            }
 
 
-def main():
-    parser = argparse.ArgumentParser(description='Generate NgRx files from Swagger/OpenAPI specification')
-    parser.add_argument('swagger_file', help='Path to Swagger/OpenAPI file (.json or .yaml)')
+def _daemon_address(socket_path: Optional[str], port: Optional[int]) -> Union[str, Tuple[str, int]]:
+    """A localhost TCP address when a port is given, otherwise a Unix socket path"""
+    if port:
+        return ('127.0.0.1', port)
+    return socket_path or DAEMON_SOCKET
+
+
+def _daemon_token_file(port: int) -> str:
+    """Default secret file of a TCP daemon"""
+    return os.path.join(DAEMON_TOKEN_DIR, f"daemon-{port}.token")
+
+
+def _write_daemon_token(path: str) -> str:
+    """Store a fresh secret that only the owner can read and return it"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), mode=0o700, exist_ok=True)
+    token = secrets.token_hex(32)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w') as f:
+        f.write(token)
+    # An existing file keeps its mode through O_CREAT
+    os.chmod(path, 0o600)
+    return token
+
+
+def serve(address: Union[str, Tuple[str, int]], max_generators: int = DAEMON_MAX_GENERATORS,
+          output_roots: Optional[List[str]] = None, token_file: Optional[str] = None,
+          cache_dir: Optional[str] = None, template_dir: Optional[str] = None):
+    """Run the generator daemon until a shutdown request or Ctrl+C
+    
+    The protocol is one JSON object per line in each direction. Requests are
+    {"command": "generate", "spec": ..., "output": ..., "options": {...}},
+    {"command": "ping"} or {"command": "shutdown"}; replies carry "ok" and
+    either the result or an "error" message. Over TCP every request also
+    carries "token", the secret written to token_file at start-up; a Unix
+    socket is only reachable by its owner instead.
+    """
+    token = None
+    if isinstance(address, tuple):
+        token_file = token_file or _daemon_token_file(address[1])
+        token = _write_daemon_token(token_file)
+    daemon = GeneratorDaemon(max_generators, output_roots, token, cache_dir, template_dir)
+    
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for line in self.rfile:
+                try:
+                    reply = daemon.handle(json.loads(line))
+                except Exception as e:
+                    reply = {'ok': False, 'error': str(e)}
+                self.wfile.write(json.dumps(reply).encode('utf-8') + b'\n')
+                self.wfile.flush()
+                if reply.get('shutdown'):
+                    threading.Thread(target=server.shutdown, daemon=True).start()
+                    return
+    
+    if isinstance(address, tuple):
+        socketserver.ThreadingTCPServer.allow_reuse_address = True
+        server = socketserver.ThreadingTCPServer(address, Handler)
+        where = f"{address[0]}:{address[1]}"
+    else:
+        if os.path.exists(address):
+            try:
+                daemon_request(address, {'command': 'ping'})
+            except OSError:
+                os.unlink(address)  # left over from a daemon that did not shut down cleanly
+            else:
+                raise ValueError(f"A daemon is already listening on {address}")
+        # The socket is created owner-only rather than narrowed after bind
+        umask = os.umask(0o177)
+        try:
+            server = socketserver.ThreadingUnixStreamServer(address, Handler)
+        finally:
+            os.umask(umask)
+        where = address
+    server.daemon_threads = True
+    
+    print(f"🚀 Generator daemon listening on {where} (up to {daemon.max_generators} warm generators)")
+    print(f"   Outputs allowed under: {', '.join(daemon.output_roots)}")
+    if token_file:
+        print(f"   Clients authenticate with the token in {token_file}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if not isinstance(address, tuple) and os.path.exists(address):
+            os.unlink(address)
+        if token_file and os.path.exists(token_file):
+            os.unlink(token_file)
+    print("Daemon stopped")
+
+
+def daemon_request(address: Union[str, Tuple[str, int]], request: Dict[str, Any]) -> Dict[str, Any]:
+    """Send one request to a running daemon and return its decoded reply"""
+    if isinstance(address, tuple):
+        connection = socket.create_connection(address)
+    else:
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.connect(address)
+    with connection, connection.makefile('rwb') as stream:
+        stream.write(json.dumps(request).encode('utf-8') + b'\n')
+        stream.flush()
+        line = stream.readline()
+    if not line:
+        raise ConnectionError("The daemon closed the connection without replying")
+    return json.loads(line)
+
+
+# Models that several specs of a batch define identically are emitted once here
+BATCH_SHARED_MODELS_DIR = 'shared-models'
+
+
+def _load_batch_service(name: str, spec: str, output: str,
+                        options: Dict[str, Any]) -> Tuple[str, 'NgRxGenerator', Dict[str, str]]:
+    """Load one spec of a batch and fingerprint its schemas"""
+    generator = NgRxGenerator(spec, output, quiet=True, **options)
+    return name, generator, generator.schema_fingerprints()
+
+
+def _generate_batch_service(generator: 'NgRxGenerator') -> Dict[str, Any]:
+    """Generate one store of a batch, returning its file counts"""
+    # Generators sent to a worker process arrive without their sink and instrumentation
+    if generator.sink is None:
+        generator.sink = OutputSink(generator.output_dir)
+        generator.stats = Instrumentation()
+    started = time.perf_counter()
+    generator.generate_all()
+    sink = generator.sink
+    return {
+        'written': len(sink.written),
+        'unchanged': len(sink.unchanged),
+        'removed': len(sink.removed),
+        'seconds': time.perf_counter() - started,
+    }
+
+
+def _shared_model_owners(loaded: List[Tuple[str, 'NgRxGenerator', Dict[str, str]]]) -> Dict[str, Tuple[str, int]]:
+    """Pick the models to share: model name -> (fingerprint, index of a service defining it)
+    
+    A name is shared when at least two services define it with the same
+    fingerprint (the most common variant wins), and only while every model it
+    references is shared with the same fingerprint too.
+    """
+    variants: Dict[str, Dict[str, List[int]]] = {}
+    for position, (_, _, fingerprints) in enumerate(loaded):
+        for name, fingerprint in fingerprints.items():
+            variants.setdefault(name, {}).setdefault(fingerprint, []).append(position)
+    
+    shared: Dict[str, Tuple[str, int]] = {}
+    for name, by_fingerprint in variants.items():
+        fingerprint, positions = max(by_fingerprint.items(), key=lambda item: len(item[1]))
+        if len(positions) > 1:
+            shared[name] = (fingerprint, positions[0])
+    
+    dropped = True
+    while dropped:
+        dropped = False
+        for name, (fingerprint, position) in list(shared.items()):
+            _, generator, fingerprints = loaded[position]
+            dependencies = generator.schema_dependencies().get(name, ())
+            if any(shared.get(dependency, (None,))[0] != fingerprints.get(dependency) for dependency in dependencies):
+                del shared[name]
+                dropped = True
+    return shared
+
+
+def generate_batch(services: List[Tuple[str, str]], output_dir: str, options: Optional[Dict[str, Any]] = None,
+                   jobs: int = 1, incremental: bool = False, share_models: bool = True,
+                   quiet: bool = False) -> Dict[str, Any]:
+    """Generate one store per (name, spec) into output_dir/<name>
+    
+    Specs are loaded and generated on up to jobs worker processes. Models that
+    several specs define identically are emitted once into
+    output_dir/shared-models and re-exported from each store's models barrel.
+    """
+    names = [name for name, _ in services]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate service name(s): {', '.join(duplicates)}")
+    
+    root = Path(output_dir)
+    service_options = {**(options or {}), 'jobs': 1, 'incremental': incremental}
+    started = time.perf_counter()
+    
+    def log(message: str):
+        if not quiet:
+            print(message)
+    
+    with ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else nullcontext() as pool:
+        run = pool.map if pool is not None else map
+        
+        loaded = list(run(_load_batch_service, names, [spec for _, spec in services],
+                          [str(root / name) for name in names], repeat(service_options)))
+        log(f"Loaded {len(loaded)} specs in {(time.perf_counter() - started) * 1000:.0f} ms")
+        
+        shared = _shared_model_owners(loaded) if share_models else {}
+        shared_dir = root / BATCH_SHARED_MODELS_DIR
+        shared_sink = OutputSink(shared_dir)
+        for name, (_, position) in sorted(shared.items()):
+            generator = loaded[position][1]
+            base, schema = generator._get_models()[name]
+            shared_sink.write(shared_dir / f"{name.lower()}.model.ts",
+                              generator._generate_model_interface(name, schema, base))
+        if shared or shared_dir.exists():
+            current = {f"{name.lower()}.model.ts" for name in shared}
+            for stale in shared_sink.list_files(shared_dir):
+                if stale.endswith('.model.ts') and stale not in current:
+                    shared_sink.remove(stale)
+            shared_sink.write(shared_dir / "index.ts",
+                              '\n'.join(f"export * from './{name.lower()}.model';" for name in sorted(shared)))
+        
+        deduplicated = 0
+        for name, generator, fingerprints in loaded:
+            models_dir = root / name / "models"
+            generator.shared_models = {
+                model: Path(os.path.relpath(shared_dir / f"{model.lower()}.model", models_dir)).as_posix()
+                for model, fingerprint in fingerprints.items()
+                if model in shared and shared[model][0] == fingerprint
+            }
+            deduplicated += len(generator.shared_models)
+        
+        results = list(run(_generate_batch_service, [generator for _, generator, _ in loaded]))
+    
+    report: Dict[str, Any] = {'services': {}, 'shared_models': len(shared),
+                              'deduplicated_models': deduplicated - len(shared)}
+    for name, result in zip(names, results):
+        report['services'][name] = result
+        log(f"  {name}: {result['written']} written, {result['unchanged']} unchanged, "
+            f"{result['removed']} removed ({result['seconds'] * 1000:.0f} ms)")
+    report['seconds'] = time.perf_counter() - started
+    log(f"Shared models: {len(shared)} in {shared_dir} ({shared_sink.summary()}), "
+        f"{report['deduplicated_models']} duplicate model files avoided")
+    log(f"✅ Batch of {len(services)} specs completed in {report['seconds'] * 1000:.0f} ms!")
+    return report
+
+
+def load_batch_config(path: str) -> Dict[str, Any]:
+    """Read a batch config: services (spec paths or {spec, name}), output and generator options
+    
+    Relative paths are resolved from the config file's directory.
+    """
+    with open(path, 'rb') as f:
+        config, _ = parse_spec_bytes(f.read(), path)
+    if not isinstance(config, dict) or not isinstance(config.get('services'), list):
+        raise ValueError(f"Batch config '{path}' needs a 'services' list")
+    
+    directory = os.path.dirname(os.path.abspath(path))
+    services = []
+    for entry in config['services']:
+        if isinstance(entry, str):
+            entry = {'spec': entry}
+        spec = os.path.join(directory, entry['spec'])
+        services.append((entry.get('name') or Path(spec).stem, spec))
+    
+    options = dict(config.get('options') or {})
+    _check_generator_options(options, f" in '{path}'")
+    for option in ('cache_dir', 'template_dir'):
+        if options.get(option):
+            options[option] = os.path.join(directory, options[option])
+    
+    output = config.get('output')
+    return {
+        'services': services,
+        'options': options,
+        'output': os.path.join(directory, output) if output else None,
+    }
+
+
+def _batch_endpoint(value: str) -> Tuple[str, str]:
+    """argparse type for --batch OP=BULK"""
+    operation, _, bulk = value.partition('=')
+    if not operation or not bulk:
+        raise argparse.ArgumentTypeError(f"expected OP=BULK, got '{value}'")
+    return operation, bulk
+
+
+def _add_generator_arguments(parser: argparse.ArgumentParser):
+    """Output and rendering options shared by direct runs, the daemon client and batches"""
     parser.add_argument('-o', '--output', default='./src/app/store', 
                        help='Output directory (default: ./src/app/store)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                       help='Render tags and models on N worker processes (default: 1)')
+    parser.add_argument('--cache-dir',
+                       help=f'Where to cache parsed specs and compiled templates (default: {USER_CACHE_DIR})')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always parse the spec and compile templates instead of reusing the cache')
+    parser.add_argument('--entity-adapters', action='store_true',
+                       help='Normalize tags with list and item endpoints of one schema through @ngrx/entity')
+    parser.add_argument('--http-cache', action='store_true',
+                       help='De-duplicate and cache GET requests in services; writes invalidate their tag')
+    parser.add_argument('--selector-factories', action='store_true',
+                       help='Keep GET responses per path parameters and add memoized selectXDataFor(...) factories')
+    parser.add_argument('--batch', type=_batch_endpoint, action='append', default=[], metavar='OP=BULK',
+                       help='Coalesce requests of item operation OP into calls of bulk operation BULK, '
+                            'like x-ngrx-batch (repeatable)')
+    parser.add_argument('--batch-window', type=int, default=BATCH_WINDOW_MS, metavar='MS',
+                       help=f'Milliseconds batched effects collect ids before each bulk call (default: {BATCH_WINDOW_MS})')
+    parser.add_argument('--layout', choices=LAYOUTS, default='flat',
+                       help='flat: one folder per file kind; feature: one lazy-loadable folder per tag (default: flat)')
+    parser.add_argument('--flattening', choices=('auto',) + FLATTENING_OPERATORS, default='auto',
+                       help='Effect operator for operations without x-ngrx-flattening; auto uses switchMap for GET, '
+                            'concatMap for writes and exhaustMap for login-style calls (default: auto)')
+    parser.add_argument('--effect-debounce', type=int, default=0, metavar='MS',
+                       help='Debounce GET effects by MS milliseconds (default: off)')
+    parser.add_argument('--merge-concurrency', type=int, default=0, metavar='N',
+                       help='Cap concurrent requests of mergeMap effects at N (default: unlimited)')
+    parser.add_argument('--templates', metavar='DIR',
+                       help='Directory of *.ts.tmpl files that replace the built-in templates of the same name')
+    parser.add_argument('--compact-models', action='store_true',
+                       help='Hoist inline objects and enums into named types and declare each distinct shape once')
+    parser.add_argument('--model-files', type=int, default=0, metavar='N',
+                       help='Group compact models into N files instead of one per schema (implies --compact-models)')
+    parser.add_argument('--stream', action='store_true',
+                       help='Parse the spec one path item at a time and load schemas on demand, '
+                            'keeping peak memory low for very large specs')
+
+
+def _generator_options(args: argparse.Namespace) -> Dict[str, Any]:
+    """NgRxGenerator keyword arguments selected on the command line"""
+    cache_dir = None
+    if not args.no_cache:
+        cache_dir = args.cache_dir or USER_CACHE_DIR
+    return {
+        'jobs': args.jobs,
+        'cache_dir': cache_dir,
+        'entity_adapters': args.entity_adapters,
+        'http_cache': args.http_cache,
+        'selector_factories': args.selector_factories,
+        'batch_endpoints': dict(args.batch),
+        'batch_window': args.batch_window,
+        'flattening': args.flattening,
+        'effect_debounce': args.effect_debounce,
+        'merge_concurrency': args.merge_concurrency,
+        'layout': args.layout,
+        'template_dir': args.templates,
+        'streaming': args.stream,
+        'compact_models': args.compact_models,
+        'model_files': args.model_files,
+    }
+
+
+# Command line flags (argparse dests) behind generator options whose names differ
+GENERATOR_OPTION_FLAGS = {
+    'cache_dir': ('cache_dir', 'no_cache'),
+    'template_dir': ('templates',),
+    'streaming': ('stream',),
+    'batch_endpoints': ('batch',),
+}
+
+
+def _input_error(args: argparse.Namespace, specs: List[str]) -> Optional[str]:
+    """Message for a missing spec file or template directory"""
+    for spec in specs:
+        if not os.path.exists(spec):
+            return f"Swagger file '{spec}' not found"
+    if args.templates and not os.path.isdir(args.templates):
+        return f"Template directory '{args.templates}' not found"
+    return None
+
+
+def _add_daemon_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--socket', metavar='PATH',
+                       help=f'Unix socket of the daemon (default: {DAEMON_SOCKET})')
+    parser.add_argument('--port', type=int,
+                       help='Use localhost TCP on this port instead of a Unix socket')
+    parser.add_argument('--token-file', metavar='PATH',
+                       help=f'TCP only: secret shared by daemon and clients '
+                            f'(default: {os.path.join(DAEMON_TOKEN_DIR, "daemon-<port>.token")})')
+
+
+def serve_main(argv: List[str]) -> int:
+    """ngrx_generator.py serve: run the generator daemon"""
+    parser = argparse.ArgumentParser(prog='ngrx_generator.py serve',
+                                     description='Keep specs parsed and generators warm between builds')
+    _add_daemon_arguments(parser)
+    parser.add_argument('--max-generators', type=int, default=DAEMON_MAX_GENERATORS, metavar='N',
+                       help=f'Warm generators kept before the least recently used is evicted '
+                            f'(default: {DAEMON_MAX_GENERATORS})')
+    parser.add_argument('--allow-output', action='append', default=[], metavar='DIR',
+                       help='Directory clients may generate into, repeatable (default: the current directory)')
+    parser.add_argument('--cache-dir',
+                       help=f'Where to cache parsed specs and compiled templates (default: {USER_CACHE_DIR})')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always parse specs and compile templates instead of reusing the cache')
+    parser.add_argument('--templates', metavar='DIR',
+                       help='Directory of *.ts.tmpl files that replace the built-in templates of the same name')
+    args = parser.parse_args(argv)
+    if args.templates and not os.path.isdir(args.templates):
+        print(f"❌ Error: Template directory '{args.templates}' not found")
+        return 1
+    
+    try:
+        serve(_daemon_address(args.socket, args.port), args.max_generators, args.allow_output or None,
+              args.token_file, None if args.no_cache else args.cache_dir or USER_CACHE_DIR, args.templates)
+    except Exception as e:
+        print(f"❌ Error: {str(e)}")
+        return 1
+    return 0
+
+
+def client_main(argv: List[str]) -> int:
+    """ngrx_generator.py client: generate through a running daemon"""
+    parser = argparse.ArgumentParser(prog='ngrx_generator.py client',
+                                     description='Generate NgRx files through a running generator daemon')
+    # The spec is only needed to generate
+    parser.add_argument('swagger_file', nargs='?', help='Path to Swagger/OpenAPI file (.json or .yaml)')
+    _add_generator_arguments(parser)
+    _add_daemon_arguments(parser)
+    parser.add_argument('--ping', action='store_true', help='Only check that the daemon is running')
+    parser.add_argument('--shutdown', action='store_true', help='Stop the daemon')
+    args = parser.parse_args(argv)
+    address = _daemon_address(args.socket, args.port)
+    
+    if args.ping or args.shutdown:
+        request: Dict[str, Any] = {'command': 'ping' if args.ping else 'shutdown'}
+    else:
+        if args.swagger_file is None:
+            parser.error('the following arguments are required: swagger_file')
+        error = _input_error(args, [args.swagger_file])
+        if error:
+            print(f"❌ Error: {error}")
+            return 1
+        if args.templates or args.cache_dir or args.no_cache:
+            print("❌ Error: --templates, --cache-dir and --no-cache are set on the daemon: "
+                  "pass them to 'ngrx_generator.py serve'")
+            return 1
+        options = _generator_options(args)
+        for option in DAEMON_LOCAL_OPTIONS:
+            del options[option]
+        # Paths are resolved here, since the daemon runs in another directory
+        request = {
+            'command': 'generate',
+            'spec': os.path.abspath(args.swagger_file),
+            'output': os.path.abspath(args.output),
+            'options': options,
+        }
+    
+    if isinstance(address, tuple):
+        token_file = args.token_file or _daemon_token_file(address[1])
+        try:
+            with open(token_file) as f:
+                request['token'] = f.read().strip()
+        except OSError as e:
+            print(f"❌ Error: cannot read the daemon token ({e}); is a daemon serving port {address[1]}?")
+            return 1
+    
+    try:
+        reply = daemon_request(address, request)
+    except OSError as e:
+        print(f"❌ Error: no daemon reachable at {address} ({e}); start one with 'ngrx_generator.py serve'")
+        return 1
+    if not reply.get('ok'):
+        print(f"❌ Error: {reply.get('error')}")
+        return 1
+    
+    if request['command'] == 'ping':
+        print(f"✅ Daemon running: {reply['generators']} warm generator(s), {reply['requests']} request(s) served")
+    elif request['command'] == 'shutdown':
+        print("Daemon stopping")
+    else:
+        for relative in reply['written']:
+            print(f"  written  {relative}")
+        for relative in reply['removed']:
+            print(f"  removed  {relative}")
+        print(f"Files: {len(reply['written'])} written, {reply['unchanged']} unchanged, "
+              f"{len(reply['removed'])} removed")
+        print(f"✅ NgRx generation completed in {reply['elapsed_ms']:.0f} ms ({reply['cache']})")
+    return 0
+
+
+def batch_main(argv: List[str]) -> int:
+    """ngrx_generator.py batch: generate stores for many specs with shared models"""
+    parser = argparse.ArgumentParser(
+        prog='ngrx_generator.py batch',
+        description='Generate one store per spec into <output>/<name>, emitting models that several '
+                    'specs define identically once into <output>/' + BATCH_SHARED_MODELS_DIR,
+    )
+    parser.add_argument('specs', nargs='*', help='Swagger/OpenAPI files; each store is named after its file')
+    parser.add_argument('--config', metavar='FILE',
+                       help='JSON/YAML file with services, output and options (flags given here take precedence)')
+    _add_generator_arguments(parser)
+    parser.add_argument('--incremental', action='store_true',
+                       help=f'Only rewrite files whose spec fragments changed (tracked in {MANIFEST_FILE})')
+    parser.add_argument('--no-shared-models', action='store_true',
+                       help='Emit every model inside each store instead of sharing identical ones')
+    # -j counts specs processed in parallel; the config's output applies unless -o is given
+    parser.set_defaults(output=None)
+    args = parser.parse_args(argv)
+    # Parsed again with every default cleared, to tell flags given on the command line from defaults
+    parser.set_defaults(**{dest: None for dest in vars(args)})
+    given = {dest for dest, value in vars(parser.parse_args(argv)).items() if value is not None}
+    
+    try:
+        config = load_batch_config(args.config) if args.config else {'services': [], 'options': {}, 'output': None}
+    except Exception as e:
+        print(f"❌ Error: {str(e)}")
+        return 1
+    services = config['services'] + [(Path(spec).stem, spec) for spec in args.specs]
+    if not services:
+        parser.error('give spec files or a --config listing services')
+    
+    error = _input_error(args, [spec for _, spec in services])
+    if error:
+        print(f"❌ Error: {error}")
+        return 1
+    
+    args.output = args.output or config['output'] or './src/app/store'
+    options = _generator_options(args)
+    for name, value in config['options'].items():
+        if not given.intersection(GENERATOR_OPTION_FLAGS.get(name, (name,))):
+            options[name] = value
+    jobs = options.pop('jobs')
+    
+    try:
+        generate_batch(services, args.output, options, jobs=max(1, jobs), incremental=args.incremental,
+                       share_models=not args.no_shared_models)
+    except Exception as e:
+        print(f"❌ Error: {str(e)}")
+        return 1
+    return 0
+
+
+def diff_main(argv: List[str]) -> int:
+    """ngrx_generator.py diff: report what a spec change affects and optionally regenerate just that"""
+    parser = argparse.ArgumentParser(
+        prog='ngrx_generator.py diff',
+        description='Compare two spec versions and list the operations, tags, models and output files '
+                    'the change affects, following $ref dependencies',
+    )
+    parser.add_argument('old_spec', help='Previous Swagger/OpenAPI file')
+    parser.add_argument('new_spec', help='New Swagger/OpenAPI file')
+    _add_generator_arguments(parser)
+    parser.add_argument('--report', metavar='FILE',
+                       help="Write the impact report as JSON ('-' for stdout)")
+    parser.add_argument('--apply', action='store_true',
+                       help='Regenerate only the affected files from the new spec into the output directory')
+    args = parser.parse_args(argv)
+    
+    error = _input_error(args, [args.old_spec, args.new_spec])
+    if error:
+        print(f"❌ Error: {error}")
+        return 1
+    
+    options = _generator_options(args)
+    # Only --apply writes, and then the summary goes to stdout like a normal run
+    options['quiet'] = args.report == '-' or not args.apply
+    try:
+        report = diff_specs(args.old_spec, args.new_spec, args.output, apply=args.apply, **options)
+    except Exception as e:
+        print(f"❌ Error: {str(e)}")
+        return 1
+    
+    if args.report == '-':
+        print(json.dumps(report, indent=2))
+        return 0
+    for kind in ('operations', 'tags', 'schemas'):
+        counts = ', '.join(f"{len(report[kind][change])} {change}" for change in report[kind])
+        print(f"{kind.capitalize()}: {counts}")
+    print(f"Files: {len(report['files']['write'])} to write, {len(report['files']['remove'])} to remove")
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.report}")
+    print(f"✅ Impact computed in {report['elapsed_ms']:.0f} ms")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ['serve']:
+        return serve_main(argv[1:])
+    if argv[:1] == ['client']:
+        return client_main(argv[1:])
+    if argv[:1] == ['batch']:
+        return batch_main(argv[1:])
+    if argv[:1] == ['diff']:
+        return diff_main(argv[1:])
+    
+    parser = argparse.ArgumentParser(
+        description='Generate NgRx files from Swagger/OpenAPI specification',
+        epilog="Run 'ngrx_generator.py serve' to keep a generator daemon warm, "
+               "'ngrx_generator.py client ...' to generate through it, "
+               "'ngrx_generator.py batch ...' to generate many specs with shared models and "
+               "'ngrx_generator.py diff OLD NEW' to see which files a spec change affects.",
+    )
+    parser.add_argument('swagger_file', help='Path to Swagger/OpenAPI file (.json or .yaml)')
+    _add_generator_arguments(parser)
+    parser.add_argument('--incremental', action='store_true',
+                       help=f'Only rewrite files whose spec fragments changed (tracked in {MANIFEST_FILE})')
+    parser.add_argument('--report', metavar='FILE',
+                       help='Write per-phase, per-tag and per-schema timings plus file counts as JSON')
+    parser.add_argument('--profile', choices=['cprofile', 'tracemalloc'],
+                       help='Profile the run with cProfile or tracemalloc')
+    parser.add_argument('--profile-output', metavar='FILE',
+                       help='Where to write profiler output (default: ngrx-profile.prof / ngrx-tracemalloc.txt)')
+    parser.add_argument('--watch', action='store_true',
+                       help='Keep running and regenerate changed tags/schemas whenever the spec is saved')
+    parser.add_argument('--debounce', type=int, default=50,
+                       help='Watch mode: milliseconds to wait for a burst of saves to settle (default: 50)')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
-    if not os.path.exists(args.swagger_file):
-        print(f"❌ Error: Swagger file '{args.swagger_file}' not found")
-        return
+    error = _input_error(args, [args.swagger_file])
+    if error:
+        print(f"❌ Error: {error}")
+        return 1
     
     try:
-        generator = NgRxGenerator(args.swagger_file, args.output)
-        generator.generate_all()
+        stats = Instrumentation()
+        with stats.profiled(args.profile, args.profile_output):
+            generator = NgRxGenerator(args.swagger_file, args.output, incremental=args.incremental,
+                                      instrumentation=stats, **_generator_options(args))
+            if args.watch:
+                generator.watch(debounce=args.debounce / 1000)
+            else:
+                generator.generate_all()
+        if args.report:
+            generator.write_report(args.report)
+            print(f"Report written to {args.report}")
     except Exception as e:
         print(f"❌ Error: {str(e)}")
+        return 1
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""
+Generator daemon round trips over a Unix socket and over TCP
+"""
+
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Tuple
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from ngrx_generator import daemon_request, serve  # noqa: E402
+
+SPEC = ROOT / 'swagger.yaml'
+
+
+def start_daemon(address, **options) -> Tuple[threading.Thread, str]:
+    """Serve on a background thread and wait until the daemon answers; returns the thread and TCP token"""
+    thread = threading.Thread(target=serve, args=(address,), kwargs=options, daemon=True)
+    thread.start()
+    token_file = Path(options['token_file']) if 'token_file' in options else None
+    deadline = time.monotonic() + 10
+    while True:
+        token = token_file.read_text() if token_file is not None and token_file.exists() else ''
+        try:
+            if daemon_request(address, {'command': 'ping', 'token': token})['ok']:
+                return thread, token
+        except OSError:
+            pass
+        if time.monotonic() > deadline:
+            pytest.fail(f"daemon on {address} did not answer")
+        time.sleep(0.02)
+
+
+def stop_daemon(address, thread: threading.Thread, token: str = ''):
+    assert daemon_request(address, {'command': 'shutdown', 'token': token}) == {'ok': True, 'shutdown': True}
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+
+
+def test_unix_socket_round_trip(tmp_path):
+    address = str(tmp_path / 'daemon.sock')
+    spec = tmp_path / 'api.yaml'
+    spec.write_text(SPEC.read_text())
+    output = tmp_path / 'store'
+    thread, _ = start_daemon(address, output_roots=[str(tmp_path)])
+    try:
+        request = {'command': 'generate', 'spec': str(spec), 'output': str(output), 'options': {'entity_adapters': True}}
+        cold = daemon_request(address, request)
+        assert cold['ok'] and cold['cache'] == 'cold'
+        assert 'reducers/users.reducer.ts' in cold['written']
+        assert (output / 'reducers' / 'users.reducer.ts').exists()
+
+        warm = daemon_request(address, request)
+        assert (warm['cache'], warm['written'], warm['removed']) == ('warm', [], [])
+
+        spec.write_text(SPEC.read_text().replace('summary: Get all users', 'summary: List every user'))
+        reloaded = daemon_request(address, request)
+        assert reloaded['cache'] == 'reloaded'
+
+        assert daemon_request(address, {'command': 'ping'}) == {'ok': True, 'generators': 1, 'requests': 5}
+
+        outside = daemon_request(address, {**request, 'output': '/elsewhere'})
+        assert not outside['ok'] and 'outside the daemon' in outside['error']
+        local = daemon_request(address, {**request, 'options': {'cache_dir': str(tmp_path)}})
+        assert not local['ok'] and 'cache_dir' in local['error']
+        assert daemon_request(address, {'command': 'rewind'}) == {'ok': False, 'error': "Unknown command 'rewind'"}
+    finally:
+        stop_daemon(address, thread)
+    assert not Path(address).exists()
+
+
+def test_tcp_requests_need_the_token(tmp_path):
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+    address = ('127.0.0.1', port)
+    token_file = tmp_path / 'daemon.token'
+    thread, token = start_daemon(address, output_roots=[str(tmp_path)], token_file=str(token_file))
+    assert token_file.stat().st_mode & 0o777 == 0o600
+    try:
+        assert daemon_request(address, {'command': 'ping'}) == {'ok': False, 'error': 'Missing or wrong daemon token'}
+        assert daemon_request(address, {'command': 'ping', 'token': 'guess'})['ok'] is False
+
+        reply = daemon_request(address, {'command': 'generate', 'token': token, 'spec': str(SPEC),
+                                         'output': str(tmp_path / 'store')})
+        assert reply['ok'] and reply['written']
+    finally:
+        stop_daemon(address, thread, token)
+    assert not token_file.exists()
@@ -0,0 +1,288 @@
+"""
+Generated code for the opt-in features, checked on the bundled spec
+"""
+
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+import yaml
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from ngrx_generator import NgRxGenerator  # noqa: E402
+
+SPEC = ROOT / 'swagger.yaml'
+
+
+def load_spec() -> Dict[str, Any]:
+    with open(SPEC) as f:
+        return yaml.safe_load(f)
+
+
+def render(spec: Any = None, **options) -> Dict[str, str]:
+    """Relative path -> content of the tree generated in memory"""
+    generator = NgRxGenerator(str(SPEC) if spec is None else spec, quiet=True, in_memory=True, **options)
+    return generator.generate_files()
+
+
+def block(content: str, start: str) -> str:
+    """The generated statement starting at the line that contains start, up to the next blank line or case"""
+    lines = content[content.index(start):].split('\n')
+    end = next(i for i, line in enumerate(lines[1:], 1) if not line.strip() or line.lstrip().startswith('on('))
+    return '\n'.join(lines[:end])
+
+
+def test_entity_delete_removes_the_entity():
+    spec = load_spec()
+    # Deleting a sub-resource must not drop the user itself
+    spec['paths']['/users/{userId}/profile']['delete'] = {
+        'tags': ['users'], 'operationId': 'deleteUserProfile', 'responses': {'204': {'description': 'deleted'}},
+    }
+    files = render(spec, entity_adapters=True)
+    actions, effects = files['actions/users.actions.ts'], files['effects/users.effects.ts']
+    reducer = files['reducers/users.reducer.ts']
+
+    assert 'props<{ data: any; id: string }>()' in block(actions, 'export const deleteUserSuccess')
+    assert 'deleteUserSuccess({ data, id: action.userId })' in effects
+    assert block(reducer, 'on(UsersActions.deleteUserSuccess,').startswith(
+        'on(UsersActions.deleteUserSuccess, (state, { data, id }) => usersAdapter.removeOne(id, {')
+
+    assert 'props<{ data: any }>()' in block(actions, 'export const deleteUserProfileSuccess')
+    assert 'deleteUserProfileSuccess({ data })' in effects
+    assert 'removeOne' not in block(reducer, 'on(UsersActions.deleteUserProfileSuccess,')
+
+
+def test_delete_without_entity_adapters_keeps_the_response():
+    reducer = render()['reducers/users.reducer.ts']
+    assert 'removeOne' not in reducer
+    assert 'deleteUserData: data' in block(reducer, 'on(UsersActions.deleteUserSuccess,')
+
+
+def test_keyed_state_is_bounded_like_the_selector_cache():
+    files = render(selector_factories=True)
+    reducer, selectors = files['reducers/products.reducer.ts'], files['selectors/products.selectors.ts']
+
+    assert "import { KeyedState, setKeyed } from '../selectors/selector-utils';" in reducer
+    assert 'getProductByIdDataByKey: KeyedState<Product>;' in reducer
+    assert 'getProductByIdDataByKey: { keys: [], values: {} },' in reducer
+    assert 'getProductByIdDataByKey: setKeyed(state.getProductByIdDataByKey, key, data)' in reducer
+    assert 'state.getProductByIdDataByKey.values[productId] ?? null' in selectors
+    assert 'export function setKeyed<T>(' in files['selectors/selector-utils.ts']
+    assert 'KeyedState' not in render()['reducers/products.reducer.ts']
+
+
+def test_compact_and_regular_models_type_properties_alike():
+    spec = load_spec()
+    spec['components']['schemas']['Gadget'] = {
+        'type': 'object',
+        'required': ['display-name'],
+        'properties': {
+            'display-name': {'type': 'string'},
+            'codes': {'type': 'array', 'items': {'oneOf': [{'type': 'string'}, {'type': 'integer'}]}},
+            'counts': {'type': 'object', 'additionalProperties': {'type': 'integer'}},
+            'owner': {'$ref': '#/components/schemas/User'},
+            'parts': {'allOf': [{'$ref': '#/components/schemas/Address'}, {'type': 'boolean'}]},
+        },
+    }
+    regular = render(spec)['models/gadget.model.ts']
+    compact = render(spec, compact_models=True)['models/gadget.model.ts']
+
+    expected = [
+        '  "display-name": string;',
+        '  codes?: (string | number)[];',
+        '  counts?: { [key: string]: number };',
+        '  owner?: User;',
+        '  parts?: Address & boolean;',
+    ]
+    for line in expected:
+        assert line in regular.split('\n')
+        assert line in compact.split('\n')
+
+
+def test_tag_loading_and_error_come_from_call_state():
+    files = render(entity_adapters=True)
+    reducer, selectors = files['reducers/users.reducer.ts'], files['selectors/users.selectors.ts']
+
+    assert 'loading' not in reducer.replace('loadingCallState', '')
+    assert 'error: any' not in reducer and 'error,' not in reducer
+    error_selector = block(selectors, 'export const selectUsersError')
+    assert 'state.callState' in error_selector and 'state.error' not in error_selector
+
+
+def test_auth_operations_match_whole_words_of_writes():
+    spec = load_spec()
+    ok = {'200': {'description': 'ok'}}
+    spec['paths']['/auth/catalog-info'] = {'get': {'tags': ['auth'], 'operationId': 'getCatalogInfo', 'responses': ok}}
+    spec['paths']['/auth/login-status'] = {'get': {'tags': ['auth'], 'operationId': 'getLoginStatus', 'responses': ok}}
+    spec['paths']['/auth/cache'] = {'post': {'tags': ['auth'], 'operationId': 'refreshCache', 'responses': ok}}
+    spec['paths']['/auth/logout'] = {'post': {'tags': ['auth'], 'operationId': 'userLogout', 'responses': ok}}
+    effects = render(spec)['effects/auth.effects.ts']
+
+    def operator(name: str) -> str:
+        return block(effects, f"ofType(AuthActions.{name}),").split('\n')[1].strip().split('(')[0]
+
+    assert operator('login') == 'exhaustMap'
+    assert operator('refreshToken') == 'exhaustMap'
+    assert operator('userLogout') == 'exhaustMap'
+    assert operator('getCatalogInfo') == 'switchMap'
+    assert operator('getLoginStatus') == 'switchMap'
+    assert operator('refreshCache') == 'concatMap'
+
+
+def bulk_products_spec() -> Dict[str, Any]:
+    """The bundled spec with a getProductsByIds bulk operation taking an ids query array"""
+    spec = load_spec()
+    spec['paths']['/products/bulk'] = {'get': {
+        'tags': ['products'], 'operationId': 'getProductsByIds',
+        'parameters': [{'name': 'ids', 'in': 'query', 'schema': {'type': 'array', 'items': {'type': 'string'}}}],
+        'responses': {'200': {'description': 'ok', 'content': {'application/json': {
+            'schema': {'type': 'array', 'items': {'$ref': '#/components/schemas/Product'}}}}}},
+    }}
+    return spec
+
+
+def test_batch_window_timer_starts_with_the_first_request():
+    spec = bulk_products_spec()
+    spec['paths']['/products/{productId}']['get']['x-ngrx-batch'] = {
+        'operation': 'getProductsByIds', 'window': 20, 'maxSize': 50,
+    }
+    effects = render(spec)['effects/products.effects.ts']
+
+    assert 'bufferTime' not in effects
+    assert 'const requests$ = this.actions$.pipe(ofType(ProductsActions.getProductById), share());' in effects
+    assert 'buffer(requests$.pipe(exhaustMap(() => timer(20)))),' in effects
+    assert 'ids.slice(chunk * 50, (chunk + 1) * 50)' in effects
+    assert "import { from, of, timer } from 'rxjs';" in effects
+
+
+def test_refs_across_sibling_files(tmp_path):
+    (tmp_path / 'schemas').mkdir()
+    (tmp_path / 'schemas' / 'pet.yaml').write_text(yaml.safe_dump({
+        'type': 'object', 'properties': {'id': {'type': 'string'}, 'owner': {'$ref': '../common.yaml#/Owner'}},
+    }))
+    (tmp_path / 'common.yaml').write_text(yaml.safe_dump({
+        'Owner': {'type': 'object', 'properties': {'name': {'type': 'string'}}},
+    }))
+    pet = {'$ref': './schemas/pet.yaml'}
+    (tmp_path / 'api.yaml').write_text(yaml.safe_dump({
+        'openapi': '3.0.0', 'info': {'title': 'Pets', 'version': '1'},
+        'paths': {'/pets/{petId}': {'get': {
+            'tags': ['pets'], 'operationId': 'getPet',
+            'parameters': [{'name': 'petId', 'in': 'path', 'required': True, 'schema': {'type': 'string'}}],
+            'responses': {'200': {'description': 'ok', 'content': {'application/json': {'schema': pet}}}},
+        }}},
+        'components': {'schemas': {
+            'Loop': {'$ref': '#/components/schemas/Knot'},
+            'Knot': {'$ref': '#/components/schemas/Loop'},
+        }},
+    }))
+    generator = NgRxGenerator(str(tmp_path / 'api.yaml'), quiet=True, in_memory=True)
+    files = generator.generate_files()
+
+    assert 'owner?: Owner;' in files['models/pet.model.ts']
+    assert 'name?: string;' in files['models/owner.model.ts']
+    assert 'export type Loop = unknown;' in files['models/loop.model.ts']
+    assert 'Observable<Pet>' in files['services/pets.service.ts']
+    assert generator.schema_dependencies()['Pet'] == {'Owner'}
+
+    # Each target is resolved once; later lookups return the memoized node
+    resolver = generator.resolver
+    assert resolver.resolve('./schemas/pet.yaml') is resolver.resolve('./schemas/pet.yaml')
+    assert resolver.circular('#/components/schemas/Loop')
+
+
+def test_http_cache_routes_reads_through_the_cache():
+    files = render(http_cache=True)
+    service = files['services/categories.service.ts']
+
+    assert "import { HttpResponseCache } from './http-cache';" in service
+    assert block(service, '  getCategories():').split('\n')[1] == (
+        "    return this.cache.get('categories', `${this.baseUrl}/categories`, () =>")
+    assert "tap(() => this.cache.invalidate('categories'))" in block(service, '  createCategory(')
+    assert 'export const NGRX_HTTP_CACHE_CONFIG' in files['services/http-cache.ts']
+
+    plain = render()
+    assert 'services/http-cache.ts' not in plain
+    assert 'this.cache' not in plain['services/categories.service.ts']
+
+
+def test_feature_layout_keeps_tag_code_out_of_the_root_barrel():
+    files = render(layout='feature')
+    tags = ['auth', 'categories', 'orders', 'products', 'users']
+
+    assert sorted({path.split('/')[1] for path in files if path.startswith('features/')}) == tags
+    assert not any(path.startswith(('actions/', 'reducers/', 'effects/')) for path in files)
+    assert files['index.ts'].split('\n') == [
+        "export * from './models';", "export * from './shared';", "export * from './store.features';",
+    ]
+    manifest = files['store.features.ts']
+    assert "import('./features/users/users.feature').then((m) => m.provideUsersFeature())" in manifest
+    assert 'import {' not in manifest.replace("import { EnvironmentProviders } from '@angular/core';", '')
+
+    feature = files['features/users/users.feature.ts']
+    assert 'provideState(usersFeatureKey, usersReducer),' in feature
+    assert "from '../../shared/call-state'" in files['features/users/users.reducer.ts']
+
+
+def test_query_params_and_next_page_loader():
+    spec = load_spec()
+    spec['paths']['/products']['get']['parameters'].append(
+        {'name': 'sort-by', 'in': 'query', 'required': True, 'schema': {'type': 'string'}})
+    files = render(spec)
+    service, actions = files['services/products.service.ts'], files['actions/products.actions.ts']
+    effects, selectors = files['effects/products.effects.ts'], files['selectors/products.selectors.ts']
+
+    assert '  minPrice?: number;' in block(service, 'export interface GetproductsParams')
+    assert '  "sort-by": string;' in block(service, 'export interface GetproductsParams')
+    assert "httpParams = httpParams.set('sort-by', String(params[\"sort-by\"]));" in service
+    assert '{ params: httpParams }' in block(service, '  getProducts(')
+
+    assert "export const getProductsNextPage = createAction('[Products] Getproducts Next Page');" in actions
+    next_page = block(effects, '  getProductsNextPage$')
+    assert 'filter(([, state]) => state.getProductsHasMore && state.getProductsRequest !== null),' in next_page
+    assert '{ ...state.getProductsRequest!.params, page: (state.getProductsPage ?? 0) + 1 }' in effects
+    assert 'export const selectGetproductsHasMore = createSelector(' in selectors
+
+
+def test_index_selectors_over_lists_and_entities():
+    spec = load_spec()
+    properties = spec['components']['schemas']['Category']['properties']
+    properties['id']['x-ngrx-index'] = 'unique'
+    properties['parentId']['x-ngrx-index'] = True
+
+    selectors = render(spec)['selectors/categories.selectors.ts']
+    assert "import { memoizeSelectorFactory, indexBy, groupBy } from './selector-utils';" in selectors
+    assert block(selectors, 'export const selectGetcategoriesIndexById').split('\n')[1:] == [
+        '  selectGetcategoriesData,', '  (items) => indexBy(items ?? [], (item) => item.id)', ');']
+    assert '(index) => index.get(value) ?? null' in block(selectors, 'export const selectGetcategoriesById ')
+    assert '(index) => index.get(value) ?? []' in block(selectors, 'export const selectGetcategoriesByParentId ')
+
+    # With an adapter the index is built once over the entity collection
+    selectors = render(spec, entity_adapters=True)['selectors/categories.selectors.ts']
+    assert '  selectAllCategory,\n  (items) => indexBy(' in block(selectors, 'export const selectCategoryIndexById')
+    assert 'selectGetcategoriesIndexById' not in selectors
+
+
+def test_batched_results_fan_out_per_id():
+    spec = bulk_products_spec()
+    effects = render(spec, batch_endpoints={'getProductById': 'getProductsByIds'},
+                     selector_factories=True)['effects/products.effects.ts']
+    assert 'this.productsService.getProductsByIds({ ids }).pipe(' in effects
+    assert 'const found = new Map(items.map((item) => [String(item.id), item] as const));' in effects
+    assert '? ProductsActions.getProductByIdSuccess({ data, key: id })' in effects
+    assert ': ProductsActions.getProductByIdFailure({ error: { status: 404, id } });' in effects
+
+    for batch, message in [
+        ({'operation': 'getMissing'}, "no operation 'getMissing' in tag 'products'"),
+        ({'operation': 'getProductsByIds', 'param': 'sku'}, "has no query parameter 'sku'"),
+        ({'operation': 'getProductsByIds', 'window': 5}, None),
+    ]:
+        spec['paths']['/products/{productId}']['get']['x-ngrx-batch'] = batch
+        if message is None:
+            assert 'timer(5)' in render(spec)['effects/products.effects.ts']
+            continue
+        with pytest.raises(ValueError, match=message):
+            render(spec)
@@ -0,0 +1,143 @@
+"""
+Output sink, instrumentation, in-memory API, batch mode and streaming ingestion of the generator
+"""
+
+import copy
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from ngrx_generator import Instrumentation, NgRxGenerator, OutputSink, generate_batch, generate_files  # noqa: E402
+
+SPEC = ROOT / 'swagger.yaml'
+
+
+def test_sink_skips_unchanged_files(tmp_path):
+    output = tmp_path / 'out'
+    first = NgRxGenerator(str(SPEC), str(output), quiet=True)
+    first.generate_all()
+    reducer = output / 'reducers' / 'users.reducer.ts'
+    os.utime(reducer, ns=(0, 0))
+
+    second = NgRxGenerator(str(SPEC), str(output), quiet=True)
+    second.generate_all()
+    assert second.sink.written == []
+    assert sorted(second.sink.unchanged) == sorted(first.sink.written)
+    assert reducer.stat().st_mtime_ns == 0
+    assert not list(output.rglob('*.tmp'))
+
+
+def test_sink_writes_only_differing_content(tmp_path):
+    sink = OutputSink(tmp_path)
+    target = tmp_path / 'a' / 'b' / 'file.ts'
+
+    assert sink.write(target, 'one')
+    assert not sink.write(target, 'one')
+    assert sink.write(target, 'two')
+    assert target.read_text() == 'two'
+    assert (sink.written, sink.unchanged, sink.bytes_written, sink.bytes_total) == (
+        ['a/b/file.ts', 'a/b/file.ts'], ['a/b/file.ts'], 6, 9)
+
+    sink.remove('a/b/file.ts')
+    assert sink.removed == ['a/b/file.ts']
+    assert not (tmp_path / 'a').exists()
+
+
+def test_instrumentation_times_every_phase_and_render(tmp_path):
+    seen = []
+
+    class Recorder(Instrumentation):
+        def on_phase(self, name, wall, cpu):
+            seen.append(name)
+
+    stats = Recorder()
+    generator = NgRxGenerator(str(SPEC), str(tmp_path / 'out'), quiet=True, instrumentation=stats)
+    with stats.profiled('cprofile', str(tmp_path / 'run.prof')):
+        generator.generate_all()
+    generator.write_report(str(tmp_path / 'report.json'))
+
+    assert seen[:4] == ['load', 'extract_operations', 'build_index', 'resolve_schemas']
+    assert {'generate_models', 'generate_reducers', 'generate_index_files'} <= set(seen)
+    assert set(stats.renders['reducers']) == {'users', 'products', 'orders', 'categories', 'auth'}
+    assert 'User' in stats.renders['models']
+    assert (tmp_path / 'run.prof').stat().st_size > 0
+
+    report = json.loads((tmp_path / 'report.json').read_text())
+    assert report['phases'].keys() == stats.phases.keys()
+    assert report['files']['written'] == len(generator.sink.written)
+    assert report['profile']['mode'] == 'cprofile' and report['profile']['top']
+    assert report['total']['wall'] >= report['phases']['generate_models']['wall']
+
+
+def test_in_memory_generation_matches_disk_and_writes_nothing(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    on_disk = tmp_path / 'disk'
+    NgRxGenerator(str(SPEC), str(on_disk), quiet=True).generate_all()
+
+    files = generate_files(SPEC.read_bytes(), str(tmp_path / 'memory'))
+    assert not (tmp_path / 'memory').exists()
+    assert files == {
+        path.relative_to(on_disk).as_posix(): path.read_text()
+        for path in sorted(on_disk.rglob('*')) if path.is_file()
+    }
+    assert generate_files(yaml.safe_load(SPEC.read_text())) == files
+
+
+def test_update_spec_yields_only_changed_and_removed_files():
+    spec = yaml.safe_load(SPEC.read_text())
+    generator = NgRxGenerator(spec, quiet=True, in_memory=True, incremental=True)
+    first = dict(generator.iter_files())
+    assert first == generator.sink.files
+
+    spec = copy.deepcopy(spec)
+    for path_item in spec['paths'].values():
+        for operation in path_item.values():
+            if isinstance(operation, dict) and operation.get('tags') == ['categories']:
+                operation['tags'] = ['catalog']
+    generator.update_spec(spec)
+    changes = dict(generator.iter_files())
+
+    assert changes['reducers/categories.reducer.ts'] is None
+    assert 'export interface CatalogState {' in changes['reducers/catalog.reducer.ts']
+    assert 'reducers/users.reducer.ts' not in changes
+    assert list(generator.iter_files()) == []
+
+    with pytest.raises(ValueError, match='in_memory=True'):
+        NgRxGenerator(str(SPEC), quiet=True).generate_files()
+
+
+def tree(root: Path) -> dict:
+    return {path.relative_to(root).as_posix(): path.read_text() for path in sorted(root.rglob('*')) if path.is_file()}
+
+
+def test_batch_shares_identical_models(tmp_path):
+    spec = yaml.safe_load(SPEC.read_text())
+    admin = copy.deepcopy(spec)
+    admin['components']['schemas']['Product']['properties']['sku'] = {'type': 'string'}
+    (tmp_path / 'shop.yaml').write_text(yaml.safe_dump(spec))
+    (tmp_path / 'admin.yaml').write_text(yaml.safe_dump(admin))
+    services = [('shop', str(tmp_path / 'shop.yaml')), ('admin', str(tmp_path / 'admin.yaml'))]
+
+    report = generate_batch(services, str(tmp_path / 'out'), quiet=True)
+    out = tmp_path / 'out'
+    shared = sorted(path.name for path in (out / 'shared-models').iterdir())
+    # Product differs, and so do the models that reference it
+    assert 'user.model.ts' in shared and 'product.model.ts' not in shared and 'order.model.ts' not in shared
+    assert report['shared_models'] == len(shared) - 1
+    for name in ('shop', 'admin'):
+        barrel = (out / name / 'models' / 'index.ts').read_text()
+        assert "export * from '../../shared-models/user.model';" in barrel
+        assert "export * from './product.model';" in barrel
+        assert not (out / name / 'models' / 'user.model.ts').exists()
+    assert 'sku?: string;' in (out / 'admin' / 'models' / 'product.model.ts').read_text()
+    assert 'sku' not in (out / 'shop' / 'models' / 'product.model.ts').read_text()
+
+    generate_batch(services, str(tmp_path / 'parallel'), jobs=2, quiet=True)
+    assert tree(tmp_path / 'parallel') == tree(out)
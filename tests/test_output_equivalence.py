@@ -0,0 +1,193 @@
+"""
+Targeted regeneration must produce the same tree as a full run
+Covers `diff --apply`, incremental runs, watch-mode reloads, parallel rendering and streaming ingestion against the bundled spec
+"""
+
+import copy
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+import yaml
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from ngrx_generator import NgRxGenerator, diff_specs  # noqa: E402
+
+SPEC = ROOT / 'swagger.yaml'
+
+
+def load_spec() -> Dict[str, Any]:
+    with open(SPEC) as f:
+        return yaml.safe_load(f)
+
+
+def changed_spec() -> Dict[str, Any]:
+    """The bundled spec with a changed, an added and a removed schema, a removed tag and a renamed one"""
+    spec = copy.deepcopy(load_spec())
+    schemas = spec['components']['schemas']
+    schemas['Address']['properties']['region'] = {'type': 'string'}
+    schemas['Widget'] = {'type': 'object', 'properties': {'address': {'$ref': '#/components/schemas/Address'}}}
+    for path, path_item in list(spec['paths'].items()):
+        for method, operation in list(path_item.items()):
+            if not isinstance(operation, dict) or 'tags' not in operation:
+                continue
+            if operation['tags'] == ['categories']:
+                del path_item[method]
+            elif operation['tags'] == ['orders']:
+                operation['tags'] = ['billing']
+        if not path_item:
+            del spec['paths'][path]
+    spec['paths']['/users']['get']['summary'] = 'List every user'
+    return spec
+
+
+def write_spec(spec: Dict[str, Any], path: Path) -> str:
+    path.write_text(yaml.safe_dump(spec, sort_keys=False))
+    return str(path)
+
+
+def tree(root: Path) -> Dict[str, str]:
+    """Relative path -> content of every generated file, leaving out manifests and caches"""
+    return {
+        path.relative_to(root).as_posix(): path.read_text()
+        for path in sorted(root.rglob('*'))
+        if path.is_file() and not any(part.startswith('.ngrx-') for part in path.relative_to(root).parts)
+    }
+
+
+def directories(root: Path) -> set:
+    return {path.relative_to(root).as_posix() for path in root.rglob('*') if path.is_dir()}
+
+
+def generate(spec_path: str, output: Path, **options) -> NgRxGenerator:
+    generator = NgRxGenerator(spec_path, str(output), quiet=True, **options)
+    generator.generate_all()
+    return generator
+
+
+@pytest.fixture
+def specs(tmp_path):
+    return write_spec(load_spec(), tmp_path / 'old.yaml'), write_spec(changed_spec(), tmp_path / 'new.yaml')
+
+
+@pytest.mark.parametrize('options', [
+    {},
+    {'layout': 'feature'},
+    {'entity_adapters': True, 'http_cache': True},
+    {'compact_models': True, 'model_files': 3},
+])
+def test_diff_apply_matches_full_run(tmp_path, specs, options):
+    old, new = specs
+    applied, full = tmp_path / 'applied', tmp_path / 'full'
+    generate(old, applied, **options)
+
+    report = diff_specs(old, new, str(applied), apply=True, **options)
+    generate(new, full, **options)
+
+    assert report['tags']['removed'] == ['categories', 'orders']
+    assert 'Address' in report['schemas']['changed']
+    assert tree(applied) == tree(full)
+    assert directories(applied) == directories(full)
+
+
+@pytest.mark.parametrize('options', [{}, {'layout': 'feature'}, {'entity_adapters': True}])
+def test_incremental_run_matches_full_run(tmp_path, specs, options):
+    old, new = specs
+    incremental, full = tmp_path / 'incremental', tmp_path / 'full'
+    generate(old, incremental, incremental=True, **options)
+    generator = generate(new, incremental, incremental=True, **options)
+    generate(new, full, **options)
+
+    assert generator.sink.written, 'the changed spec should rewrite some files'
+    assert tree(incremental) == tree(full)
+    assert directories(incremental) == directories(full)
+
+
+def path_edits(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """The spec with a changed, an added, a removed and a renamed path item"""
+    spec = copy.deepcopy(spec)
+    paths = spec['paths']
+    paths['/users']['get']['summary'] = 'List every user'
+    paths['/users/{userId}/avatar'] = copy.deepcopy(paths['/users/{userId}/profile'])
+    for operation in paths['/users/{userId}/avatar'].values():
+        operation['operationId'] += 'Avatar'
+    del paths['/categories/{categoryId}']
+    spec['paths'] = {('/shop/orders' if path == '/orders' else path): item for path, item in paths.items()}
+    return spec
+
+
+@pytest.mark.parametrize('options', [{}, {'entity_adapters': True}])
+def test_watch_reload_matches_full_run(tmp_path, options):
+    spec_path = tmp_path / 'api.yaml'
+    watched, full = tmp_path / 'watched', tmp_path / 'full'
+    generator = NgRxGenerator(write_spec(load_spec(), spec_path), str(watched), quiet=True, incremental=True, **options)
+    generator.keep_warm()
+    generator.generate_all()
+
+    # Edits confined to paths only re-parse the edited path items; others re-parse the file
+    for step, (spec, patched) in enumerate([(path_edits(load_spec()), True), (changed_spec(), False)]):
+        write_spec(spec, spec_path)
+        generator.reload({str(spec_path)})
+        assert (generator.load_source == 'patch') == patched
+        generator.generate_all()
+
+        generate(str(spec_path), full / str(step), **options)
+        assert generator.swagger_data == spec
+        assert tree(watched) == tree(full / str(step))
+
+
+@pytest.mark.parametrize('options', [
+    {},
+    {'layout': 'feature', 'entity_adapters': True},
+    {'http_cache': True, 'selector_factories': True},
+    {'compact_models': True, 'model_files': 3},
+])
+def test_parallel_rendering_matches_serial(tmp_path, options):
+    serial, parallel = tmp_path / 'serial', tmp_path / 'parallel'
+    generate(str(SPEC), serial, **options)
+    generate(str(SPEC), parallel, jobs=2, **options)
+
+    assert tree(parallel) == tree(serial)
+
+
+def test_parallel_incremental_run_only_rewrites_changed_tags(tmp_path, specs):
+    old, new = specs
+    output = tmp_path / 'out'
+    generate(old, output, incremental=True, jobs=2)
+    generator = generate(old, output, incremental=True, jobs=2)
+    assert not generator.sink.written
+
+    generate(new, output, incremental=True, jobs=2)
+    generate(new, tmp_path / 'full')
+    assert tree(output) == tree(tmp_path / 'full')
+
+
+@pytest.mark.parametrize('options', [{}, {'entity_adapters': True, 'layout': 'feature'}, {'compact_models': True}])
+def test_streaming_matches_regular_load(tmp_path, options):
+    regular, streamed = tmp_path / 'regular', tmp_path / 'streamed'
+    generate(str(SPEC), regular, **options)
+    generate(str(SPEC), streamed, streaming=True, **options)
+
+    assert tree(streamed) == tree(regular)
+
+
+def test_streaming_reads_json_and_anchored_yaml(tmp_path):
+    spec = load_spec()
+    json_path = tmp_path / 'api.json'
+    json_path.write_text(json.dumps(spec))
+    # Aliases shared across sections, as PyYAML dumps repeated nodes
+    shared = {'type': 'string', 'format': 'uuid'}
+    spec['components']['schemas']['User']['properties']['id'] = shared
+    spec['components']['schemas']['Product']['properties']['id'] = shared
+    anchored = tmp_path / 'anchored.yaml'
+    anchored.write_text(yaml.safe_dump(spec, sort_keys=False))
+    assert '&id001' in anchored.read_text()
+
+    for path in (json_path, anchored):
+        generate(str(path), tmp_path / f"{path.stem}-regular")
+        generate(str(path), tmp_path / f"{path.stem}-streamed", streaming=True)
+        assert tree(tmp_path / f"{path.stem}-streamed") == tree(tmp_path / f"{path.stem}-regular")